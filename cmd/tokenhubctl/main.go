@@ -1,6 +1,7 @@
 package main
 
 import (
+	"bufio"
 	"encoding/json"
 	"fmt"
 	"io"
@@ -9,6 +10,7 @@ import (
 	"os/exec"
 	"strconv"
 	"strings"
+	"sync"
 	"text/tabwriter"
 	"time"
 )
@@ -201,6 +203,15 @@ func adminToken() string {
 	return os.Getenv("TOKENHUB_ADMIN_TOKEN")
 }
 
+// adminAuthHeader is the Authorization value for adminToken, built once per
+// process since the token cannot change while tokenhubctl runs.
+var adminAuthHeader = sync.OnceValue(func() string {
+	if tok := adminToken(); tok != "" {
+		return "Bearer " + tok
+	}
+	return ""
+})
+
 func doRequest(method, path string, body io.Reader) (*http.Response, error) {
 	url := baseURL() + path
 	req, err := http.NewRequest(method, url, body)
@@ -210,8 +221,8 @@ func doRequest(method, path string, body io.Reader) (*http.Response, error) {
 	if body != nil {
 		req.Header.Set("Content-Type", "application/json")
 	}
-	if tok := adminToken(); tok != "" {
-		req.Header.Set("Authorization", "Bearer "+tok)
+	if auth := adminAuthHeader(); auth != "" {
+		req.Header["Authorization"] = []string{auth}
 	}
 	return http.DefaultClient.Do(req)
 }
@@ -283,6 +294,26 @@ func fatal(err error) {
 	}
 }
 
+// table is a tabwriter over a buffered stdout, so a rendered table reaches
+// the terminal in one write instead of one write per cell.
+type table struct {
+	*tabwriter.Writer
+	out *bufio.Writer
+}
+
+func newTable() *table {
+	out := bufio.NewWriter(os.Stdout)
+	return &table{Writer: tabwriter.NewWriter(out, 0, 4, 2, ' ', 0), out: out}
+}
+
+// Flush aligns the buffered rows and writes them to stdout.
+func (t *table) Flush() error {
+	if err := t.Writer.Flush(); err != nil {
+		return err
+	}
+	return t.out.Flush()
+}
+
 func requireArgs(args []string, min int, usage string) {
 	if len(args) < min {
 		fmt.Fprintf(os.Stderr, "usage: tokenhubctl %s\n", usage)
@@ -387,12 +418,14 @@ func doStatus() {
 		models = int(n)
 	}
 
-	fmt.Printf("Server:           %s\n", baseURL())
-	fmt.Printf("Status:           %s\n", status)
-	fmt.Printf("Adapters:         %d\n", adapters)
-	fmt.Printf("Models:           %d\n", models)
-	fmt.Printf("Vault:            %s\n", vaultState)
-	fmt.Printf("Vault initialized: %s\n", vaultInit)
+	w := bufio.NewWriter(os.Stdout)
+	_, _ = fmt.Fprintf(w, "Server:           %s\n", baseURL())
+	_, _ = fmt.Fprintf(w, "Status:           %s\n", status)
+	_, _ = fmt.Fprintf(w, "Adapters:         %d\n", adapters)
+	_, _ = fmt.Fprintf(w, "Models:           %d\n", models)
+	_, _ = fmt.Fprintf(w, "Vault:            %s\n", vaultState)
+	_, _ = fmt.Fprintf(w, "Vault initialized: %s\n", vaultInit)
+	_ = w.Flush()
 }
 
 func doHealth() {
@@ -402,7 +435,7 @@ func doHealth() {
 		fmt.Println("No provider health data available.")
 		return
 	}
-	tw := tabwriter.NewWriter(os.Stdout, 0, 4, 2, ' ', 0)
+	tw := newTable()
 	_, _ = fmt.Fprintln(tw, "PROVIDER\tSTATE\tCONSEC_ERR\tAVG LATENCY\tLAST SUCCESS\tLAST ERROR")
 	for _, p := range providers {
 		m, ok := p.(map[string]any)
@@ -533,7 +566,7 @@ func doProviders(args []string) {
 			}
 		}
 
-		tw := tabwriter.NewWriter(os.Stdout, 0, 4, 2, ' ', 0)
+		tw := newTable()
 		_, _ = fmt.Fprintln(tw, "ID\tTYPE\tBASE URL\tCREDS\tENABLED\tMODELS\tSOURCE")
 		for id := range allIDs {
 			sp := storeMap[id]
@@ -611,7 +644,7 @@ func doModels(args []string) {
 			fmt.Println("No models registered.")
 			return
 		}
-		tw := tabwriter.NewWriter(os.Stdout, 0, 4, 2, ' ', 0)
+		tw := newTable()
 		_, _ = fmt.Fprintln(tw, "MODEL\tPROVIDER\tWEIGHT\tCONTEXT\tIN $/1K\tOUT $/1K\tENABLED")
 		for _, m := range models {
 			mm, _ := m.(map[string]any)
@@ -700,7 +733,7 @@ func doAPIKeys(args []string) {
 			fmt.Println("No API keys.")
 			return
 		}
-		tw := tabwriter.NewWriter(os.Stdout, 0, 4, 2, ' ', 0)
+		tw := newTable()
 		_, _ = fmt.Fprintln(tw, "ID\tNAME\tPREFIX\tSCOPES\tENABLED\tCREATED\tLAST USED")
 		for _, k := range keys {
 			m, _ := k.(map[string]any)
@@ -767,7 +800,7 @@ func doLogs(args []string) {
 		fmt.Println("No request logs.")
 		return
 	}
-	tw := tabwriter.NewWriter(os.Stdout, 0, 4, 2, ' ', 0)
+	tw := newTable()
 	_, _ = fmt.Fprintln(tw, "TIME\tMODEL\tPROVIDER\tMODE\tLATENCY\tCOST\tSTATUS")
 	for _, l := range logs {
 		m, _ := l.(map[string]any)
@@ -791,7 +824,7 @@ func doAudit(args []string) {
 		fmt.Println("No audit logs.")
 		return
 	}
-	tw := tabwriter.NewWriter(os.Stdout, 0, 4, 2, ' ', 0)
+	tw := newTable()
 	_, _ = fmt.Fprintln(tw, "TIME\tACTION\tRESOURCE\tREQUEST ID")
 	for _, l := range logs {
 		m, _ := l.(map[string]any)
@@ -826,15 +859,15 @@ func doEngine(args []string) {
 		models, _ := data["models"].([]any)
 		adapterInfo, _ := data["adapter_info"].([]any)
 
-		fmt.Printf("Adapters: %d\n", len(adapterInfo))
+		tw := newTable()
+		_, _ = fmt.Fprintf(tw.out, "Adapters: %d\n", len(adapterInfo))
 		for _, a := range adapterInfo {
 			m, _ := a.(map[string]any)
 			id, _ := m["id"].(string)
 			ep, _ := m["health_endpoint"].(string)
-			fmt.Printf("  %s → %s\n", id, ep)
+			_, _ = fmt.Fprintf(tw.out, "  %s → %s\n", id, ep)
 		}
-		fmt.Printf("\nModels: %d\n", len(models))
-		tw := tabwriter.NewWriter(os.Stdout, 0, 4, 2, ' ', 0)
+		_, _ = fmt.Fprintf(tw.out, "\nModels: %d\n", len(models))
 		_, _ = fmt.Fprintln(tw, "  MODEL\tPROVIDER\tWEIGHT\tCONTEXT\tENABLED")
 		for _, m := range models {
 			mm, _ := m.(map[string]any)
@@ -906,7 +939,7 @@ func doDiscover(args []string) {
 		fmt.Println("No models discovered.")
 		return
 	}
-	tw := tabwriter.NewWriter(os.Stdout, 0, 4, 2, ' ', 0)
+	tw := newTable()
 	_, _ = fmt.Fprintln(tw, "MODEL ID\tREGISTERED")
 	for _, m := range models {
 		mm, _ := m.(map[string]any)
@@ -1000,20 +1033,22 @@ func doProviderStatus(args []string) {
 			continue
 		}
 		if m["provider_id"] == id {
-			fmt.Printf("Provider:         %s\n", id)
-			fmt.Printf("State:            %s\n", m["state"])
-			fmt.Printf("Total requests:   %s\n", fmtNum(m["total_requests"]))
-			fmt.Printf("Total errors:     %s\n", fmtNum(m["total_errors"]))
-			fmt.Printf("Consec errors:    %s\n", fmtNum(m["consec_errors"]))
-			fmt.Printf("Avg latency:      %s\n", fmtDuration(m["avg_latency_ms"]))
-			fmt.Printf("Last success:     %s\n", fmtTime(m["last_success_at"]))
+			w := bufio.NewWriter(os.Stdout)
+			_, _ = fmt.Fprintf(w, "Provider:         %s\n", id)
+			_, _ = fmt.Fprintf(w, "State:            %s\n", m["state"])
+			_, _ = fmt.Fprintf(w, "Total requests:   %s\n", fmtNum(m["total_requests"]))
+			_, _ = fmt.Fprintf(w, "Total errors:     %s\n", fmtNum(m["total_errors"]))
+			_, _ = fmt.Fprintf(w, "Consec errors:    %s\n", fmtNum(m["consec_errors"]))
+			_, _ = fmt.Fprintf(w, "Avg latency:      %s\n", fmtDuration(m["avg_latency_ms"]))
+			_, _ = fmt.Fprintf(w, "Last success:     %s\n", fmtTime(m["last_success_at"]))
 			if le, _ := m["last_error"].(string); le != "" {
-				fmt.Printf("Last error:       %s\n", le)
-				fmt.Printf("Last error at:    %s\n", fmtTime(m["last_error_time"]))
+				_, _ = fmt.Fprintf(w, "Last error:       %s\n", le)
+				_, _ = fmt.Fprintf(w, "Last error at:    %s\n", fmtTime(m["last_error_time"]))
 			}
 			if cu, _ := m["cooldown_until"].(string); cu != "" && cu != "0001-01-01T00:00:00Z" {
-				fmt.Printf("Cooldown until:   %s\n", fmtTime(m["cooldown_until"]))
+				_, _ = fmt.Fprintf(w, "Cooldown until:   %s\n", fmtTime(m["cooldown_until"]))
 			}
+			_ = w.Flush()
 			return
 		}
 	}
@@ -45,8 +45,8 @@ func AuthMiddleware(mgr *Manager, budgetChecker *BudgetChecker, keyLimiter KeyRa
 			// Accept token from Authorization: Bearer <tok> or x-api-key: <tok>
 			// (Anthropic SDK sends x-api-key; OpenAI SDK sends Authorization: Bearer).
 			var token string
-			if auth := r.Header.Get("Authorization"); strings.HasPrefix(auth, "Bearer ") {
-				token = strings.TrimPrefix(auth, "Bearer ")
+			if bearer, ok := strings.CutPrefix(r.Header.Get("Authorization"), "Bearer "); ok {
+				token = bearer
 			} else if xkey := r.Header.Get("x-api-key"); xkey != "" {
 				token = xkey
 			} else {
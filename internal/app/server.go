@@ -25,6 +25,7 @@ import (
 	"github.com/jordanhubbard/tokenhub/internal/idempotency"
 	"github.com/jordanhubbard/tokenhub/internal/logging"
 	"github.com/jordanhubbard/tokenhub/internal/metrics"
+	"github.com/jordanhubbard/tokenhub/internal/providers"
 	"github.com/jordanhubbard/tokenhub/internal/providers/anthropic"
 	"github.com/jordanhubbard/tokenhub/internal/providers/openai"
 	"github.com/jordanhubbard/tokenhub/internal/providers/vllm"
@@ -64,8 +65,8 @@ type Server struct {
 	apiKeyMgr    *apikey.Manager
 	eventBus     *events.Bus
 
-	storeWriteQueue chan func()      // buffered channel for async store writes
-	storeWriteDone  chan struct{}    // closed by the write worker when it exits
+	storeWriteQueue chan httpapi.StoreWrite // buffered channel for async store writes
+	storeWriteDone  chan struct{}           // closed by the write worker when it exits
 
 	httpServer *http.Server // set via SetHTTPServer; used by Close() to drain in-flight requests
 }
@@ -323,14 +324,9 @@ func NewServer(cfg Config) (*Server, error) {
 
 	// Async store write queue: decouples SQLite writes from handler goroutines.
 	// The channel is closed in Close() after HTTP drain to flush remaining writes.
-	storeWriteQueue := make(chan func(), 4096)
+	// The worker is started once deps exists (see below).
+	storeWriteQueue := make(chan httpapi.StoreWrite, 4096)
 	storeWriteDone := make(chan struct{})
-	go func() {
-		defer close(storeWriteDone)
-		for fn := range storeWriteQueue {
-			fn()
-		}
-	}()
 
 	s := &Server{
 		cfg:              cfg,
@@ -426,6 +422,10 @@ func NewServer(cfg Config) (*Server, error) {
 		Prober:           prober,
 		StoreWriteQueue:  storeWriteQueue,
 	}
+	go func() {
+		defer close(storeWriteDone)
+		httpapi.DrainStoreWrites(deps, storeWriteQueue)
+	}()
 
 	// Initialize Temporal workflow engine if enabled.
 	if cfg.TemporalEnabled {
@@ -697,7 +697,7 @@ func (s *Server) refreshPricing() {
 	}
 
 	models, _ := s.store.ListModels(ctx)
-	updated := 0
+	var changed []store.ModelRecord
 	for _, m := range models {
 		if localProviders[m.ProviderID] {
 			continue // skip self-hosted models
@@ -716,23 +716,29 @@ func (s *Server) refreshPricing() {
 		if entry.MaxInputTokens > 0 && m.MaxContextTokens == 0 {
 			m.MaxContextTokens = entry.MaxInputTokens
 		}
-		if err := s.store.UpsertModel(ctx, m); err == nil {
-			s.engine.RegisterModel(router.Model{
-				ID:               m.ID,
-				ProviderID:       m.ProviderID,
-				Weight:           m.Weight,
-				MaxContextTokens: m.MaxContextTokens,
-				InputPer1K:       m.InputPer1K,
-				OutputPer1K:      m.OutputPer1K,
-				Enabled:          m.Enabled,
-				PricingSource:    m.PricingSource,
-				ToolNameMap:      m.ToolNameMap,
-				Gemma4Output:     m.Gemma4Output,
-			})
-			updated++
-		}
+		changed = append(changed, m)
+	}
+	if err := s.store.UpsertModels(ctx, changed); err != nil {
+		s.logger.Warn("pricing refresh: failed to persist models", slog.String("error", err.Error()))
+		return
+	}
+	registered := make([]router.Model, 0, len(changed))
+	for _, m := range changed {
+		registered = append(registered, router.Model{
+			ID:               m.ID,
+			ProviderID:       m.ProviderID,
+			Weight:           m.Weight,
+			MaxContextTokens: m.MaxContextTokens,
+			InputPer1K:       m.InputPer1K,
+			OutputPer1K:      m.OutputPer1K,
+			Enabled:          m.Enabled,
+			PricingSource:    m.PricingSource,
+			ToolNameMap:      m.ToolNameMap,
+			Gemma4Output:     m.Gemma4Output,
+		})
 	}
-	s.logger.Info("pricing refresh complete", slog.Int("updated", updated))
+	s.engine.RegisterModels(registered...)
+	s.logger.Info("pricing refresh complete", slog.Int("updated", len(changed)))
 }
 
 // seedStatsFromDB loads recent request logs from the database to pre-populate
@@ -862,6 +868,20 @@ func loadCredentialsFile(path string, eng *router.Engine, v *vault.Vault, db sto
 
 	ctx := context.Background()
 
+	// Store all provided API keys in the vault in one batch if it is unlocked.
+	vaultKeys := make(map[string]string)
+	if v != nil && !v.IsLocked() {
+		for _, p := range creds.Providers {
+			if p.ID != "" && p.BaseURL != "" && p.APIKey != "" {
+				vaultKeys["provider:"+p.ID+":api_key"] = p.APIKey
+			}
+		}
+		if err := v.SetMany(vaultKeys); err != nil {
+			logger.Warn("failed to store API keys in vault", slog.Int("providers", len(vaultKeys)), slog.String("error", err.Error()))
+			vaultKeys = nil
+		}
+	}
+
 	for _, p := range creds.Providers {
 		if p.ID == "" || p.BaseURL == "" {
 			logger.Warn("skipping credentials provider: id and base_url required", slog.String("id", p.ID))
@@ -870,14 +890,9 @@ func loadCredentialsFile(path string, eng *router.Engine, v *vault.Vault, db sto
 
 		enabled := p.Enabled == nil || *p.Enabled
 
-		// Store API key in vault if provided and vault is unlocked.
 		credStore := "none"
-		if p.APIKey != "" && v != nil && !v.IsLocked() {
-			if err := v.Set("provider:"+p.ID+":api_key", p.APIKey); err != nil {
-				logger.Warn("failed to store API key in vault", slog.String("provider", p.ID), slog.String("error", err.Error()))
-			} else {
-				credStore = "vault"
-			}
+		if _, ok := vaultKeys["provider:"+p.ID+":api_key"]; ok {
+			credStore = "vault"
 		}
 
 		// Persist to database.
@@ -923,12 +938,32 @@ func loadCredentialsFile(path string, eng *router.Engine, v *vault.Vault, db sto
 		}
 	}
 
-	// Autoload models for providers that have autoload_models=true.
+	// Autoload models for providers that have autoload_models=true. The
+	// /v1/models requests are independent, so they run concurrently and
+	// startup waits for the slowest provider rather than the sum of all of
+	// them. Results are applied in file order so a model ID listed by two
+	// providers resolves the same way on every start.
+	var autoload []credProvider
 	for _, p := range creds.Providers {
-		if !p.AutoloadModels {
-			continue
+		if p.AutoloadModels {
+			autoload = append(autoload, p)
+		}
+	}
+	fetched := make([][]string, len(autoload))
+	fetchedOK := make([]bool, len(autoload))
+	var wg sync.WaitGroup
+	for i, p := range autoload {
+		wg.Add(1)
+		go func(i int, p credProvider) {
+			defer wg.Done()
+			fetched[i], fetchedOK[i] = fetchProviderModelIDs(ctx, p.ID, p.APIKey, p.BaseURL, logger)
+		}(i, p)
+	}
+	wg.Wait()
+	for i, p := range autoload {
+		if fetchedOK[i] {
+			applyAutoloadedModels(ctx, p.ID, fetched[i], explicitModels, eng, db, logger)
 		}
-		autoloadModelsForProvider(ctx, p.ID, p.APIKey, p.BaseURL, explicitModels, eng, db, logger)
 	}
 
 	for _, m := range creds.Models {
@@ -976,6 +1011,18 @@ func loadCredentialsFile(path string, eng *router.Engine, v *vault.Vault, db sto
 // this way are registered with sensible defaults (weight=5, enabled=true) and
 // can be overridden by explicit entries in the credentials file.
 func autoloadModelsForProvider(ctx context.Context, providerID, apiKey, baseURL string, explicitModels map[string]bool, eng *router.Engine, db store.Store, logger *slog.Logger) {
+	ids, ok := fetchProviderModelIDs(ctx, providerID, apiKey, baseURL, logger)
+	if !ok {
+		return
+	}
+	applyAutoloadedModels(ctx, providerID, ids, explicitModels, eng, db, logger)
+}
+
+// fetchProviderModelIDs returns the non-empty model IDs listed by a
+// provider's /v1/models endpoint. It only performs the request, so callers
+// may run it for several providers at once. Failures are logged and reported
+// as ok=false.
+func fetchProviderModelIDs(ctx context.Context, providerID, apiKey, baseURL string, logger *slog.Logger) ([]string, bool) {
 	modelsURL := normalizeBaseURL(baseURL) + "/v1/models"
 	reqCtx, cancel := context.WithTimeout(ctx, 15*time.Second)
 	defer cancel()
@@ -983,28 +1030,30 @@ func autoloadModelsForProvider(ctx context.Context, providerID, apiKey, baseURL
 	req, err := http.NewRequestWithContext(reqCtx, http.MethodGet, modelsURL, nil)
 	if err != nil {
 		logger.Warn("autoload_models: failed to build request", slog.String("provider", providerID), slog.String("error", err.Error()))
-		return
+		return nil, false
 	}
 	if apiKey != "" {
 		req.Header.Set("Authorization", "Bearer "+apiKey)
 	}
 
-	client := &http.Client{}
+	// Share the adapters' transport so the connection opened here is the
+	// one the provider's first completion reuses.
+	client := &http.Client{Transport: providers.Transport}
 	resp, err := client.Do(req)
 	if err != nil {
 		logger.Warn("autoload_models: failed to reach provider", slog.String("provider", providerID), slog.String("error", err.Error()))
-		return
+		return nil, false
 	}
 	defer func() { _ = resp.Body.Close() }()
 
 	body, err := io.ReadAll(io.LimitReader(resp.Body, 1<<20))
 	if err != nil {
 		logger.Warn("autoload_models: failed to read response", slog.String("provider", providerID), slog.String("error", err.Error()))
-		return
+		return nil, false
 	}
 	if resp.StatusCode != http.StatusOK {
 		logger.Warn("autoload_models: provider returned error", slog.String("provider", providerID), slog.Int("status", resp.StatusCode))
-		return
+		return nil, false
 	}
 
 	type modelEntry struct {
@@ -1020,18 +1069,28 @@ func autoloadModelsForProvider(ctx context.Context, providerID, apiKey, baseURL
 		var arr []modelEntry
 		if err2 := json.Unmarshal(body, &arr); err2 != nil {
 			logger.Warn("autoload_models: failed to parse response", slog.String("provider", providerID), slog.String("error", err.Error()))
-			return
+			return nil, false
 		}
 		parsed.Data = arr
 	}
 
-	// Build set of model IDs currently served by this provider.
-	currentModels := make(map[string]bool, len(parsed.Data))
+	ids := make([]string, 0, len(parsed.Data))
 	for _, m := range parsed.Data {
 		if m.ID != "" {
-			currentModels[m.ID] = true
+			ids = append(ids, m.ID)
 		}
 	}
+	return ids, true
+}
+
+// applyAutoloadedModels registers the model IDs fetched from a provider and
+// purges models it no longer serves, leaving explicitModels untouched.
+func applyAutoloadedModels(ctx context.Context, providerID string, ids []string, explicitModels map[string]bool, eng *router.Engine, db store.Store, logger *slog.Logger) {
+	// Build set of model IDs currently served by this provider.
+	currentModels := make(map[string]bool, len(ids))
+	for _, id := range ids {
+		currentModels[id] = true
+	}
 
 	// Purge stale models: any model registered under this provider that is no
 	// longer present in the provider's /v1/models response gets unregistered.
@@ -1054,26 +1113,29 @@ func autoloadModelsForProvider(ctx context.Context, providerID, apiKey, baseURL
 	}
 
 	count := 0
-	for _, m := range parsed.Data {
-		if m.ID == "" || explicitModels[m.ID] {
+	discovered := make([]router.Model, 0, len(ids))
+	records := make([]store.ModelRecord, 0, len(ids))
+	for _, id := range ids {
+		if explicitModels[id] {
 			continue
 		}
-		model := router.Model{
-			ID:         m.ID,
+		discovered = append(discovered, router.Model{
+			ID:         id,
 			ProviderID: providerID,
 			Weight:     5,
 			Enabled:    true,
-		}
-		eng.RegisterModel(model)
-		if db != nil {
-			if err := db.UpsertModel(ctx, store.ModelRecord{
-				ID: m.ID, ProviderID: providerID, Weight: 5, Enabled: true,
-			}); err != nil {
-				logger.Warn("autoload_models: failed to persist model", slog.String("provider", providerID), slog.String("model", m.ID), slog.String("error", err.Error()))
-			}
-		}
+		})
+		records = append(records, store.ModelRecord{
+			ID: id, ProviderID: providerID, Weight: 5, Enabled: true,
+		})
 		count++
 	}
+	if db != nil {
+		if err := db.UpsertModels(ctx, records); err != nil {
+			logger.Warn("autoload_models: failed to persist models", slog.String("provider", providerID), slog.Int("count", len(records)), slog.String("error", err.Error()))
+		}
+	}
+	eng.RegisterModels(discovered...)
 	logger.Info("autoload_models: registered models", slog.String("provider", providerID), slog.Int("count", count), slog.Int("purged", purged))
 }
 
@@ -1200,8 +1262,9 @@ func loadPersistedModels(eng *router.Engine, db store.Store, logger *slog.Logger
 		logger.Warn("failed to load persisted models", slog.String("error", err.Error()))
 		return
 	}
+	batch := make([]router.Model, 0, len(models))
 	for _, m := range models {
-		eng.RegisterModel(router.Model{
+		batch = append(batch, router.Model{
 			ID:               m.ID,
 			ProviderID:       m.ProviderID,
 			Weight:           m.Weight,
@@ -1214,6 +1277,7 @@ func loadPersistedModels(eng *router.Engine, db store.Store, logger *slog.Logger
 			Gemma4Output:     m.Gemma4Output,
 		})
 	}
+	eng.RegisterModels(batch...)
 	if len(models) > 0 {
 		logger.Info("loaded persisted models", slog.Int("count", len(models)))
 	}
@@ -8,7 +8,11 @@ import (
 	"net/http"
 	"net/http/httptest"
 	"os"
+	"path/filepath"
+	"sync"
+	"sync/atomic"
 	"testing"
+	"time"
 
 	"github.com/jordanhubbard/tokenhub/internal/router"
 )
@@ -400,3 +404,54 @@ func TestLoadCredentialsFile_AutoloadModels(t *testing.T) {
 		t.Fatalf("expected 2 autoloaded models, got %d", len(models))
 	}
 }
+
+func TestLoadCredentialsFile_AutoloadFetchesConcurrently(t *testing.T) {
+	// Each mock provider holds its response until both have been asked, so
+	// the load only completes promptly if the fetches overlap.
+	var arrived sync.WaitGroup
+	arrived.Add(2)
+	bothArrived := make(chan struct{})
+	go func() { arrived.Wait(); close(bothArrived) }()
+
+	var overlapped atomic.Int32
+	newProvider := func() *httptest.Server {
+		var once sync.Once
+		return httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+			once.Do(arrived.Done)
+			select {
+			case <-bothArrived:
+				overlapped.Add(1)
+			case <-time.After(5 * time.Second):
+			}
+			_, _ = w.Write([]byte(`{"data":[{"id":"shared"}]}`))
+		}))
+	}
+	p1, p2 := newProvider(), newProvider()
+	defer p1.Close()
+	defer p2.Close()
+
+	creds := map[string]any{
+		"providers": []map[string]any{
+			{"id": "p1", "type": "openai", "base_url": p1.URL, "autoload_models": true},
+			{"id": "p2", "type": "openai", "base_url": p2.URL, "autoload_models": true},
+		},
+	}
+	data, _ := json.Marshal(creds)
+	path := filepath.Join(t.TempDir(), "creds.json")
+	if err := os.WriteFile(path, data, 0600); err != nil {
+		t.Fatal(err)
+	}
+
+	eng := newTestEngine()
+	loadCredentialsFile(path, eng, nil, nil, 30*time.Second, discardLogger())
+
+	if got := overlapped.Load(); got != 2 {
+		t.Errorf("expected both /v1/models requests in flight together, %d of 2 were", got)
+	}
+	// Results are applied in file order, so the later provider owns a model
+	// ID both of them list, exactly as with sequential loading.
+	models := eng.ListModels()
+	if len(models) != 1 || models[0].ProviderID != "p2" {
+		t.Errorf("expected shared model owned by p2, got %+v", models)
+	}
+}
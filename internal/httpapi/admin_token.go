@@ -13,6 +13,7 @@ import (
 	"sync"
 
 	"github.com/jordanhubbard/tokenhub/internal/apikey"
+	"github.com/jordanhubbard/tokenhub/internal/store"
 )
 
 // AdminTokenHolder provides thread-safe access to the admin token with
@@ -21,6 +22,7 @@ import (
 type AdminTokenHolder struct {
 	mu          sync.RWMutex
 	token       string
+	tokenBuf    []byte // token as bytes, so ConstantTimeEqual converts only the input
 	hostAPIKey  string // plaintext of the auto-provisioned host-local API key
 	dbDSN       string // used to derive the data directory for persistence
 }
@@ -55,6 +57,8 @@ func NewAdminTokenHolder(configToken, dbDSN string, logger *slog.Logger) (*Admin
 		logger.Warn("TOKENHUB_ADMIN_TOKEN not set — auto-generated token (retrieve with: tokenhubctl admin-token)")
 	}
 
+	h.tokenBuf = []byte(h.token)
+
 	h.persist(logger)
 	return h, nil
 }
@@ -70,9 +74,9 @@ func (h *AdminTokenHolder) Get() string {
 // admin token using constant-time comparison.
 func (h *AdminTokenHolder) ConstantTimeEqual(provided string) bool {
 	h.mu.RLock()
-	current := h.token
+	current := h.tokenBuf
 	h.mu.RUnlock()
-	return subtle.ConstantTimeCompare([]byte(provided), []byte(current)) == 1
+	return subtle.ConstantTimeCompare([]byte(provided), current) == 1
 }
 
 // Rotate generates a new random token, persists it, and returns the new token.
@@ -85,6 +89,7 @@ func (h *AdminTokenHolder) Rotate(logger *slog.Logger) (string, error) {
 
 	h.mu.Lock()
 	h.token = newToken
+	h.tokenBuf = []byte(newToken)
 	h.mu.Unlock()
 
 	h.persist(logger)
@@ -97,6 +102,7 @@ func (h *AdminTokenHolder) Replace(newToken string, logger *slog.Logger) string
 	h.mu.Lock()
 	old := h.token
 	h.token = newToken
+	h.tokenBuf = []byte(newToken)
 	h.mu.Unlock()
 
 	h.persist(logger)
@@ -105,11 +111,14 @@ func (h *AdminTokenHolder) Replace(newToken string, logger *slog.Logger) string
 
 // dataDir returns the directory derived from the DB DSN, or "" if not applicable.
 func (h *AdminTokenHolder) dataDir() string {
+	if store.IsInMemoryDSN(h.dbDSN) {
+		return ""
+	}
 	dsn := strings.TrimPrefix(h.dbDSN, "file:")
 	if i := strings.IndexByte(dsn, '?'); i >= 0 {
 		dsn = dsn[:i]
 	}
-	if dsn == "" || dsn == ":memory:" {
+	if dsn == "" {
 		return ""
 	}
 	return filepath.Dir(dsn)
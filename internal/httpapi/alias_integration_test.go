@@ -39,7 +39,7 @@ func (s *perAdapterSender) ClassifyError(err error) *router.ClassifiedError {
 // setupAliasTestServer wires MountRoutes with a real engine+resolver and two
 // registered models ("variant-a", "variant-b"), so tests can observe blind A/B
 // rewriting end-to-end through the OpenAI-compatible endpoint.
-func setupAliasTestServer(t *testing.T) (*httptest.Server, *router.Engine, store.Store, string) {
+func setupAliasTestServer(t *testing.T) (http.Handler, *router.Engine, store.Store, string) {
 	t.Helper()
 
 	r := chi.NewRouter()
@@ -87,25 +87,28 @@ func setupAliasTestServer(t *testing.T) (*httptest.Server, *router.Engine, store
 		TSDB:      ts,
 		APIKeyMgr: keyMgr,
 	})
-	srv := httptest.NewServer(r)
-	t.Cleanup(srv.Close)
-	return srv, eng, db, plaintext
+	return r, eng, db, plaintext
 }
 
-func postCompletion(t *testing.T, url, apiKey, model string) *http.Response {
+// completionMessagesJSON is the fixed tail of every postCompletion body;
+// only the model varies, so the messages are encoded once.
+const completionMessagesJSON = `,"messages":[{"role":"user","content":"hi"}]}`
+
+// postCompletion dispatches a chat completion to h in-process; the alias
+// tests issue many requests and gain nothing from a loopback socket.
+func postCompletion(t *testing.T, h http.Handler, apiKey, model string) *http.Response {
 	t.Helper()
-	body, _ := json.Marshal(map[string]any{
-		"model":    model,
-		"messages": []map[string]string{{"role": "user", "content": "hi"}},
-	})
-	req, _ := http.NewRequest("POST", url+"/v1/chat/completions", bytes.NewReader(body))
+	modelJSON, _ := json.Marshal(model)
+	body := make([]byte, 0, len(`{"model":`)+len(modelJSON)+len(completionMessagesJSON))
+	body = append(body, `{"model":`...)
+	body = append(body, modelJSON...)
+	body = append(body, completionMessagesJSON...)
+	req := httptest.NewRequest("POST", "/v1/chat/completions", bytes.NewReader(body))
 	req.Header.Set("Content-Type", "application/json")
 	req.Header.Set("Authorization", "Bearer "+apiKey)
-	resp, err := http.DefaultClient.Do(req)
-	if err != nil {
-		t.Fatalf("request: %v", err)
-	}
-	return resp
+	rec := httptest.NewRecorder()
+	h.ServeHTTP(rec, req)
+	return rec.Result()
 }
 
 // TestAliasIntegration_BlindABSplit verifies the end-to-end blind A/B flow:
@@ -114,7 +117,7 @@ func postCompletion(t *testing.T, url, apiKey, model string) *http.Response {
 // string telling them which one served, and an X-Alias-From response header
 // reports the original alias so operators can correlate.
 func TestAliasIntegration_BlindABSplit(t *testing.T) {
-	srv, eng, _, apiKey := setupAliasTestServer(t)
+	h, eng, _, apiKey := setupAliasTestServer(t)
 
 	// Install the 50/50 alias.
 	if err := eng.AliasResolver().Set(router.Alias{
@@ -134,7 +137,7 @@ func TestAliasIntegration_BlindABSplit(t *testing.T) {
 	// 2 * (1/2)^40 ≈ 2e-12.
 	const iterations = 40
 	for i := 0; i < iterations; i++ {
-		resp := postCompletion(t, srv.URL, apiKey, "experiment")
+		resp := postCompletion(t, h, apiKey, "experiment")
 		if resp.StatusCode != http.StatusOK {
 			body, _ := io.ReadAll(resp.Body)
 			_ = resp.Body.Close()
@@ -169,10 +172,10 @@ func TestAliasIntegration_BlindABSplit(t *testing.T) {
 // is registered for a requested model name, routing falls through to the
 // normal model-hint path unchanged. A missing alias must never block traffic.
 func TestAliasIntegration_UnknownAliasPassesThrough(t *testing.T) {
-	srv, _, _, apiKey := setupAliasTestServer(t)
+	h, _, _, apiKey := setupAliasTestServer(t)
 
 	// No alias registered. Direct model-name request should route normally.
-	resp := postCompletion(t, srv.URL, apiKey, "variant-a")
+	resp := postCompletion(t, h, apiKey, "variant-a")
 	defer func() { _ = resp.Body.Close() }()
 	if resp.StatusCode != http.StatusOK {
 		b, _ := io.ReadAll(resp.Body)
@@ -189,7 +192,7 @@ func TestAliasIntegration_UnknownAliasPassesThrough(t *testing.T) {
 // TestAliasIntegration_DisabledAliasPassesThrough verifies a disabled alias
 // is a no-op — useful for pausing an experiment without deleting config.
 func TestAliasIntegration_DisabledAliasPassesThrough(t *testing.T) {
-	srv, eng, _, apiKey := setupAliasTestServer(t)
+	h, eng, _, apiKey := setupAliasTestServer(t)
 
 	if err := eng.AliasResolver().Set(router.Alias{
 		Name: "variant-a", // use a real model name as alias name
@@ -203,7 +206,7 @@ func TestAliasIntegration_DisabledAliasPassesThrough(t *testing.T) {
 
 	// Client asks for "variant-a" — if the alias were active it would rewrite
 	// to variant-b; because it's disabled we get variant-a.
-	resp := postCompletion(t, srv.URL, apiKey, "variant-a")
+	resp := postCompletion(t, h, apiKey, "variant-a")
 	defer func() { _ = resp.Body.Close() }()
 	if resp.Header.Get("X-Negotiated-Model") != "variant-a" {
 		t.Fatalf("disabled alias should not rewrite; got model %q",
@@ -215,7 +218,7 @@ func TestAliasIntegration_DisabledAliasPassesThrough(t *testing.T) {
 }
 
 func TestAliasIntegration_WildcardAliasSelectsConfiguredBackend(t *testing.T) {
-	srv, eng, _, apiKey := setupAliasTestServer(t)
+	h, eng, _, apiKey := setupAliasTestServer(t)
 
 	if err := eng.AliasResolver().Set(router.Alias{
 		Name: router.WildcardModelHint,
@@ -227,7 +230,7 @@ func TestAliasIntegration_WildcardAliasSelectsConfiguredBackend(t *testing.T) {
 		t.Fatalf("Set: %v", err)
 	}
 
-	resp := postCompletion(t, srv.URL, apiKey, router.WildcardModelHint)
+	resp := postCompletion(t, h, apiKey, router.WildcardModelHint)
 	defer func() { _ = resp.Body.Close() }()
 	if resp.StatusCode != http.StatusOK {
 		b, _ := io.ReadAll(resp.Body)
@@ -246,7 +249,7 @@ func TestAliasIntegration_WildcardAliasSelectsConfiguredBackend(t *testing.T) {
 // This is the single most important bit of the whole feature — without it
 // you can run the split but can't read the results.
 func TestAliasIntegration_RequestLogRecordsAlias(t *testing.T) {
-	srv, eng, db, apiKey := setupAliasTestServer(t)
+	h, eng, db, apiKey := setupAliasTestServer(t)
 
 	if err := eng.AliasResolver().Set(router.Alias{
 		Name: "experiment",
@@ -261,12 +264,12 @@ func TestAliasIntegration_RequestLogRecordsAlias(t *testing.T) {
 
 	// Send a handful of requests through the alias.
 	for i := 0; i < 5; i++ {
-		resp := postCompletion(t, srv.URL, apiKey, "experiment")
+		resp := postCompletion(t, h, apiKey, "experiment")
 		_, _ = io.Copy(io.Discard, resp.Body)
 		_ = resp.Body.Close()
 	}
 	// Baseline: one direct call that should NOT be tagged.
-	resp := postCompletion(t, srv.URL, apiKey, "variant-a")
+	resp := postCompletion(t, h, apiKey, "variant-a")
 	_, _ = io.Copy(io.Discard, resp.Body)
 	_ = resp.Body.Close()
 
@@ -300,7 +303,7 @@ func TestAliasIntegration_RequestLogRecordsAlias(t *testing.T) {
 // two variants behave differently enough that mid-session flipping would
 // confuse the caller.
 func TestAliasIntegration_StickyByAPIKey(t *testing.T) {
-	srv, eng, _, apiKey := setupAliasTestServer(t)
+	h, eng, _, apiKey := setupAliasTestServer(t)
 
 	if err := eng.AliasResolver().Set(router.Alias{
 		Name: "experiment",
@@ -318,7 +321,7 @@ func TestAliasIntegration_StickyByAPIKey(t *testing.T) {
 	var pinned string
 	const iterations = 25
 	for i := 0; i < iterations; i++ {
-		resp := postCompletion(t, srv.URL, apiKey, "experiment")
+		resp := postCompletion(t, h, apiKey, "experiment")
 		got := resp.Header.Get("X-Negotiated-Model")
 		_, _ = io.Copy(io.Discard, resp.Body)
 		_ = resp.Body.Close()
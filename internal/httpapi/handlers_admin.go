@@ -210,6 +210,26 @@ func addProbeTargetIfProbeable(d Dependencies, providerID string) {
 	}
 }
 
+// vaultSaveMu serializes persistVault so each save snapshots and writes the
+// vault as one step. Without it two concurrent admin writes could export in
+// one order and commit in the other, leaving the older snapshot on disk.
+var vaultSaveMu sync.Mutex
+
+// persistVault writes the vault's salt and encrypted entries to the store.
+// It is a no-op without a store or before the vault has a salt.
+func persistVault(ctx context.Context, d Dependencies) error {
+	if d.Store == nil {
+		return nil
+	}
+	vaultSaveMu.Lock()
+	defer vaultSaveMu.Unlock()
+	salt := d.Vault.Salt()
+	if salt == nil {
+		return nil
+	}
+	return d.Store.SaveVaultBlob(ctx, salt, d.Vault.Export())
+}
+
 // AdminSessionHandler creates a short-lived session cookie so that the SSE
 // EventSource (which cannot set request headers) can authenticate without
 // embedding the admin token in the URL query string.
@@ -329,13 +349,7 @@ func VaultUnlockHandler(d Dependencies) http.HandlerFunc {
 			return
 		}
 		// Persist vault salt and encrypted data to the store.
-		if d.Store != nil {
-			salt := d.Vault.Salt()
-			data := d.Vault.Export()
-			if salt != nil {
-				d.warnOnErr("save_vault", d.Store.SaveVaultBlob(r.Context(), salt, data))
-			}
-		}
+		d.warnOnErr("save_vault", persistVault(r.Context(), d))
 		if d.Store != nil {
 			d.warnOnErr("audit", d.Store.LogAudit(r.Context(), store.AuditEntry{
 				Timestamp: time.Now().UTC(),
@@ -378,15 +392,9 @@ func VaultRotateHandler(d Dependencies) http.HandlerFunc {
 		}
 
 		// Persist the new vault blob to the store.
-		if d.Store != nil {
-			salt := d.Vault.Salt()
-			data := d.Vault.Export()
-			if salt != nil {
-				if err := d.Store.SaveVaultBlob(r.Context(), salt, data); err != nil {
-					jsonError(w, "failed to persist vault: "+err.Error(), http.StatusInternalServerError)
-					return
-				}
-			}
+		if err := persistVault(r.Context(), d); err != nil {
+			jsonError(w, "failed to persist vault: "+err.Error(), http.StatusInternalServerError)
+			return
 		}
 
 		// Log audit entry.
@@ -441,13 +449,7 @@ func ProvidersUpsertHandler(d Dependencies) http.HandlerFunc {
 				} else {
 					req.CredStore = "vault"
 					// Persist vault data.
-					if d.Store != nil {
-						salt := d.Vault.Salt()
-						data := d.Vault.Export()
-						if salt != nil {
-							d.warnOnErr("save_vault", d.Store.SaveVaultBlob(r.Context(), salt, data))
-						}
-					}
+					d.warnOnErr("save_vault", persistVault(r.Context(), d))
 				}
 			} else {
 				slog.Info("vault locked or unavailable; API key captured in-memory only (won't survive restart)",
@@ -997,13 +999,7 @@ func ProvidersPatchHandler(d Dependencies) http.HandlerFunc {
 							slog.String("provider", id), slog.String("error", err.Error()))
 					} else {
 						existing.CredStore = "vault"
-						if d.Store != nil {
-							salt := d.Vault.Salt()
-							data := d.Vault.Export()
-							if salt != nil {
-								d.warnOnErr("save_vault", d.Store.SaveVaultBlob(r.Context(), salt, data))
-							}
-						}
+						d.warnOnErr("save_vault", persistVault(r.Context(), d))
 					}
 				} else {
 					slog.Info("vault locked or unavailable; API key captured in-memory only (won't survive restart)",
@@ -1245,13 +1241,7 @@ func VaultSecretsPutHandler(d Dependencies) http.HandlerFunc {
 			return
 		}
 		// Persist vault blob to SQLite on every write.
-		if d.Store != nil {
-			salt := d.Vault.Salt()
-			data := d.Vault.Export()
-			if salt != nil {
-				d.warnOnErr("save_vault", d.Store.SaveVaultBlob(r.Context(), salt, data))
-			}
-		}
+		d.warnOnErr("save_vault", persistVault(r.Context(), d))
 		if d.Store != nil {
 			d.warnOnErr("audit", d.Store.LogAudit(r.Context(), store.AuditEntry{
 				Timestamp: time.Now().UTC(),
@@ -1276,24 +1266,14 @@ func VaultSecretsDeleteHandler(d Dependencies) http.HandlerFunc {
 			jsonError(w, "key required", http.StatusBadRequest)
 			return
 		}
-		// Verify the key exists before deleting (returns 404 if not found).
-		if _, err := d.Vault.Get(vaultSecretKey(name)); err != nil {
-			if strings.Contains(err.Error(), "key not found") {
-				jsonError(w, "secret not found", http.StatusNotFound)
-			} else {
-				jsonError(w, err.Error(), http.StatusInternalServerError)
-			}
+		// Delete reports whether the key existed, so a missing secret is a 404
+		// without decrypting it first or re-persisting an unchanged blob.
+		if !d.Vault.Delete(vaultSecretKey(name)) {
+			jsonError(w, "secret not found", http.StatusNotFound)
 			return
 		}
-		d.Vault.Delete(vaultSecretKey(name))
 		// Persist vault blob to SQLite on every write.
-		if d.Store != nil {
-			salt := d.Vault.Salt()
-			data := d.Vault.Export()
-			if salt != nil {
-				d.warnOnErr("save_vault", d.Store.SaveVaultBlob(r.Context(), salt, data))
-			}
-		}
+		d.warnOnErr("save_vault", persistVault(r.Context(), d))
 		if d.Store != nil {
 			d.warnOnErr("audit", d.Store.LogAudit(r.Context(), store.AuditEntry{
 				Timestamp: time.Now().UTC(),
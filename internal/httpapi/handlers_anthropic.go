@@ -105,7 +105,12 @@ func AnthropicMessagesHandler(d Dependencies) http.HandlerFunc {
 			w.WriteHeader(http.StatusOK)
 
 			flusher, _ := w.(http.Flusher)
-			buf := make([]byte, 32*1024)
+			if flusher != nil {
+				flusher.Flush() // headers out before the first upstream chunk
+			}
+			bufp := streamBufPool.Get().(*[]byte)
+			defer streamBufPool.Put(bufp)
+			buf := *bufp
 			for {
 				n, readErr := stream.Read(buf)
 				if n > 0 {
@@ -7,6 +7,7 @@ import (
 	"io"
 	"log/slog"
 	"net/http"
+	"sync"
 	"time"
 
 	"go.temporal.io/sdk/client"
@@ -22,6 +23,15 @@ import (
 // maxStreamBytes limits streaming response size to prevent memory exhaustion (100 MB).
 const maxStreamBytes = 100 * 1024 * 1024
 
+// streamBufPool recycles the 32 KB buffers used to relay provider streams to
+// the client, so each streamed request does not allocate its own.
+var streamBufPool = sync.Pool{
+	New: func() any {
+		b := make([]byte, 32*1024)
+		return &b
+	},
+}
+
 // warnOnErr logs a warning if a background store operation fails and increments
 // the store_dropped_total Prometheus counter. Used for audit logs, request logs,
 // and reward logs that should not block the response but must be observable.
@@ -82,6 +92,10 @@ func ChatHandler(d Dependencies) http.HandlerFunc {
 
 		// Validate policy hints if provided.
 		if req.Policy != nil {
+			if req.Policy.Mode != "" && !router.ValidMode(req.Policy.Mode) {
+				jsonError(w, "unknown mode: "+req.Policy.Mode, http.StatusBadRequest)
+				return
+			}
 			if req.Policy.MaxBudgetUSD < 0 || req.Policy.MaxBudgetUSD > 100.0 {
 				jsonError(w, "max_budget_usd must be between 0 and 100", http.StatusBadRequest)
 				return
@@ -133,12 +147,7 @@ func ChatHandler(d Dependencies) http.HandlerFunc {
 		}
 
 		// Estimate tokens for reward logging.
-		estimatedTokens := req.Request.EstimatedInputTokens
-		if estimatedTokens == 0 {
-			for _, msg := range req.Request.Messages {
-				estimatedTokens += len(msg.Content) / 4
-			}
-		}
+		estimatedTokens := router.EstimateTokens(req.Request)
 		latencyBudgetMs := policy.MaxLatencyMs
 
 		// Determine API key ID for workflow attribution.
@@ -183,7 +192,12 @@ func ChatHandler(d Dependencies) http.HandlerFunc {
 			w.WriteHeader(http.StatusOK)
 
 			flusher, _ := w.(http.Flusher)
-			buf := make([]byte, 32*1024)
+			if flusher != nil {
+				flusher.Flush() // headers out before the first upstream chunk
+			}
+			bufp := streamBufPool.Get().(*[]byte)
+			defer streamBufPool.Put(bufp)
+			buf := *bufp
 			var totalBytes int64
 			streamSuccess := true
 			reqID := middleware.GetReqID(r.Context())
@@ -8,6 +8,7 @@ import (
 	"time"
 
 	"github.com/go-chi/chi/v5"
+	"github.com/jordanhubbard/tokenhub/internal/providers"
 	"github.com/jordanhubbard/tokenhub/internal/router"
 )
 
@@ -27,14 +28,14 @@ func ProviderDiscoverHandler(d Dependencies) http.HandlerFunc {
 			jsonError(w, "no store configured", http.StatusInternalServerError)
 			return
 		}
-		providers, err := d.Store.ListProviders(r.Context())
+		records, err := d.Store.ListProviders(r.Context())
 		if err != nil {
 			jsonError(w, "store error: "+err.Error(), http.StatusInternalServerError)
 			return
 		}
 		var baseURL string
 		var providerType string
-		for _, p := range providers {
+		for _, p := range records {
 			if p.ID == providerID {
 				baseURL = p.BaseURL
 				providerType = p.Type
@@ -70,7 +71,7 @@ func ProviderDiscoverHandler(d Dependencies) http.HandlerFunc {
 			}
 		}
 
-		client := &http.Client{Timeout: 10 * time.Second}
+		client := &http.Client{Timeout: 10 * time.Second, Transport: providers.Transport}
 		resp, err := client.Do(req)
 		if err != nil {
 			jsonError(w, "failed to reach provider: "+err.Error(), http.StatusBadGateway)
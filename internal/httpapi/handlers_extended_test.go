@@ -1555,6 +1555,29 @@ func TestAdminAuthMiddleware(t *testing.T) {
 	}
 }
 
+func TestAdminTokenHolderConstantTimeEqualFollowsRotation(t *testing.T) {
+	holder, err := NewAdminTokenHolder("secret-token", ":memory:", slog.Default())
+	if err != nil {
+		t.Fatalf("new holder: %v", err)
+	}
+	if !holder.ConstantTimeEqual("secret-token") || holder.ConstantTimeEqual("secret-tok") {
+		t.Fatal("initial token comparison wrong")
+	}
+
+	rotated, err := holder.Rotate(slog.Default())
+	if err != nil {
+		t.Fatalf("rotate: %v", err)
+	}
+	if holder.ConstantTimeEqual("secret-token") || !holder.ConstantTimeEqual(rotated) {
+		t.Error("comparison did not follow Rotate")
+	}
+
+	holder.Replace("replaced-token", slog.Default())
+	if holder.ConstantTimeEqual(rotated) || !holder.ConstantTimeEqual("replaced-token") {
+		t.Error("comparison did not follow Replace")
+	}
+}
+
 // --- Request logs handler tests ---
 
 func TestRequestLogsWithPagination(t *testing.T) {
@@ -1,6 +1,7 @@
 package httpapi
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"io"
@@ -159,10 +160,7 @@ func ChatCompletionsHandler(d Dependencies) http.HandlerFunc {
 		}
 
 		// Estimate tokens for observability.
-		estimatedTokens := 0
-		for _, msg := range req.Messages {
-			estimatedTokens += len(msg.Content) / 4
-		}
+		estimatedTokens := router.EstimateTokens(routerReq)
 
 		// Determine API key ID and name for attribution.
 		apiKeyID, apiKeyName := "", ""
@@ -205,7 +203,12 @@ func ChatCompletionsHandler(d Dependencies) http.HandlerFunc {
 			w.WriteHeader(http.StatusOK)
 
 			flusher, _ := w.(http.Flusher)
-			buf := make([]byte, 32*1024)
+			if flusher != nil {
+				flusher.Flush() // headers out before the first upstream chunk
+			}
+			bufp := streamBufPool.Get().(*[]byte)
+			defer streamBufPool.Put(bufp)
+			buf := *bufp
 			var totalBytes int64
 			streamSuccess := true
 			for {
@@ -527,6 +530,12 @@ func sanitizeToolCallIDs(choices json.RawMessage) json.RawMessage {
 		Logprobs     json.RawMessage `json:"logprobs,omitempty"`
 	}
 
+	// Most completions carry no tool calls, and without them there are no
+	// IDs to rewrite; skip decoding the choices into typed structs at all.
+	if !bytes.Contains(choices, []byte(`"tool_calls"`)) {
+		return choices
+	}
+
 	var arr []choice
 	if err := json.Unmarshal(choices, &arr); err != nil {
 		return choices
@@ -736,3 +736,16 @@ func TestCompletionsToolUseIDSanitization(t *testing.T) {
 		t.Errorf("expected call_Zx9feJ3w3ME71La2q8dHhv, got %q", id)
 	}
 }
+
+func TestSanitizeToolCallIDs(t *testing.T) {
+	plain := json.RawMessage(`[{"index":0,"message":{"role":"assistant","content":"hi"},"finish_reason":"stop","extra":1}]`)
+	if got := sanitizeToolCallIDs(plain); string(got) != string(plain) {
+		t.Errorf("choices without tool calls changed: %s", got)
+	}
+
+	withTools := json.RawMessage(`[{"index":0,"message":{"role":"assistant","tool_calls":[{"id":"tooluse_abc","type":"function","function":{"name":"f","arguments":"{}"}}]},"finish_reason":"tool_calls"}]`)
+	got := sanitizeToolCallIDs(withTools)
+	if !strings.Contains(string(got), `"id":"call_abc"`) {
+		t.Errorf("expected tooluse_ ID rewritten to call_, got %s", got)
+	}
+}
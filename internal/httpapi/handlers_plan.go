@@ -77,12 +77,7 @@ func PlanHandler(d Dependencies) http.HandlerFunc {
 		}
 
 		// Estimate tokens for reward logging (same heuristic as ChatHandler).
-		estimatedTokens := req.Request.EstimatedInputTokens
-		if estimatedTokens == 0 {
-			for _, msg := range req.Request.Messages {
-				estimatedTokens += len(msg.Content) / 4
-			}
-		}
+		estimatedTokens := router.EstimateTokens(req.Request)
 
 		// Inject request ID into context for provider tracing.
 		reqCtx := providers.WithRequestID(r.Context(), middleware.GetReqID(r.Context()))
@@ -8,6 +8,7 @@ import (
 	"fmt"
 	"net/http"
 	"net/http/httptest"
+	"sync"
 	"testing"
 	"time"
 
@@ -60,6 +61,45 @@ func (m *mockEmbeddingsSender) SendEmbeddings(ctx context.Context, body []byte)
 // testAPIKey is the plaintext key generated during test setup.
 var testAPIKey string
 
+// testAuthHeader is the Authorization value for testAPIKey, built once
+// alongside the key rather than on every authPost call.
+var testAuthHeader []string
+
+// testAPIKeyRecord is the stored form of testAPIKey. The bcrypt hash is
+// computed once per test binary and the record is copied into each fresh
+// store, so setupTestServer does not pay a bcrypt round per test.
+var (
+	testAPIKeyOnce   sync.Once
+	testAPIKeyRecord store.APIKeyRecord
+	testAPIKeyErr    error
+)
+
+// seedTestAPIKey makes testAPIKey valid against db.
+func seedTestAPIKey(t *testing.T, db store.Store, keyMgr *apikey.Manager) {
+	t.Helper()
+	generated := false
+	testAPIKeyOnce.Do(func() {
+		plaintext, rec, err := keyMgr.Generate(context.Background(), "test-api-key", `["chat","plan"]`, 0, nil)
+		if err != nil {
+			testAPIKeyErr = err
+			return
+		}
+		testAPIKey = plaintext
+		testAuthHeader = []string{"Bearer " + plaintext}
+		testAPIKeyRecord = *rec
+		generated = true
+	})
+	if testAPIKeyErr != nil {
+		t.Fatalf("failed to generate test API key: %v", testAPIKeyErr)
+	}
+	if generated {
+		return
+	}
+	if err := db.CreateAPIKey(context.Background(), testAPIKeyRecord); err != nil {
+		t.Fatalf("failed to seed test API key: %v", err)
+	}
+}
+
 func setupTestServer(t *testing.T) (*httptest.Server, *router.Engine, *vault.Vault) {
 	t.Helper()
 
@@ -92,11 +132,7 @@ func setupTestServer(t *testing.T) (*httptest.Server, *router.Engine, *vault.Vau
 	keyMgr := apikey.NewManager(db)
 
 	// Create a test API key for authenticating /v1 requests.
-	plaintext, _, err := keyMgr.Generate(context.Background(), "test-api-key", `["chat","plan"]`, 0, nil)
-	if err != nil {
-		t.Fatalf("failed to generate test API key: %v", err)
-	}
-	testAPIKey = plaintext
+	seedTestAPIKey(t, db, keyMgr)
 
 	MountRoutes(r, Dependencies{Engine: eng, Vault: v, Metrics: m, EventBus: bus, Stats: sc, Store: db, TSDB: ts, APIKeyMgr: keyMgr})
 	srv := httptest.NewServer(r)
@@ -109,8 +145,12 @@ func authPost(url, contentType string, body *bytes.Reader) (*http.Response, erro
 	if err != nil {
 		return nil, err
 	}
-	req.Header.Set("Content-Type", contentType)
-	req.Header.Set("Authorization", "Bearer "+testAPIKey)
+	// Keys are already canonical, so skip Header.Set's per-call
+	// canonicalization and string building.
+	req.Header = http.Header{
+		"Content-Type":  {contentType},
+		"Authorization": testAuthHeader,
+	}
 	return http.DefaultClient.Do(req)
 }
 
@@ -922,6 +962,28 @@ func TestChatEmptyMessages(t *testing.T) {
 	}
 }
 
+func TestChatInvalidPolicyMode(t *testing.T) {
+	ts, _, _ := setupTestServer(t)
+	defer ts.Close()
+
+	body, _ := json.Marshal(ChatRequest{
+		Policy: &PolicyHint{Mode: "fastest"},
+		Request: router.Request{
+			Messages: []router.Message{{Role: "user", Content: "hi"}},
+		},
+	})
+
+	resp, err := authPost(ts.URL+"/v1/chat", "application/json", bytes.NewReader(body))
+	if err != nil {
+		t.Fatalf("request failed: %v", err)
+	}
+	defer func() { _ = resp.Body.Close() }()
+
+	if resp.StatusCode != http.StatusBadRequest {
+		t.Errorf("expected 400 for unknown policy mode, got %d", resp.StatusCode)
+	}
+}
+
 func TestPlanInvalidIterations(t *testing.T) {
 	ts, _, _ := setupTestServer(t)
 	defer ts.Close()
@@ -4,8 +4,9 @@ import (
 	"context"
 	"encoding/json"
 	"errors"
-	"fmt"
+	"log/slog"
 	"net/http"
+	"strconv"
 	"time"
 
 	"github.com/jordanhubbard/tokenhub/internal/events"
@@ -132,24 +133,21 @@ type observeParams struct {
 func recordObservability(d Dependencies, p observeParams) {
 	// --- Prometheus metrics ---
 	if d.Metrics != nil {
-		status := "ok"
-		if !p.Success {
-			status = "error"
-		}
-		d.Metrics.RequestsTotal.WithLabelValues(p.Mode, p.ModelID, p.ProviderID, status).Inc()
+		rm := d.Metrics.Route(p.Mode, p.ModelID, p.ProviderID, p.Success)
+		rm.Requests.Inc()
 		if !p.Success && p.HTTPStatus > 0 {
 			d.Metrics.RequestErrorsByStatus.WithLabelValues(
-				p.Mode, p.ModelID, p.ProviderID, fmt.Sprintf("%d", p.HTTPStatus),
+				p.Mode, p.ModelID, p.ProviderID, strconv.Itoa(p.HTTPStatus),
 			).Inc()
 		}
 		if p.Success {
-			d.Metrics.RequestLatency.WithLabelValues(p.Mode, p.ModelID, p.ProviderID).Observe(float64(p.LatencyMs))
-			d.Metrics.CostUSD.WithLabelValues(p.ModelID, p.ProviderID).Add(p.CostUSD)
+			rm.Latency.Observe(float64(p.LatencyMs))
+			rm.CostUSD.Add(p.CostUSD)
 			if p.InputTokens > 0 {
-				d.Metrics.TokensTotal.WithLabelValues(p.ModelID, p.ProviderID, "input").Add(float64(p.InputTokens))
+				rm.InputTokens.Add(float64(p.InputTokens))
 			}
 			if p.OutputTokens > 0 {
-				d.Metrics.TokensTotal.WithLabelValues(p.ModelID, p.ProviderID, "output").Add(float64(p.OutputTokens))
+				rm.OutputTokens.Add(float64(p.OutputTokens))
 			}
 		}
 	}
@@ -196,10 +194,7 @@ func recordObservability(d Dependencies, p observeParams) {
 		}
 		if d.StoreWriteQueue != nil {
 			select {
-			case d.StoreWriteQueue <- func() {
-				d.warnOnErr("log_request", d.Store.LogRequest(context.Background(), rl))
-				d.warnOnErr("log_reward", d.Store.LogReward(context.Background(), re))
-			}:
+			case d.StoreWriteQueue <- StoreWrite{Request: rl, Reward: re}:
 			default:
 				// Queue full: drop the write and record the miss.
 				d.warnOnErr("log_request", errors.New("store write queue full"))
@@ -280,3 +275,50 @@ func recordObservability(d Dependencies, p observeParams) {
 		d.BudgetChecker.InvalidateCache(p.APIKeyID)
 	}
 }
+
+// StoreWrite is the request log and reward log for one routed request,
+// queued on Dependencies.StoreWriteQueue.
+type StoreWrite struct {
+	Request store.RequestLog
+	Reward  store.RewardEntry
+}
+
+// storeWriteBatchSize caps how many queued requests share one transaction.
+const storeWriteBatchSize = 128
+
+// DrainStoreWrites persists queued writes until queue is closed. Each
+// transaction takes whatever has queued up (at most storeWriteBatchSize)
+// without waiting for more, so an idle server still writes each request
+// promptly while a busy one amortizes commits across the backlog.
+func DrainStoreWrites(d Dependencies, queue <-chan StoreWrite) {
+	requests := make([]store.RequestLog, 0, storeWriteBatchSize)
+	rewards := make([]store.RewardEntry, 0, storeWriteBatchSize)
+	for w := range queue {
+		requests = append(requests[:0], w.Request)
+		rewards = append(rewards[:0], w.Reward)
+	fill:
+		for len(requests) < storeWriteBatchSize {
+			select {
+			case w, ok := <-queue:
+				if !ok {
+					break fill
+				}
+				requests = append(requests, w.Request)
+				rewards = append(rewards, w.Reward)
+			default:
+				break fill
+			}
+		}
+		if err := d.Store.LogBatch(context.Background(), requests, rewards); err != nil {
+			// The whole transaction is lost, so count every row it carried
+			// under the same ops the unbatched writes used.
+			slog.Warn("store operation failed", slog.String("op", "log_batch"),
+				slog.Int("requests", len(requests)), slog.Int("rewards", len(rewards)),
+				slog.String("error", err.Error()))
+			if d.Metrics != nil {
+				d.Metrics.StoreDroppedTotal.WithLabelValues("log_request").Add(float64(len(requests)))
+				d.Metrics.StoreDroppedTotal.WithLabelValues("log_reward").Add(float64(len(rewards)))
+			}
+		}
+	}
+}
@@ -0,0 +1,140 @@
+package httpapi
+
+import (
+	"context"
+	"errors"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/jordanhubbard/tokenhub/internal/metrics"
+	"github.com/jordanhubbard/tokenhub/internal/store"
+	dto "github.com/prometheus/client_model/go"
+)
+
+// batchRecorder wraps a Store and records the size of every LogBatch call.
+type batchRecorder struct {
+	store.Store
+	err     error
+	batches chan int
+
+	mu    sync.Mutex
+	sizes []int
+}
+
+func newBatchRecorder(t *testing.T, batchErr error) *batchRecorder {
+	t.Helper()
+	db, err := store.NewSQLite(":memory:")
+	if err != nil {
+		t.Fatalf("failed to create store: %v", err)
+	}
+	if err := db.Migrate(context.Background()); err != nil {
+		t.Fatalf("failed to migrate: %v", err)
+	}
+	t.Cleanup(func() { _ = db.Close() })
+	return &batchRecorder{Store: db, err: batchErr, batches: make(chan int, 16)}
+}
+
+func (b *batchRecorder) LogBatch(ctx context.Context, requests []store.RequestLog, rewards []store.RewardEntry) error {
+	b.mu.Lock()
+	b.sizes = append(b.sizes, len(requests))
+	b.mu.Unlock()
+	select {
+	case b.batches <- len(requests):
+	default:
+	}
+	if b.err != nil {
+		return b.err
+	}
+	return b.Store.LogBatch(ctx, requests, rewards)
+}
+
+// droppedCount reads tokenhub_store_dropped_total for op.
+func droppedCount(t *testing.T, m *metrics.Registry, op string) float64 {
+	t.Helper()
+	var out dto.Metric
+	if err := m.StoreDroppedTotal.WithLabelValues(op).Write(&out); err != nil {
+		t.Fatalf("read counter: %v", err)
+	}
+	return out.GetCounter().GetValue()
+}
+
+func queueWrites(queue chan StoreWrite, n int) {
+	for i := 0; i < n; i++ {
+		queue <- StoreWrite{
+			Request: store.RequestLog{Timestamp: time.Now().UTC(), ModelID: "m1", ProviderID: "p1", StatusCode: 200},
+			Reward:  store.RewardEntry{Timestamp: time.Now().UTC(), ModelID: "m1", Success: true},
+		}
+	}
+}
+
+func TestDrainStoreWrites_CapsBatchesAndFlushesOnClose(t *testing.T) {
+	rec := newBatchRecorder(t, nil)
+	total := 2*storeWriteBatchSize + 44
+	queue := make(chan StoreWrite, total)
+	queueWrites(queue, total)
+	close(queue)
+
+	// Everything was queued before the channel closed; all of it must be
+	// written, in batches no larger than storeWriteBatchSize.
+	DrainStoreWrites(Dependencies{Store: rec}, queue)
+
+	want := []int{storeWriteBatchSize, storeWriteBatchSize, 44}
+	if len(rec.sizes) != len(want) {
+		t.Fatalf("batch sizes = %v, want %v", rec.sizes, want)
+	}
+	for i := range want {
+		if rec.sizes[i] != want[i] {
+			t.Fatalf("batch sizes = %v, want %v", rec.sizes, want)
+		}
+	}
+
+	logs, err := rec.ListRequestLogs(context.Background(), total+1, 0)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if len(logs) != total {
+		t.Errorf("persisted %d request logs, want %d", len(logs), total)
+	}
+}
+
+func TestDrainStoreWrites_DoesNotWaitForFullBatch(t *testing.T) {
+	rec := newBatchRecorder(t, nil)
+	queue := make(chan StoreWrite, 8)
+	done := make(chan struct{})
+	go func() {
+		defer close(done)
+		DrainStoreWrites(Dependencies{Store: rec}, queue)
+	}()
+
+	// A single write on an open queue is committed on its own.
+	queueWrites(queue, 1)
+	select {
+	case n := <-rec.batches:
+		if n != 1 {
+			t.Errorf("batch size = %d, want 1", n)
+		}
+	case <-time.After(2 * time.Second):
+		t.Fatal("drain waited for more writes instead of committing the one queued")
+	}
+
+	close(queue)
+	<-done
+}
+
+func TestDrainStoreWrites_CountsDroppedRowsOnBatchError(t *testing.T) {
+	rec := newBatchRecorder(t, errors.New("disk full"))
+	m := metrics.New()
+	queue := make(chan StoreWrite, 5)
+	queueWrites(queue, 5)
+	close(queue)
+
+	DrainStoreWrites(Dependencies{Store: rec, Metrics: m}, queue)
+
+	if got := droppedCount(t, m, "log_request"); got != 5 {
+		t.Errorf("log_request dropped = %v, want 5", got)
+	}
+	if got := droppedCount(t, m, "log_reward"); got != 5 {
+		t.Errorf("log_reward dropped = %v, want 5", got)
+	}
+}
@@ -81,9 +81,9 @@ type Dependencies struct {
 
 	// StoreWriteQueue decouples store writes (request/reward logs) from the
 	// handler goroutine so SQLite contention does not add to client-visible
-	// latency. A dedicated goroutine drains the queue. When nil, writes are
-	// performed synchronously (e.g. in test harnesses).
-	StoreWriteQueue chan func()
+	// latency. A dedicated goroutine drains the queue (see DrainStoreWrites).
+	// When nil, writes are performed synchronously (e.g. in test harnesses).
+	StoreWriteQueue chan StoreWrite
 }
 
 // maxRequestBodySize is the maximum allowed request body for POST/PUT/PATCH endpoints (10 MB).
@@ -327,8 +327,8 @@ func adminAuthMiddleware(holder *AdminTokenHolder) func(http.Handler) http.Handl
 			}
 
 			var provided string
-			if auth := r.Header.Get("Authorization"); strings.HasPrefix(auth, "Bearer ") {
-				provided = strings.TrimPrefix(auth, "Bearer ")
+			if bearer, ok := strings.CutPrefix(r.Header.Get("Authorization"), "Bearer "); ok {
+				provided = bearer
 			} else if c, err := r.Cookie("th_admin_session"); err == nil {
 				provided = c.Value
 			}
@@ -2,9 +2,12 @@ package metrics
 
 import (
 	"net/http"
+	"sync"
+	"time"
 
 	"github.com/prometheus/client_golang/prometheus"
 	"github.com/prometheus/client_golang/prometheus/promhttp"
+	dto "github.com/prometheus/client_model/go"
 )
 
 type Registry struct {
@@ -36,6 +39,46 @@ type Registry struct {
 
 	// Heartbeat counter incremented every heartbeat interval.
 	HeartbeatTotal prometheus.Counter
+
+	routes sync.Map // routeKey -> *RouteMetrics
+}
+
+type routeKey struct {
+	mode, model, provider string
+	success               bool
+}
+
+// RouteMetrics holds the per-request metric children for one (mode, model,
+// provider) combination and outcome. Resolving them once lets the request
+// path skip WithLabelValues' label hashing and vector lock on every
+// observation. Failed outcomes only count requests, so only Requests is set.
+type RouteMetrics struct {
+	Requests     prometheus.Counter // status="ok" or "error" per the outcome
+	Latency      prometheus.Observer
+	CostUSD      prometheus.Counter
+	InputTokens  prometheus.Counter
+	OutputTokens prometheus.Counter
+}
+
+// Route returns the cached RouteMetrics for mode, model, provider and
+// outcome, resolving the children on first use.
+func (m *Registry) Route(mode, model, provider string, success bool) *RouteMetrics {
+	k := routeKey{mode, model, provider, success}
+	if rm, ok := m.routes.Load(k); ok {
+		return rm.(*RouteMetrics)
+	}
+	rm := &RouteMetrics{}
+	if success {
+		rm.Requests = m.RequestsTotal.WithLabelValues(mode, model, provider, "ok")
+		rm.Latency = m.RequestLatency.WithLabelValues(mode, model, provider)
+		rm.CostUSD = m.CostUSD.WithLabelValues(model, provider)
+		rm.InputTokens = m.TokensTotal.WithLabelValues(model, provider, "input")
+		rm.OutputTokens = m.TokensTotal.WithLabelValues(model, provider, "output")
+	} else {
+		rm.Requests = m.RequestsTotal.WithLabelValues(mode, model, provider, "error")
+	}
+	actual, _ := m.routes.LoadOrStore(k, rm)
+	return actual.(*RouteMetrics)
 }
 
 func New() *Registry {
@@ -114,6 +157,42 @@ func (m *Registry) RecordProviderSkip(providerID string, reason string) {
 	m.ProviderSkipsTotal.WithLabelValues(providerID, reason).Inc()
 }
 
+// Handler serves the registry in the Prometheus exposition format. Scrapes
+// are answered from a snapshot at most scrapeCacheTTL old, so several
+// scrapers (Prometheus replicas, the dashboard, tokenhubctl) arriving
+// together share one walk of every series instead of each doing their own.
 func (m *Registry) Handler() http.Handler {
-	return promhttp.HandlerFor(m.reg, promhttp.HandlerOpts{})
+	return promhttp.HandlerFor(&cachedGatherer{g: m.reg, ttl: scrapeCacheTTL}, promhttp.HandlerOpts{})
+}
+
+// scrapeCacheTTL bounds how stale a /metrics response may be. It is well
+// under any sensible scrape interval.
+const scrapeCacheTTL = time.Second
+
+// cachedGatherer memoizes a successful Gather for ttl. Concurrent callers
+// wait on mu for the one in-flight Gather rather than starting their own.
+// The returned families are shared and must be treated as read-only, which
+// promhttp does.
+type cachedGatherer struct {
+	g   prometheus.Gatherer
+	ttl time.Duration
+
+	mu  sync.Mutex
+	at  time.Time
+	mfs []*dto.MetricFamily
+}
+
+func (c *cachedGatherer) Gather() ([]*dto.MetricFamily, error) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if c.mfs != nil && time.Since(c.at) < c.ttl {
+		return c.mfs, nil
+	}
+	mfs, err := c.g.Gather()
+	if err != nil {
+		c.mfs = nil
+		return mfs, err
+	}
+	c.mfs, c.at = mfs, time.Now()
+	return mfs, nil
 }
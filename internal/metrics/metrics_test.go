@@ -2,6 +2,7 @@ package metrics
 
 import (
 	"testing"
+	"time"
 
 	"github.com/prometheus/client_golang/prometheus"
 )
@@ -108,3 +109,69 @@ func TestRegisteredMetricDescriptions(t *testing.T) {
 		t.Errorf("expected 3 metric descriptors, got %d", count)
 	}
 }
+
+func TestRouteCachesChildren(t *testing.T) {
+	r := New()
+
+	ok := r.Route("normal", "gpt-4", "openai", true)
+	if r.Route("normal", "gpt-4", "openai", true) != ok {
+		t.Error("expected Route to return the cached children")
+	}
+	ok.Requests.Inc()
+	r.Route("normal", "gpt-4", "openai", false).Requests.Inc()
+	r.Route("normal", "gpt-4", "openai", false).Requests.Inc()
+
+	mfs, err := r.reg.Gather()
+	if err != nil {
+		t.Fatalf("unexpected error gathering metrics: %v", err)
+	}
+	got := make(map[string]float64)
+	for _, mf := range mfs {
+		if mf.GetName() != "tokenhub_requests_total" {
+			continue
+		}
+		for _, m := range mf.GetMetric() {
+			for _, lp := range m.GetLabel() {
+				if lp.GetName() == "status" {
+					got[lp.GetValue()] = m.GetCounter().GetValue()
+				}
+			}
+		}
+	}
+	if got["ok"] != 1 || got["error"] != 2 {
+		t.Errorf("requests by status = %v, want ok=1 error=2", got)
+	}
+}
+
+func TestCachedGathererReusesSnapshot(t *testing.T) {
+	r := New()
+	heartbeats := func(g prometheus.Gatherer) float64 {
+		t.Helper()
+		mfs, err := g.Gather()
+		if err != nil {
+			t.Fatalf("unexpected error gathering metrics: %v", err)
+		}
+		for _, mf := range mfs {
+			if mf.GetName() == "tokenhub_heartbeat_total" {
+				return mf.GetMetric()[0].GetCounter().GetValue()
+			}
+		}
+		t.Fatal("tokenhub_heartbeat_total not gathered")
+		return 0
+	}
+
+	cached := &cachedGatherer{g: r.reg, ttl: time.Hour}
+	r.HeartbeatTotal.Inc()
+	if got := heartbeats(cached); got != 1 {
+		t.Fatalf("first gather = %v, want 1", got)
+	}
+	r.HeartbeatTotal.Inc()
+	if got := heartbeats(cached); got != 1 {
+		t.Errorf("gather within ttl = %v, want cached 1", got)
+	}
+
+	cached.ttl = 0
+	if got := heartbeats(cached); got != 2 {
+		t.Errorf("gather after ttl = %v, want 2", got)
+	}
+}
@@ -36,7 +36,7 @@ func New(id, apiKey, baseURL string, opts ...Option) *Adapter {
 		keyFunc:    func() string { return apiKey },
 		baseURL:    baseURL,
 		apiVersion: "2023-06-01",
-		client:     &http.Client{Timeout: 30 * time.Second},
+		client:     &http.Client{Timeout: 30 * time.Second, Transport: providers.Transport},
 	}
 	for _, o := range opts {
 		o(a)
@@ -216,7 +216,7 @@ func (a *Adapter) ForwardRawStream(ctx context.Context, body []byte) (io.ReadClo
 		req.Header.Set(k, v)
 	}
 	// Use a client without a read timeout — the stream may take minutes.
-	streamClient := &http.Client{}
+	streamClient := &http.Client{Transport: providers.Transport}
 	resp, err := streamClient.Do(req)
 	if err != nil {
 		return nil, fmt.Errorf("upstream: %w", err)
@@ -15,6 +15,19 @@ import (
 	"go.opentelemetry.io/otel/trace"
 )
 
+// Transport is the HTTP transport shared by the provider adapters. It is
+// http.DefaultTransport with a larger idle pool: the default keeps only two
+// idle connections per host, so concurrent completions to one provider kept
+// closing connections and re-dialing (and re-handshaking TLS) for new ones.
+var Transport http.RoundTripper = newTransport()
+
+func newTransport() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConns = 256
+	t.MaxIdleConnsPerHost = 64
+	return t
+}
+
 // DoRequest sends a POST request with a JSON payload and returns the response
 // body bytes. It handles JSON marshaling, header setting (Content-Type plus any
 // caller-supplied headers), request-ID forwarding, error responses (StatusError
@@ -34,7 +34,7 @@ func New(id, apiKey, baseURL string, opts ...Option) *Adapter {
 		id:      id,
 		keyFunc: func() string { return apiKey },
 		baseURL: baseURL,
-		client:  &http.Client{Timeout: 30 * time.Second},
+		client:  &http.Client{Timeout: 30 * time.Second, Transport: providers.Transport},
 	}
 	for _, o := range opts {
 		o(a)
@@ -181,7 +181,7 @@ func (a *Adapter) ForwardRawStream(ctx context.Context, body []byte) (io.ReadClo
 	for k, v := range a.authHeaders() {
 		req.Header.Set(k, v)
 	}
-	streamClient := &http.Client{}
+	streamClient := &http.Client{Transport: providers.Transport}
 	resp, err := streamClient.Do(req)
 	if err != nil {
 		return nil, fmt.Errorf("upstream: %w", err)
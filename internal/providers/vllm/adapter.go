@@ -39,7 +39,7 @@ func New(id string, endpoint string, opts ...Option) *Adapter {
 	a := &Adapter{
 		id:        id,
 		endpoints: []string{endpoint},
-		client:    &http.Client{Timeout: 30 * time.Second},
+		client:    &http.Client{Timeout: 30 * time.Second, Transport: providers.Transport},
 	}
 	for _, o := range opts {
 		o(a)
@@ -18,6 +18,12 @@ var validModes = map[string]bool{
 	"thompson":        true,
 }
 
+// ValidMode reports whether mode is a recognized routing or orchestration
+// mode. The empty string (use the server default) is not a mode.
+func ValidMode(mode string) bool {
+	return validModes[mode]
+}
+
 // maxDirectiveScan limits how far into a message we scan for directives.
 const maxDirectiveScan = 2048
 
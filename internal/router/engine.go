@@ -115,6 +115,78 @@ type Engine struct {
 	mu       sync.RWMutex
 	models   map[string]Model
 	adapters map[string]Sender // provider_id -> adapter
+
+	// byContext holds every registered model ordered by MaxContextTokens
+	// (ties by ID) so context-overflow escalation can binary-search for the
+	// smallest larger window. It is rebuilt on every registry mutation and
+	// never modified in place, so readers may keep the slice after
+	// releasing mu.
+	byContext []Model
+
+	// byWeight holds the same models ordered by Weight, highest first (ties
+	// by ID). eligibleModels walks it instead of ranging over the models
+	// map, so candidate filtering is a slice scan in a stable order and
+	// equal-score candidates keep a deterministic, weight-first ranking.
+	// Like byContext it is replaced, never modified, on mutation.
+	byWeight []Model
+
+	// dispatch maps each provider that backs at least one registered model
+	// to its adapter. Routing hands it to the send paths as their adapter
+	// snapshot, so a request does not rebuild that map from the model list.
+	// Like byContext it is replaced, never modified, on mutation.
+	dispatch map[string]Sender
+
+	// rawSenders holds the adapters that implement AnthropicRawSender, keyed
+	// by provider ID, and rawModels the enabled models they serve in
+	// byWeight order. Both are derived on mutation so Anthropic passthrough
+	// neither type-asserts adapters nor scans the full registry per request.
+	rawSenders map[string]AnthropicRawSender
+	rawModels  []Model
+
+	// resolvedIDs memoizes availableModelIDLocked per preferred model ID
+	// (the suffix scan run for every wildcard/alias variant on each
+	// request). It is dropped whenever models or adapters change. Readers
+	// fill it while holding only mu.RLock, so resolvedMu guards the map.
+	resolvedMu  sync.Mutex
+	resolvedIDs map[string]resolvedModelID
+
+	// candidates memoizes staticCandidatesLocked, the registry-only part of
+	// eligibleModels, so requests in the same context-size bucket with the
+	// same MinWeight skip re-filtering the registry. Dropped with
+	// resolvedIDs on mutation.
+	candidatesMu sync.Mutex
+	candidates   map[candidateKey]candidateSet
+}
+
+// resolvedModelIDCacheSize bounds resolvedIDs; the keys come from alias and
+// default-pool configuration, so the bound is only a safety net.
+const resolvedModelIDCacheSize = 1024
+
+type resolvedModelID struct {
+	id string
+	ok bool
+}
+
+// candidateCacheSize bounds candidates. Context buckets are few, but
+// MinWeight comes from the request, so the map is reset if it fills.
+const candidateCacheSize = 1024
+
+// candidateKey identifies a memoized candidate set. contextBucket is the
+// bit length of the request's context size including headroom.
+type candidateKey struct {
+	contextBucket int
+	minWeight     int
+}
+
+type providerSkip struct {
+	providerID string
+	reason     string
+}
+
+// candidateSet is the memoized result of staticCandidatesLocked.
+type candidateSet struct {
+	models []Model
+	skips  []providerSkip
 }
 
 func NewEngine(cfg EngineConfig) *Engine {
@@ -207,9 +279,11 @@ func (e *Engine) resolveDefaultWildcard(req *Request) string {
 	e.mu.Lock()
 	defer e.mu.Unlock()
 
-	defaultModels := DefaultWildcardRoundRobinModelIDs()
-	candidates := make([]string, 0, len(defaultModels))
-	for _, preferredID := range defaultModels {
+	// Read the package-level pool directly: it is never mutated, so the
+	// defensive copy made by DefaultWildcardRoundRobinModelIDs is only
+	// needed for callers outside the package.
+	candidates := make([]string, 0, len(defaultWildcardRoundRobinModels))
+	for _, preferredID := range defaultWildcardRoundRobinModels {
 		if id, ok := e.availableModelIDLocked(preferredID); ok {
 			candidates = append(candidates, id)
 		}
@@ -225,7 +299,29 @@ func (e *Engine) resolveDefaultWildcard(req *Request) string {
 	return WildcardModelHint
 }
 
+// availableModelIDLocked resolves preferredID to a registered, enabled model
+// with a live adapter, matching either the exact ID or a provider-prefixed
+// form ("<prefix>/<preferredID>"). Caller must hold e.mu (read or write).
 func (e *Engine) availableModelIDLocked(preferredID string) (string, bool) {
+	e.resolvedMu.Lock()
+	if r, hit := e.resolvedIDs[preferredID]; hit {
+		e.resolvedMu.Unlock()
+		return r.id, r.ok
+	}
+	e.resolvedMu.Unlock()
+
+	id, ok := e.scanAvailableModelIDLocked(preferredID)
+
+	e.resolvedMu.Lock()
+	if e.resolvedIDs == nil || len(e.resolvedIDs) >= resolvedModelIDCacheSize {
+		e.resolvedIDs = make(map[string]resolvedModelID)
+	}
+	e.resolvedIDs[preferredID] = resolvedModelID{id: id, ok: ok}
+	e.resolvedMu.Unlock()
+	return id, ok
+}
+
+func (e *Engine) scanAvailableModelIDLocked(preferredID string) (string, bool) {
 	if m, ok := e.models[preferredID]; ok && m.Enabled {
 		if _, ok := e.adapters[m.ProviderID]; ok {
 			return preferredID, true
@@ -262,7 +358,7 @@ func (e *Engine) wildcardRoutingPoolLocked(selectedID string) map[string]bool {
 		}
 	}
 	if len(pool) == 0 {
-		for _, preferredID := range DefaultWildcardRoundRobinModelIDs() {
+		for _, preferredID := range defaultWildcardRoundRobinModels {
 			if id, ok := e.availableModelIDLocked(preferredID); ok {
 				pool[id] = true
 			}
@@ -296,6 +392,7 @@ func (e *Engine) RegisterAdapter(a Sender) {
 	e.mu.Lock()
 	defer e.mu.Unlock()
 	e.adapters[a.ID()] = a
+	e.reindexLocked()
 }
 
 // UnregisterAdapter removes a provider adapter by ID. Models that reference
@@ -305,12 +402,25 @@ func (e *Engine) UnregisterAdapter(id string) {
 	e.mu.Lock()
 	defer e.mu.Unlock()
 	delete(e.adapters, id)
+	e.reindexLocked()
 }
 
 func (e *Engine) RegisterModel(m Model) {
 	e.mu.Lock()
 	defer e.mu.Unlock()
 	e.models[m.ID] = m
+	e.reindexLocked()
+}
+
+// RegisterModels registers a batch of models under a single lock
+// acquisition. Later entries win when IDs repeat, as with RegisterModel.
+func (e *Engine) RegisterModels(models ...Model) {
+	e.mu.Lock()
+	defer e.mu.Unlock()
+	for _, m := range models {
+		e.models[m.ID] = m
+	}
+	e.reindexLocked()
 }
 
 // HasModel returns true if a model with the given ID is registered (enabled or not).
@@ -326,6 +436,74 @@ func (e *Engine) UnregisterModel(id string) {
 	e.mu.Lock()
 	defer e.mu.Unlock()
 	delete(e.models, id)
+	e.reindexLocked()
+}
+
+// disableModel marks a registered model as disabled so it is skipped by
+// routing until re-enabled via the admin API (e.g. on budget exhaustion).
+func (e *Engine) disableModel(id string) {
+	e.mu.Lock()
+	defer e.mu.Unlock()
+	if mod, ok := e.models[id]; ok {
+		mod.Enabled = false
+		e.models[id] = mod
+		e.reindexLocked()
+	}
+}
+
+// reindexLocked rebuilds the state derived from e.models and e.adapters.
+// Caller must hold e.mu for writing.
+func (e *Engine) reindexLocked() {
+	e.resolvedMu.Lock()
+	e.resolvedIDs = nil
+	e.resolvedMu.Unlock()
+	e.candidatesMu.Lock()
+	e.candidates = nil
+	e.candidatesMu.Unlock()
+
+	idx := make([]Model, 0, len(e.models))
+	for _, m := range e.models {
+		idx = append(idx, m)
+	}
+	sort.Slice(idx, func(i, j int) bool {
+		if idx[i].MaxContextTokens != idx[j].MaxContextTokens {
+			return idx[i].MaxContextTokens < idx[j].MaxContextTokens
+		}
+		return idx[i].ID < idx[j].ID
+	})
+	e.byContext = idx
+
+	byWeight := make([]Model, len(idx))
+	copy(byWeight, idx)
+	sort.Slice(byWeight, func(i, j int) bool {
+		if byWeight[i].Weight != byWeight[j].Weight {
+			return byWeight[i].Weight > byWeight[j].Weight
+		}
+		return byWeight[i].ID < byWeight[j].ID
+	})
+	e.byWeight = byWeight
+
+	dispatch := make(map[string]Sender)
+	for _, m := range idx {
+		if a, ok := e.adapters[m.ProviderID]; ok {
+			dispatch[m.ProviderID] = a
+		}
+	}
+	e.dispatch = dispatch
+
+	rawSenders := make(map[string]AnthropicRawSender)
+	for id, a := range e.adapters {
+		if ars, ok := a.(AnthropicRawSender); ok {
+			rawSenders[id] = ars
+		}
+	}
+	var rawModels []Model
+	for _, m := range byWeight {
+		if _, ok := rawSenders[m.ProviderID]; ok && m.Enabled {
+			rawModels = append(rawModels, m)
+		}
+	}
+	e.rawSenders, e.rawModels = rawSenders, rawModels
 }
 
 // UpdateDefaults updates the runtime routing policy defaults.
@@ -421,39 +599,24 @@ func (e *Engine) GetAnthropicSenderAndModel(modelHint string) (AnthropicRawSende
 		if !m.Enabled {
 			return nil, ""
 		}
-		if a, ok := e.adapters[m.ProviderID]; ok {
-			if ars, ok := a.(AnthropicRawSender); ok {
-				return ars, modelHint
-			}
+		if ars, ok := e.rawSenders[m.ProviderID]; ok {
+			return ars, modelHint
 		}
 	}
 	// Suffix match: find a model whose ID ends with /<hint>.
 	// Allows "claude-sonnet-4-6" to resolve to "azure/anthropic/claude-sonnet-4-6".
 	suffix := "/" + modelHint
-	for id, m := range e.models {
-		if !m.Enabled {
-			continue
-		}
-		if !strings.HasSuffix(id, suffix) {
-			continue
-		}
-		if a, ok := e.adapters[m.ProviderID]; ok {
-			if ars, ok := a.(AnthropicRawSender); ok {
-				return ars, id
-			}
+	for _, m := range e.rawModels {
+		if strings.HasSuffix(m.ID, suffix) {
+			return e.rawSenders[m.ProviderID], m.ID
 		}
 	}
-	// Fallback: first adapter that implements AnthropicRawSender.
-	for _, a := range e.adapters {
-		if ars, ok := a.(AnthropicRawSender); ok {
-			// Keep fallback scoped to enabled models so disabled providers are
-			// never selected through Anthropic passthrough.
-			for resolvedID, m := range e.models {
-				if m.Enabled && m.ProviderID == a.ID() {
-					return ars, resolvedID
-				}
-			}
-		}
+	// Fallback: the highest-weight enabled model behind an adapter that
+	// implements AnthropicRawSender. Restricting rawModels to enabled models
+	// keeps disabled providers out of Anthropic passthrough.
+	if len(e.rawModels) > 0 {
+		m := e.rawModels[0]
+		return e.rawSenders[m.ProviderID], m.ID
 	}
 	return nil, ""
 }
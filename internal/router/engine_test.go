@@ -5,6 +5,7 @@ import (
 	"encoding/json"
 	"errors"
 	"fmt"
+	"io"
 	"strings"
 	"sync"
 	"testing"
@@ -104,6 +105,25 @@ func TestEstimateTokens(t *testing.T) {
 	}
 }
 
+func TestEstimateTokensPerMessage(t *testing.T) {
+	req := Request{Messages: []Message{
+		{Role: "system", Content: "7 chars"},
+		{Role: "user", Content: "7 chars"},
+	}}
+	// Each message is rounded down on its own: 7/4 + 7/4 = 2, not 14/4 = 3.
+	if got := EstimateTokens(req); got != 2 {
+		t.Errorf("EstimateTokens() = %d, want 2", got)
+	}
+}
+
+func TestEstimateTokensNonASCII(t *testing.T) {
+	// 4 ASCII bytes (1 token) plus 4 CJK characters (12 bytes, 4 tokens).
+	req := makeRequest("abcd你好世界")
+	if got := EstimateTokens(req); got != 5 {
+		t.Errorf("EstimateTokens() = %d, want 5", got)
+	}
+}
+
 func TestEstimateTokensExplicit(t *testing.T) {
 	req := Request{
 		Messages:             []Message{{Role: "user", Content: "hello"}},
@@ -133,6 +153,25 @@ func TestModelRegistration(t *testing.T) {
 	}
 }
 
+func TestRegisterModelsBulk(t *testing.T) {
+	eng := NewEngine(EngineConfig{})
+	eng.RegisterModel(Model{ID: "m1", ProviderID: "p1", Weight: 1, Enabled: true})
+	eng.RegisterModels(
+		Model{ID: "m1", ProviderID: "p1", Weight: 7, Enabled: true},
+		Model{ID: "m2", ProviderID: "p1", Weight: 3, Enabled: true},
+	)
+
+	if got := len(eng.ListModels()); got != 2 {
+		t.Fatalf("expected 2 models, got %d", got)
+	}
+	if m, ok := eng.GetModel("m1"); !ok || m.Weight != 7 {
+		t.Errorf("expected m1 to be replaced with weight 7, got %+v", m)
+	}
+	if !eng.HasModel("m2") {
+		t.Error("expected m2 to be registered")
+	}
+}
+
 func TestSelectionByWeight(t *testing.T) {
 	eng := NewEngine(EngineConfig{})
 	mock := newMockSender("p1")
@@ -258,6 +297,286 @@ func TestEscalationContextOverflow(t *testing.T) {
 	}
 }
 
+func TestFindLargerContextModelPicksSmallestEligible(t *testing.T) {
+	eng := NewEngine(EngineConfig{})
+	eng.RegisterAdapter(newMockSender("p1"))
+
+	eng.RegisterModels(
+		Model{ID: "current", ProviderID: "p1", MaxContextTokens: 8000, Enabled: true},
+		Model{ID: "too-small", ProviderID: "p1", MaxContextTokens: 16000, Enabled: true},
+		Model{ID: "disabled", ProviderID: "p1", MaxContextTokens: 32000, Enabled: false},
+		Model{ID: "no-adapter", ProviderID: "p2", MaxContextTokens: 40000, Enabled: true},
+		Model{ID: "huge", ProviderID: "p1", MaxContextTokens: 1000000, Enabled: true},
+		Model{ID: "fits", ProviderID: "p1", MaxContextTokens: 64000, Enabled: true},
+	)
+	current, _ := eng.GetModel("current")
+
+	larger := eng.FindLargerContextModel(current, 20000)
+	if larger == nil || larger.ID != "fits" {
+		t.Fatalf("expected fits, got %+v", larger)
+	}
+
+	// Disabling a model updates the index.
+	eng.disableModel("fits")
+	larger = eng.FindLargerContextModel(current, 20000)
+	if larger == nil || larger.ID != "huge" {
+		t.Fatalf("expected huge after disabling fits, got %+v", larger)
+	}
+
+	if larger := eng.FindLargerContextModel(current, 2000000); larger != nil {
+		t.Errorf("expected no model above 2M tokens, got %s", larger.ID)
+	}
+}
+
+func TestEligibleModelsTiesAreDeterministic(t *testing.T) {
+	eng := NewEngine(EngineConfig{})
+	eng.RegisterAdapter(newMockSender("p1"))
+	eng.RegisterModels(
+		Model{ID: "c", ProviderID: "p1", Weight: 5, Enabled: true},
+		Model{ID: "a", ProviderID: "p1", Weight: 5, Enabled: true},
+		Model{ID: "b", ProviderID: "p1", Weight: 5, Enabled: true},
+	)
+
+	for i := 0; i < 20; i++ {
+		var ids []string
+		for _, m := range eng.eligibleModels(100, Policy{Mode: "normal"}) {
+			ids = append(ids, m.ID)
+		}
+		if got := strings.Join(ids, ","); got != "a,b,c" {
+			t.Fatalf("run %d: eligible order = %s, want a,b,c", i, got)
+		}
+	}
+
+	eng.UnregisterModel("a")
+	if got := eng.eligibleModels(100, Policy{Mode: "normal"}); len(got) != 2 || got[0].ID != "b" {
+		t.Errorf("expected b first after unregistering a, got %+v", got)
+	}
+}
+
+type skipCounter map[string]int
+
+func (c skipCounter) RecordProviderSkip(providerID, reason string) {
+	c[providerID+":"+reason]++
+}
+
+func TestEligibleModelsMinWeightCutoff(t *testing.T) {
+	eng := NewEngine(EngineConfig{})
+	skips := skipCounter{}
+	eng.SetSkipRecorder(skips)
+	eng.RegisterAdapter(newMockSender("p1"))
+	eng.RegisterModels(
+		Model{ID: "heavy", ProviderID: "p1", Weight: 9, Enabled: true},
+		Model{ID: "edge", ProviderID: "p1", Weight: 7, Enabled: true},
+		Model{ID: "light", ProviderID: "p1", Weight: 3, Enabled: true},
+		Model{ID: "off", ProviderID: "p1", Weight: 1, Enabled: false},
+	)
+
+	got := eng.eligibleModels(100, Policy{Mode: "normal", MinWeight: 7})
+	ids := make([]string, len(got))
+	for i, m := range got {
+		ids[i] = m.ID
+	}
+	if s := strings.Join(ids, ","); s != "heavy,edge" && s != "edge,heavy" {
+		t.Fatalf("eligible = %s, want heavy and edge", s)
+	}
+	if skips["p1:weight_below_minimum"] != 1 || skips["p1:disabled"] != 1 {
+		t.Errorf("skips = %v, want one weight_below_minimum and one disabled", skips)
+	}
+}
+
+func TestEligibleModelsCandidateCacheInvalidatedOnRegistryChange(t *testing.T) {
+	eng := NewEngine(EngineConfig{})
+	eng.RegisterAdapter(newMockSender("p1"))
+	eng.RegisterModel(Model{ID: "small", ProviderID: "p1", Weight: 5, MaxContextTokens: 8000, Enabled: true})
+
+	if got := eng.eligibleModels(10000, Policy{Mode: "normal"}); len(got) != 0 {
+		t.Fatalf("expected no model to fit 10k tokens, got %+v", got)
+	}
+	if len(eng.candidates) != 1 {
+		t.Fatalf("expected the static candidates to be cached, got %d entries", len(eng.candidates))
+	}
+
+	eng.RegisterModel(Model{ID: "large", ProviderID: "p1", Weight: 5, MaxContextTokens: 200000, Enabled: true})
+	got := eng.eligibleModels(10000, Policy{Mode: "normal"})
+	if len(got) != 1 || got[0].ID != "large" {
+		t.Errorf("expected newly registered large model, got %+v", got)
+	}
+}
+
+func TestEligibleModelsCandidateCacheSharedAcrossNearbySizes(t *testing.T) {
+	eng := NewEngine(EngineConfig{})
+	skips := skipCounter{}
+	eng.SetSkipRecorder(skips)
+	eng.RegisterAdapter(newMockSender("p1"))
+	eng.RegisterAdapter(newMockSender("p2"))
+	eng.RegisterModels(
+		Model{ID: "mid", ProviderID: "p1", Weight: 5, MaxContextTokens: 8000, Enabled: true},
+		Model{ID: "tiny", ProviderID: "p2", Weight: 5, MaxContextTokens: 2000, Enabled: true},
+	)
+
+	// With headroom these need 5750, 6900 and 8050 tokens: one context
+	// bucket, so one memoized candidate set.
+	for _, tc := range []struct {
+		tokens int
+		want   int
+	}{{5000, 1}, {6000, 1}, {7000, 0}} {
+		if got := eng.eligibleModels(tc.tokens, Policy{Mode: "normal"}); len(got) != tc.want {
+			t.Errorf("eligibleModels(%d) = %+v, want %d models", tc.tokens, got, tc.want)
+		}
+	}
+	if len(eng.candidates) != 1 {
+		t.Errorf("expected nearby sizes to share one cache entry, got %d", len(eng.candidates))
+	}
+
+	// The cached skip for tiny replays on every request; mid overflows only
+	// at the exact size checked outside the memo.
+	if skips["p2:context_overflow"] != 3 {
+		t.Errorf("p2 context_overflow skips = %d, want 3", skips["p2:context_overflow"])
+	}
+	if skips["p1:context_overflow"] != 1 {
+		t.Errorf("p1 context_overflow skips = %d, want 1", skips["p1:context_overflow"])
+	}
+}
+
+func TestApplyHintBoostKeepsTieOrder(t *testing.T) {
+	eng := NewEngine(EngineConfig{})
+	// More than a dozen entries so sort.Sort would leave insertion sort.
+	eligible := make([]Model, 20)
+	for i := range eligible {
+		eligible[i] = Model{ID: fmt.Sprintf("m%02d", i), ProviderID: "p1", Weight: 5, Enabled: true}
+	}
+	if !eng.applyHintBoost(eligible, "m10", 100, 100, "normal") {
+		t.Fatal("expected hint model to be found")
+	}
+	if eligible[0].ID != "m10" {
+		t.Fatalf("expected boosted model first, got %s", eligible[0].ID)
+	}
+	prev := ""
+	for _, m := range eligible[1:] {
+		if m.ID < prev {
+			t.Fatalf("tied models reordered: %s after %s", m.ID, prev)
+		}
+		prev = m.ID
+	}
+}
+
+func TestDispatchFollowsRegistry(t *testing.T) {
+	eng := NewEngine(EngineConfig{})
+	eng.RegisterAdapter(newMockSender("p1"))
+	eng.RegisterAdapter(newMockSender("idle"))
+	eng.RegisterModel(Model{ID: "m1", ProviderID: "p1", Weight: 5, Enabled: true})
+
+	if _, ok := eng.dispatch["p1"]; !ok || len(eng.dispatch) != 1 {
+		t.Fatalf("expected dispatch to hold only p1, got %v", eng.dispatch)
+	}
+
+	before := eng.dispatch
+	eng.UnregisterAdapter("p1")
+	if _, ok := eng.dispatch["p1"]; ok {
+		t.Error("expected p1 dropped from dispatch after UnregisterAdapter")
+	}
+	if _, ok := before["p1"]; !ok {
+		t.Error("an earlier dispatch snapshot must not be modified")
+	}
+}
+
+type mockRawSender struct{ *mockSender }
+
+func (mockRawSender) ForwardRaw(context.Context, []byte) ([]byte, int, error) { return nil, 0, nil }
+func (mockRawSender) ForwardRawStream(context.Context, []byte) (io.ReadCloser, error) {
+	return nil, nil
+}
+
+func TestGetAnthropicSenderAndModel(t *testing.T) {
+	eng := NewEngine(EngineConfig{})
+	eng.RegisterAdapter(newMockSender("plain"))
+	eng.RegisterAdapter(mockRawSender{newMockSender("azure")})
+	eng.RegisterModels(
+		Model{ID: "gpt", ProviderID: "plain", Weight: 9, Enabled: true},
+		Model{ID: "azure/anthropic/claude-sonnet-4-6", ProviderID: "azure", Weight: 5, Enabled: true},
+		Model{ID: "azure/anthropic/claude-haiku", ProviderID: "azure", Weight: 7, Enabled: true},
+		Model{ID: "azure/off", ProviderID: "azure", Weight: 10, Enabled: false},
+	)
+
+	cases := []struct{ hint, want string }{
+		{"azure/anthropic/claude-haiku", "azure/anthropic/claude-haiku"}, // exact
+		{"claude-sonnet-4-6", "azure/anthropic/claude-sonnet-4-6"},       // suffix
+		{"gpt", "azure/anthropic/claude-haiku"},                          // no raw adapter: heaviest raw model
+		{"unknown", "azure/anthropic/claude-haiku"},                      // fallback skips disabled azure/off
+		{"azure/off", ""}, // disabled exact match
+	}
+	for _, tc := range cases {
+		s, got := eng.GetAnthropicSenderAndModel(tc.hint)
+		if got != tc.want || (tc.want != "") != (s != nil) {
+			t.Errorf("hint %q: got (%v, %q), want model %q", tc.hint, s, got, tc.want)
+		}
+	}
+
+	eng.UnregisterAdapter("azure")
+	if s, got := eng.GetAnthropicSenderAndModel("claude-sonnet-4-6"); s != nil || got != "" {
+		t.Errorf("expected no sender after removing the raw adapter, got (%v, %q)", s, got)
+	}
+}
+
+func TestLastResortModelsHeaviestFirst(t *testing.T) {
+	eng := NewEngine(EngineConfig{})
+	eng.RegisterAdapter(newMockSender("p1"))
+	eng.RegisterModels(
+		Model{ID: "light", ProviderID: "p1", Weight: 2, Enabled: true},
+		Model{ID: "heavy", ProviderID: "p1", Weight: 9, Enabled: true},
+		Model{ID: "mid", ProviderID: "p1", Weight: 5, Enabled: true},
+		Model{ID: "tried", ProviderID: "p1", Weight: 7, Enabled: true},
+		Model{ID: "off", ProviderID: "p1", Weight: 8, Enabled: false},
+		Model{ID: "orphan", ProviderID: "gone", Weight: 10, Enabled: true},
+	)
+
+	ids := func(ms []Model) string {
+		var out []string
+		for _, m := range ms {
+			out = append(out, m.ID)
+		}
+		return strings.Join(out, ",")
+	}
+
+	eng.mu.RLock()
+	defer eng.mu.RUnlock()
+	if got := ids(eng.lastResortModelsLocked(nil, map[string]bool{"tried": true})); got != "heavy,mid,light" {
+		t.Errorf("last resort = %s, want heavy,mid,light", got)
+	}
+	if got := ids(eng.lastResortModelsLocked(map[string]bool{"light": true, "mid": true}, nil)); got != "mid,light" {
+		t.Errorf("pooled last resort = %s, want mid,light", got)
+	}
+}
+
+func TestAvailableModelIDCacheInvalidatedOnRegistryChange(t *testing.T) {
+	eng := NewEngine(EngineConfig{})
+	eng.RegisterModel(Model{ID: "azure/gpt-5.5", ProviderID: "azure", Enabled: true})
+
+	lookup := func() (string, bool) {
+		eng.mu.RLock()
+		defer eng.mu.RUnlock()
+		return eng.availableModelIDLocked("gpt-5.5")
+	}
+
+	if id, ok := lookup(); ok {
+		t.Fatalf("expected no match without an adapter, got %q", id)
+	}
+	// A cached miss must not survive the adapter being registered.
+	eng.RegisterAdapter(newMockSender("azure"))
+	if id, ok := lookup(); !ok || id != "azure/gpt-5.5" {
+		t.Fatalf("expected azure/gpt-5.5 after adapter registration, got %q ok=%v", id, ok)
+	}
+	// An exact registration takes precedence over the suffix match.
+	eng.RegisterModel(Model{ID: "gpt-5.5", ProviderID: "azure", Enabled: true})
+	if id, _ := lookup(); id != "gpt-5.5" {
+		t.Fatalf("expected exact gpt-5.5 after registration, got %q", id)
+	}
+	eng.disableModel("gpt-5.5")
+	if id, _ := lookup(); id != "azure/gpt-5.5" {
+		t.Fatalf("expected fallback to azure/gpt-5.5 after disabling, got %q", id)
+	}
+}
+
 func TestEscalationRateLimited(t *testing.T) {
 	eng := NewEngine(EngineConfig{})
 	mock1 := newMockSender("p1")
@@ -563,18 +882,20 @@ func TestScoreModels(t *testing.T) {
 		{ID: "cheapo", Weight: 3, InputPer1K: 0.001, OutputPer1K: 0.003},
 	}
 
+	const expensive, cheapo = 0, 1
+
 	scores := eng.scoreModels(models, 100, 512, "cheap")
 	// In cheap mode, cost is heavily weighted. Cheapo should have lower score.
-	if scores["cheapo"] >= scores["expensive"] {
+	if scores[cheapo] >= scores[expensive] {
 		t.Errorf("cheap mode: cheapo score (%.4f) should be lower than expensive (%.4f)",
-			scores["cheapo"], scores["expensive"])
+			scores[cheapo], scores[expensive])
 	}
 
 	scores2 := eng.scoreModels(models, 100, 512, "high_confidence")
 	// In high_confidence mode, weight is heavily weighted. Expensive (weight=10) should win.
-	if scores2["expensive"] >= scores2["cheapo"] {
+	if scores2[expensive] >= scores2[cheapo] {
 		t.Errorf("high_confidence mode: expensive score (%.4f) should be lower than cheapo (%.4f)",
-			scores2["expensive"], scores2["cheapo"])
+			scores2[expensive], scores2[cheapo])
 	}
 }
 
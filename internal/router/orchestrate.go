@@ -6,19 +6,26 @@ import (
 	"errors"
 	"fmt"
 	"log/slog"
+	"strconv"
 	"strings"
 	"sync"
 )
 
 // sendToModel sends a request to a specific model by ID. Returns an error if
 // the model is not found, not enabled, or the adapter is missing.
+//
+// The registry lookups are snapshotted under the read lock and the lock is
+// released before the provider call, so orchestration phases (and the
+// concurrent vote fan-out) never hold it across a network round trip.
 func (e *Engine) sendToModel(ctx context.Context, modelID string, req Request) (Decision, ProviderResponse, error) {
+	e.mu.RLock()
 	m, ok := e.models[modelID]
+	adapter, hasAdapter := e.adapters[m.ProviderID]
+	e.mu.RUnlock()
 	if !ok || !m.Enabled {
 		return Decision{}, nil, fmt.Errorf("model %q not found or disabled", modelID)
 	}
-	adapter, ok := e.adapters[m.ProviderID]
-	if !ok {
+	if !hasAdapter {
 		return Decision{}, nil, fmt.Errorf("no adapter for provider %q", m.ProviderID)
 	}
 	tokens := EstimateTokens(req)
@@ -62,11 +69,14 @@ func (e *Engine) adversarial(ctx context.Context, req Request, d OrchestrationDi
 		iterations = 1
 	}
 
+	// The user's text is embedded in every phase's prompt; flatten it once.
+	original := MessagesContent(req.Messages)
+
 	// Phase 1: Model A generates plan.
 	planReq := Request{
 		Messages: []Message{
-			{Role: "system", Content: "You are a planning assistant. Generate a detailed plan to address the user's request."},
-			{Role: "user", Content: MessagesContent(req.Messages)},
+			{Role: "system", Content: PlannerSystemPrompt},
+			{Role: "user", Content: original},
 		},
 	}
 	var planDec Decision
@@ -117,8 +127,8 @@ func (e *Engine) adversarial(ctx context.Context, req Request, d OrchestrationDi
 		// Phase 2: Model B critiques the plan.
 		critiqueReq := Request{
 			Messages: []Message{
-				{Role: "system", Content: "You are a critical reviewer. Analyze the plan below and provide constructive criticism."},
-				{Role: "user", Content: fmt.Sprintf("Original request: %s\n\nProposed plan:\n%s\n\nProvide your critique:", MessagesContent(req.Messages), plan)},
+				{Role: "system", Content: CriticSystemPrompt},
+				{Role: "user", Content: CritiquePrompt(original, plan)},
 			},
 		}
 		var critiqueResp ProviderResponse
@@ -147,8 +157,8 @@ func (e *Engine) adversarial(ctx context.Context, req Request, d OrchestrationDi
 		// Phase 3: Model A refines based on critique.
 		refineReq := Request{
 			Messages: []Message{
-				{Role: "system", Content: "You are a planning assistant. Refine your plan based on the critique provided."},
-				{Role: "user", Content: fmt.Sprintf("Original request: %s\n\nYour plan:\n%s\n\nCritique:\n%s\n\nProvide a refined plan:", MessagesContent(req.Messages), plan, critique)},
+				{Role: "system", Content: RefinePlanSystemPrompt},
+				{Role: "user", Content: RefinePlanPrompt(original, plan, critique)},
 			},
 		}
 		var dec Decision
@@ -210,12 +220,7 @@ func (e *Engine) vote(ctx context.Context, req Request, d OrchestrationDirective
 	}
 	eligible := e.eligibleModels(tokensNeeded, voterPolicy)
 	// Snapshot adapters for eligible models before releasing the lock.
-	voteAdapters := make(map[string]Sender, len(eligible))
-	for _, m := range eligible {
-		if a, ok := e.adapters[m.ProviderID]; ok {
-			voteAdapters[m.ProviderID] = a
-		}
-	}
+	voteAdapters := e.dispatch
 	e.mu.RUnlock()
 
 	// Exclude the explicit judge from voters to avoid duplication.
@@ -307,15 +312,15 @@ func (e *Engine) vote(ctx context.Context, req Request, d OrchestrationDirective
 	}
 
 	// Build judge prompt.
-	var responseSummary string
+	var responseSummary strings.Builder
 	for i, r := range results {
-		responseSummary += fmt.Sprintf("\n--- Response %d (model: %s) ---\n%s\n", i+1, r.modelID, r.content)
+		WriteJudgeCandidate(&responseSummary, i+1, r.modelID, r.content)
 	}
 
 	judgeReq := Request{
 		Messages: []Message{
-			{Role: "system", Content: "You are a judge. Given multiple AI responses to the same prompt, select the best one. Reply with ONLY the number (1-based) of the best response."},
-			{Role: "user", Content: fmt.Sprintf("Original prompt: %s\n\nResponses:%s\n\nWhich response number is best?", MessagesContent(req.Messages), responseSummary)},
+			{Role: "system", Content: JudgeSystemPrompt},
+			{Role: "user", Content: JudgePrompt(MessagesContent(req.Messages), responseSummary.String())},
 		},
 	}
 	var judgeDec Decision
@@ -345,7 +350,7 @@ func (e *Engine) vote(ctx context.Context, req Request, d OrchestrationDirective
 	if err == nil {
 		judgeContent := ExtractContent(judgeResp)
 		for i := len(results); i >= 1; i-- {
-			if strings.Contains(judgeContent, fmt.Sprintf("%d", i)) {
+			if strings.Contains(judgeContent, strconv.Itoa(i)) {
 				selectedIdx = i - 1
 				break
 			}
@@ -413,6 +418,7 @@ func (e *Engine) refine(ctx context.Context, req Request, d OrchestrationDirecti
 	}
 
 	currentContent := ExtractContent(initialResp)
+	original := MessagesContent(req.Messages)
 	lastDec := initialDec
 	totalCost := initialDec.EstimatedCostUSD
 
@@ -423,8 +429,8 @@ func (e *Engine) refine(ctx context.Context, req Request, d OrchestrationDirecti
 	for i := 0; i < iterations; i++ {
 		refineReq := Request{
 			Messages: []Message{
-				{Role: "system", Content: "Review and improve the following response. Fix any errors, add missing details, and improve clarity."},
-				{Role: "user", Content: fmt.Sprintf("Original request: %s\n\nCurrent response:\n%s\n\nProvide an improved version:", MessagesContent(req.Messages), currentContent)},
+				{Role: "system", Content: ImproveSystemPrompt},
+				{Role: "user", Content: ImprovePrompt(original, currentContent)},
 			},
 		}
 
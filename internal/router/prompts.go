@@ -0,0 +1,52 @@
+package router
+
+import (
+	"strconv"
+	"strings"
+)
+
+// System prompts for the orchestration phases. The Temporal workflows send
+// the same prompts as the engine, so both take them from here.
+const (
+	PlannerSystemPrompt    = "You are a planning assistant. Generate a detailed plan to address the user's request."
+	CriticSystemPrompt     = "You are a critical reviewer. Analyze the plan below and provide constructive criticism."
+	RefinePlanSystemPrompt = "You are a planning assistant. Refine your plan based on the critique provided."
+	JudgeSystemPrompt      = "You are a judge. Given multiple AI responses to the same prompt, select the best one. Reply with ONLY the number (1-based) of the best response."
+	ImproveSystemPrompt    = "Review and improve the following response. Fix any errors, add missing details, and improve clarity."
+)
+
+// The user-turn prompts below are built by plain concatenation, which Go
+// compiles to a single allocation, rather than by format-string parsing on
+// every orchestration phase.
+
+// CritiquePrompt is the reviewer's user turn in the adversarial critique phase.
+func CritiquePrompt(original, plan string) string {
+	return "Original request: " + original + "\n\nProposed plan:\n" + plan + "\n\nProvide your critique:"
+}
+
+// RefinePlanPrompt is the planner's user turn in the adversarial refine phase.
+func RefinePlanPrompt(original, plan, critique string) string {
+	return "Original request: " + original + "\n\nYour plan:\n" + plan + "\n\nCritique:\n" + critique + "\n\nProvide a refined plan:"
+}
+
+// ImprovePrompt is the user turn for each refine-mode iteration.
+func ImprovePrompt(original, current string) string {
+	return "Original request: " + original + "\n\nCurrent response:\n" + current + "\n\nProvide an improved version:"
+}
+
+// WriteJudgeCandidate appends the n-th (1-based) vote response to the
+// candidate list passed to JudgePrompt.
+func WriteJudgeCandidate(sb *strings.Builder, n int, modelID, content string) {
+	sb.WriteString("\n--- Response ")
+	sb.WriteString(strconv.Itoa(n))
+	sb.WriteString(" (model: ")
+	sb.WriteString(modelID)
+	sb.WriteString(") ---\n")
+	sb.WriteString(content)
+	sb.WriteByte('\n')
+}
+
+// JudgePrompt is the judge's user turn in vote mode.
+func JudgePrompt(original, candidates string) string {
+	return "Original prompt: " + original + "\n\nResponses:" + candidates + "\n\nWhich response number is best?"
+}
@@ -0,0 +1,35 @@
+package router
+
+import (
+	"fmt"
+	"strings"
+	"testing"
+)
+
+func TestPromptsMatchFormattedText(t *testing.T) {
+	if got, want := CritiquePrompt("req", "plan"),
+		fmt.Sprintf("Original request: %s\n\nProposed plan:\n%s\n\nProvide your critique:", "req", "plan"); got != want {
+		t.Errorf("CritiquePrompt = %q, want %q", got, want)
+	}
+	if got, want := RefinePlanPrompt("req", "plan", "crit"),
+		fmt.Sprintf("Original request: %s\n\nYour plan:\n%s\n\nCritique:\n%s\n\nProvide a refined plan:", "req", "plan", "crit"); got != want {
+		t.Errorf("RefinePlanPrompt = %q, want %q", got, want)
+	}
+	if got, want := ImprovePrompt("req", "cur"),
+		fmt.Sprintf("Original request: %s\n\nCurrent response:\n%s\n\nProvide an improved version:", "req", "cur"); got != want {
+		t.Errorf("ImprovePrompt = %q, want %q", got, want)
+	}
+
+	var sb strings.Builder
+	WriteJudgeCandidate(&sb, 1, "m1", "a")
+	WriteJudgeCandidate(&sb, 2, "m2", "b")
+	summary := fmt.Sprintf("\n--- Response %d (model: %s) ---\n%s\n", 1, "m1", "a") +
+		fmt.Sprintf("\n--- Response %d (model: %s) ---\n%s\n", 2, "m2", "b")
+	if sb.String() != summary {
+		t.Errorf("judge candidates = %q, want %q", sb.String(), summary)
+	}
+	if got, want := JudgePrompt("req", sb.String()),
+		fmt.Sprintf("Original prompt: %s\n\nResponses:%s\n\nWhich response number is best?", "req", summary); got != want {
+		t.Errorf("JudgePrompt = %q, want %q", got, want)
+	}
+}
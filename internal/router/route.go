@@ -6,6 +6,7 @@ import (
 	"fmt"
 	"log/slog"
 	"math/rand"
+	"sort"
 	"time"
 )
 
@@ -37,43 +38,48 @@ func (e *Engine) FindLargerContextModel(current Model, tokensNeeded int) *Model
 
 // findLargerContextModel finds the smallest model with context larger than needed.
 func (e *Engine) findLargerContextModel(current Model, tokensNeeded int) *Model {
-	var best *Model
-	for _, m := range e.models {
+	return findLargerContextModelIn(e.byContext, e.adapters, current, tokensNeeded)
+}
+
+// findLargerContextModelIn finds the smallest model with context larger than needed
+// from a snapshot of the context-ordered model index and an adapter map.
+func findLargerContextModelIn(byContext []Model, adapters map[string]Sender, current Model, tokensNeeded int) *Model {
+	minTokens := tokensNeeded
+	if current.MaxContextTokens >= minTokens {
+		minTokens = current.MaxContextTokens + 1
+	}
+	i := sort.Search(len(byContext), func(i int) bool {
+		return byContext[i].MaxContextTokens >= minTokens
+	})
+	for ; i < len(byContext); i++ {
+		m := byContext[i]
 		if !m.Enabled || m.ID == current.ID {
 			continue
 		}
-		if _, ok := e.adapters[m.ProviderID]; !ok {
+		if _, ok := adapters[m.ProviderID]; !ok {
 			continue
 		}
-		if m.MaxContextTokens >= tokensNeeded && m.MaxContextTokens > current.MaxContextTokens {
-			if best == nil || m.MaxContextTokens < best.MaxContextTokens {
-				cp := m
-				best = &cp
-			}
-		}
+		return &m
 	}
-	return best
+	return nil
 }
 
-// findLargerContextModelIn finds the smallest model with context larger than needed
-// from a pre-snapshotted model map and adapter map.
-func findLargerContextModelIn(models map[string]Model, adapters map[string]Sender, current Model, tokensNeeded int) *Model {
-	var best *Model
-	for _, m := range models {
-		if !m.Enabled || m.ID == current.ID {
+// lastResortModelsLocked returns the enabled models with a registered adapter
+// that are in pool (when non-nil) and not in tried, heaviest first. It walks
+// the presorted weight index rather than the model map, so fallback order is
+// deterministic and ranks candidates the way the primary pass does. The
+// matching adapters are in e.dispatch. Caller must hold e.mu.
+func (e *Engine) lastResortModelsLocked(pool, tried map[string]bool) []Model {
+	var out []Model
+	for _, m := range e.byWeight {
+		if !m.Enabled || tried[m.ID] || (pool != nil && !pool[m.ID]) {
 			continue
 		}
-		if _, ok := adapters[m.ProviderID]; !ok {
-			continue
-		}
-		if m.MaxContextTokens >= tokensNeeded && m.MaxContextTokens > current.MaxContextTokens {
-			if best == nil || m.MaxContextTokens < best.MaxContextTokens {
-				cp := m
-				best = &cp
-			}
+		if _, ok := e.dispatch[m.ProviderID]; ok {
+			out = append(out, m)
 		}
 	}
-	return best
+	return out
 }
 
 // shrinkMaxTokens returns a copy of req with the "max_tokens" parameter reduced
@@ -227,12 +233,7 @@ func (e *Engine) hedgedSend(
 					slog.String("provider", result.model.ProviderID),
 					slog.String("model", result.model.ID),
 				)
-				e.mu.Lock()
-				if mod, ok := e.models[result.model.ID]; ok {
-					mod.Enabled = false
-					e.models[result.model.ID] = mod
-				}
-				e.mu.Unlock()
+				e.disableModel(result.model.ID)
 			}
 			lastErr = result.err
 			slog.Warn("hedged provider failed",
@@ -287,16 +288,7 @@ func (e *Engine) RouteAndSend(ctx context.Context, req Request, p Policy) (Decis
 		// before surfacing an error to the client. The health tracker is a routing
 		// preference, not a hard constraint; clients should never see a 502 simply
 		// because an internal cooldown window is active.
-		for _, m := range e.models {
-			if wildcardPool != nil && !wildcardPool[m.ID] {
-				continue
-			}
-			if m.Enabled {
-				if _, ok := e.adapters[m.ProviderID]; ok {
-					eligible = append(eligible, m)
-				}
-			}
-		}
+		eligible = e.lastResortModelsLocked(wildcardPool, nil)
 		if len(eligible) == 0 {
 			e.mu.RUnlock()
 			return Decision{}, nil, errors.New("no eligible models registered")
@@ -325,20 +317,12 @@ func (e *Engine) RouteAndSend(ctx context.Context, req Request, p Policy) (Decis
 		// No exact match — fall back to probabilistic hint boost.
 		e.applyHintBoost(eligible, req.ModelHint, tokensNeeded, outTok, p.Mode)
 	}
-	// Snapshot adapters for all eligible providers plus the full model map for escalation.
-	adapters := make(map[string]Sender, len(eligible))
-	for _, m := range eligible {
-		if a, ok := e.adapters[m.ProviderID]; ok {
-			adapters[m.ProviderID] = a
-		}
-	}
-	modelSnap := make(map[string]Model, len(e.models))
-	for id, m := range e.models {
-		modelSnap[id] = m
-		if a, ok := e.adapters[m.ProviderID]; ok {
-			adapters[m.ProviderID] = a // also include escalation targets
-		}
-	}
+	// Snapshot the adapters for every registered model's provider (eligible
+	// models and escalation targets alike) plus the context-ordered model
+	// index for escalation. Both are immutable, so keeping the references is
+	// enough; no per-request copy is needed.
+	adapters := e.dispatch
+	byContext := e.byContext
 	e.mu.RUnlock()
 
 	// Track which model IDs were attempted in the primary pass so the fallback
@@ -481,7 +465,7 @@ func (e *Engine) RouteAndSend(ctx context.Context, req Request, p Policy) (Decis
 				// Step 2: escalate to a model with a larger context window.
 				var larger *Model
 				if wildcardPool == nil {
-					larger = findLargerContextModelIn(modelSnap, adapters, m, tokensNeeded*2)
+					larger = findLargerContextModelIn(byContext, adapters, m, tokensNeeded*2)
 				}
 				if larger != nil {
 					slog.Info("escalating on context overflow",
@@ -538,12 +522,7 @@ func (e *Engine) RouteAndSend(ctx context.Context, req Request, p Policy) (Decis
 					slog.String("provider", m.ProviderID),
 					slog.String("model", m.ID),
 				)
-				e.mu.Lock()
-				if mod, ok := e.models[m.ID]; ok {
-					mod.Enabled = false
-					e.models[m.ID] = mod
-				}
-				e.mu.Unlock()
+				e.disableModel(m.ID)
 				continue
 
 			case ErrFatal:
@@ -559,22 +538,8 @@ func (e *Engine) RouteAndSend(ctx context.Context, req Request, p Policy) (Decis
 	// not receive a 502 due to internal routing preferences — only surface an
 	// error when there is genuinely no provider that can serve the request.
 	e.mu.RLock()
-	var lastResort []Model
-	var lrAdapters map[string]Sender
-	for _, m := range e.models {
-		if wildcardPool != nil && !wildcardPool[m.ID] {
-			continue
-		}
-		if !tried[m.ID] && m.Enabled {
-			if a, ok := e.adapters[m.ProviderID]; ok {
-				lastResort = append(lastResort, m)
-				if lrAdapters == nil {
-					lrAdapters = make(map[string]Sender)
-				}
-				lrAdapters[m.ProviderID] = a
-			}
-		}
-	}
+	lastResort := e.lastResortModelsLocked(wildcardPool, tried)
+	lrAdapters := e.dispatch
 	e.mu.RUnlock()
 
 	for _, m := range lastResort {
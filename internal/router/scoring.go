@@ -5,6 +5,7 @@ import (
 	"errors"
 	"fmt"
 	"math"
+	"math/bits"
 	"math/rand"
 	"sort"
 )
@@ -37,26 +38,22 @@ func (e *Engine) eligibleModels(tokensNeeded int, p Policy) []Model {
 
 	outTok := estOutTokens(p)
 
-	var eligible []Model
-	for _, m := range e.models {
-		if !m.Enabled {
-			skip(m.ProviderID, "disabled")
-			continue
-		}
-		if p.MinWeight > 0 && m.Weight < p.MinWeight {
-			skip(m.ProviderID, "weight_below_minimum")
-			continue
-		}
-		// Reserve 15% headroom for context estimation.
-		contextWithHeadroom := int(float64(tokensNeeded) * 1.15)
-		if m.MaxContextTokens > 0 && contextWithHeadroom > 0 && contextWithHeadroom > m.MaxContextTokens {
+	// Reserve 15% headroom for context estimation.
+	contextWithHeadroom := int(float64(tokensNeeded) * 1.15)
+
+	static := e.staticCandidatesLocked(contextWithHeadroom, p.MinWeight)
+	for _, sk := range static.skips {
+		skip(sk.providerID, sk.reason)
+	}
+
+	eligible := make([]Model, 0, len(static.models))
+	for _, m := range static.models {
+		// The memo only drops models too small for every request in the
+		// context bucket; the exact size is checked here.
+		if m.MaxContextTokens > 0 && contextWithHeadroom > m.MaxContextTokens {
 			skip(m.ProviderID, "context_overflow")
 			continue
 		}
-		if _, ok := e.adapters[m.ProviderID]; !ok {
-			skip(m.ProviderID, "no_adapter")
-			continue // skip models without a registered adapter
-		}
 		if e.health != nil && !e.health.IsAvailable(m.ProviderID) {
 			skip(m.ProviderID, "health_down")
 			continue // skip providers in cooldown
@@ -90,84 +87,174 @@ func (e *Engine) eligibleModels(tokensNeeded int, p Policy) []Model {
 		return eligible
 	}
 
-	// Sort by multi-objective score (lower is better).
-	scores := e.scoreModels(eligible, tokensNeeded, outTok, p.Mode)
-	sort.Slice(eligible, func(i, j int) bool {
-		return scores[eligible[i].ID] < scores[eligible[j].ID]
-	})
+	// Sort by multi-objective score (lower is better). The sort is stable
+	// so ties keep byWeight's order.
+	sort.Stable(byScore{eligible, e.scoreModels(eligible, tokensNeeded, outTok, p.Mode)})
 	return eligible
 }
 
+// staticCandidatesLocked returns the models that pass the registry-only
+// eligibility checks (enabled, MinWeight, adapter) in byWeight order, along
+// with the skips those checks produced. The result depends only on the
+// registry, so it is memoized until the next mutation. The memo is keyed by
+// the bit length of contextWithHeadroom rather than the exact size, so
+// requests of similar size share an entry: models whose window is smaller
+// than the bucket's lower bound are skipped here, and eligibleModels checks
+// the exact size, health and budget on what remains. Callers must hold e.mu
+// and must not modify the returned slices.
+func (e *Engine) staticCandidatesLocked(contextWithHeadroom, minWeight int) candidateSet {
+	bucket := 0
+	if contextWithHeadroom > 0 {
+		bucket = bits.Len(uint(contextWithHeadroom))
+	}
+	key := candidateKey{contextBucket: bucket, minWeight: minWeight}
+
+	e.candidatesMu.Lock()
+	if c, ok := e.candidates[key]; ok {
+		e.candidatesMu.Unlock()
+		return c
+	}
+	e.candidatesMu.Unlock()
+
+	// Every request in the bucket needs at least minContext tokens.
+	minContext := 0
+	if bucket > 0 {
+		minContext = 1 << (bucket - 1)
+	}
+
+	// byWeight is ordered heaviest first, so every model below MinWeight
+	// sits past a single cutoff. Only the prefix needs the full checks.
+	models, below := e.byWeight, []Model(nil)
+	if minWeight > 0 {
+		cut := sort.Search(len(models), func(i int) bool {
+			return models[i].Weight < minWeight
+		})
+		models, below = models[:cut], models[cut:]
+	}
+
+	var c candidateSet
+	for _, m := range models {
+		if !m.Enabled {
+			c.skips = append(c.skips, providerSkip{m.ProviderID, "disabled"})
+			continue
+		}
+		if m.MaxContextTokens > 0 && minContext > m.MaxContextTokens {
+			c.skips = append(c.skips, providerSkip{m.ProviderID, "context_overflow"})
+			continue
+		}
+		if _, ok := e.adapters[m.ProviderID]; !ok {
+			c.skips = append(c.skips, providerSkip{m.ProviderID, "no_adapter"})
+			continue // skip models without a registered adapter
+		}
+		c.models = append(c.models, m)
+	}
+	for _, m := range below {
+		if !m.Enabled {
+			c.skips = append(c.skips, providerSkip{m.ProviderID, "disabled"})
+		} else {
+			c.skips = append(c.skips, providerSkip{m.ProviderID, "weight_below_minimum"})
+		}
+	}
+
+	e.candidatesMu.Lock()
+	if e.candidates == nil || len(e.candidates) >= candidateCacheSize {
+		e.candidates = make(map[candidateKey]candidateSet)
+	}
+	e.candidates[key] = c
+	e.candidatesMu.Unlock()
+	return c
+}
+
 // applyHintBoost boosts the hinted model's weight by +3 (capped at 10), re-scores,
-// and re-sorts eligible in place. Returns true if the hint model was found.
+// and re-sorts eligible in place, keeping the existing order among ties.
+// Returns true if the hint model was found.
 func (e *Engine) applyHintBoost(eligible []Model, hintID string, tokensNeeded, outTokens int, mode string) bool {
 	for i := range eligible {
 		if eligible[i].ID == hintID {
 			eligible[i].Weight = min(10, eligible[i].Weight+3)
-			scores := e.scoreModels(eligible, tokensNeeded, outTokens, mode)
-			sort.Slice(eligible, func(a, b int) bool {
-				return scores[eligible[a].ID] < scores[eligible[b].ID]
-			})
+			sort.Stable(byScore{eligible, e.scoreModels(eligible, tokensNeeded, outTokens, mode)})
 			return true
 		}
 	}
 	return false
 }
 
-// scoreModels computes a multi-objective score for each eligible model.
-// Lower score = better model for the given routing mode.
-func (e *Engine) scoreModels(models []Model, tokensNeeded, outTokens int, mode string) map[string]float64 {
-	w := modeWeightProfiles["normal"]
-	if mw, ok := modeWeightProfiles[mode]; ok {
-		w = mw
+// scoreModels computes a multi-objective score for each eligible model;
+// scores[i] belongs to models[i]. Lower score = better model for the given
+// routing mode.
+func (e *Engine) scoreModels(models []Model, tokensNeeded, outTokens int, mode string) []float64 {
+	w, ok := modeWeightProfiles[mode]
+	if !ok {
+		w = modeWeightProfiles["normal"]
 	}
 
-	// Compute raw values for normalization.
+	// Gather each model's raw cost and provider stats in a single pass so
+	// every value is computed (and every stats lookup made) exactly once,
+	// then normalize against the maxima.
 	var maxCost, maxWeight float64
 	var maxLatency, maxFailure float64
 
 	// Get stats provider if available.
 	sp, hasStats := e.health.(StatsProvider)
 
-	for _, m := range models {
-		cost := estimateCostUSD(tokensNeeded, outTokens, m.InputPer1K, m.OutputPer1K)
-		if cost > maxCost {
-			maxCost = cost
+	raw := make([]rawModelScore, len(models))
+	for i, m := range models {
+		r := &raw[i]
+		r.cost = estimateCostUSD(tokensNeeded, outTokens, m.InputPer1K, m.OutputPer1K)
+		if r.cost > maxCost {
+			maxCost = r.cost
 		}
 		if float64(m.Weight) > maxWeight {
 			maxWeight = float64(m.Weight)
 		}
 		if hasStats {
-			lat := sp.GetAvgLatencyMs(m.ProviderID)
-			if lat > maxLatency {
-				maxLatency = lat
+			r.latency = sp.GetAvgLatencyMs(m.ProviderID)
+			if r.latency > maxLatency {
+				maxLatency = r.latency
 			}
-			fail := sp.GetErrorRate(m.ProviderID)
-			if fail > maxFailure {
-				maxFailure = fail
+			r.failure = sp.GetErrorRate(m.ProviderID)
+			if r.failure > maxFailure {
+				maxFailure = r.failure
 			}
 		}
 	}
 
-	scores := make(map[string]float64, len(models))
-	for _, m := range models {
-		cost := estimateCostUSD(tokensNeeded, outTokens, m.InputPer1K, m.OutputPer1K)
-		normCost := safeNorm(cost, maxCost)
+	scores := make([]float64, len(models))
+	for i, m := range models {
+		r := raw[i]
+		normCost := safeNorm(r.cost, maxCost)
 		normWeight := safeNorm(float64(m.Weight), maxWeight)
-
-		var normLatency, normFailure float64
-		if hasStats {
-			normLatency = safeNorm(sp.GetAvgLatencyMs(m.ProviderID), maxLatency)
-			normFailure = safeNorm(sp.GetErrorRate(m.ProviderID), maxFailure)
-		}
+		normLatency := safeNorm(r.latency, maxLatency)
+		normFailure := safeNorm(r.failure, maxFailure)
 
 		// Lower score is better. Weight is subtracted (higher weight = better).
-		score := w.Cost*normCost + w.Latency*normLatency + w.Failure*normFailure - w.Weight*normWeight
-		scores[m.ID] = score
+		scores[i] = w.Cost*normCost + w.Latency*normLatency + w.Failure*normFailure - w.Weight*normWeight
 	}
 	return scores
 }
 
+// byScore sorts models by their parallel scores, lowest first. Keeping the
+// scores in a slice beside the models lets the comparator index rather than
+// hash each model ID on every comparison.
+type byScore struct {
+	models []Model
+	scores []float64
+}
+
+func (s byScore) Len() int           { return len(s.models) }
+func (s byScore) Less(i, j int) bool { return s.scores[i] < s.scores[j] }
+func (s byScore) Swap(i, j int) {
+	s.models[i], s.models[j] = s.models[j], s.models[i]
+	s.scores[i], s.scores[j] = s.scores[j], s.scores[i]
+}
+
+// rawModelScore holds the un-normalized inputs to a model's routing score.
+type rawModelScore struct {
+	cost    float64
+	latency float64
+	failure float64
+}
+
 func safeNorm(v, max float64) float64 {
 	if max <= 0 {
 		return 0
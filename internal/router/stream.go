@@ -36,23 +36,9 @@ func (e *Engine) RouteAndStream(ctx context.Context, req Request, p Policy) (Dec
 		// SelectModel failed because eligibleModels returned empty. Attempt
 		// last-resort routing over all enabled models before surfacing the error.
 		e.mu.RLock()
-		var candidates []Model
-		var lrAdapters map[string]Sender
+		candidates := e.lastResortModelsLocked(wildcardPool, nil)
+		lrAdapters := e.dispatch
 		tokensNeeded := EstimateTokens(req)
-		for _, m := range e.models {
-			if wildcardPool != nil && !wildcardPool[m.ID] {
-				continue
-			}
-			if m.Enabled {
-				if a, ok := e.adapters[m.ProviderID]; ok {
-					candidates = append(candidates, m)
-					if lrAdapters == nil {
-						lrAdapters = make(map[string]Sender)
-					}
-					lrAdapters[m.ProviderID] = a
-				}
-			}
-		}
 		outTok := estOutTokens(p)
 		e.mu.RUnlock()
 
@@ -83,12 +69,7 @@ func (e *Engine) RouteAndStream(ctx context.Context, req Request, p Policy) (Dec
 					e.health.RecordError(m.ProviderID, serr.Error())
 				}
 				if fc := a.ClassifyError(serr); fc.Class == ErrBudgetExceeded {
-					e.mu.Lock()
-					if mod, ok := e.models[m.ID]; ok {
-						mod.Enabled = false
-						e.models[m.ID] = mod
-					}
-					e.mu.Unlock()
+					e.disableModel(m.ID)
 				}
 			}
 		}
@@ -124,12 +105,7 @@ func (e *Engine) RouteAndStream(ctx context.Context, req Request, p Policy) (Dec
 			slog.String("provider", decision.ProviderID),
 			slog.String("model", decision.ModelID),
 		)
-		e.mu.Lock()
-		if mod, ok := e.models[decision.ModelID]; ok {
-			mod.Enabled = false
-			e.models[decision.ModelID] = mod
-		}
-		e.mu.Unlock()
+		e.disableModel(decision.ModelID)
 	}
 
 	// Try remaining eligible models (those returned by SelectModel).
@@ -163,36 +139,17 @@ func (e *Engine) RouteAndStream(ctx context.Context, req Request, p Policy) (Dec
 				slog.String("provider", m.ProviderID),
 				slog.String("model", m.ID),
 			)
-			e.mu.Lock()
-			if mod, ok := e.models[m.ID]; ok {
-				mod.Enabled = false
-				e.models[m.ID] = mod
-			}
-			e.mu.Unlock()
+			e.disableModel(m.ID)
 		}
 	}
 
 	// All eligible models failed. Last-resort pass: try any enabled model not
 	// yet attempted (e.g., health-cooldown providers, budget-excluded models).
 	e.mu.RLock()
-	var lastResort []Model
-	var lrAdapters map[string]Sender
+	lastResort := e.lastResortModelsLocked(wildcardPool, tried)
+	lrAdapters := e.dispatch
 	tokensNeeded := EstimateTokens(req)
 	outTok := estOutTokens(p)
-	for _, m := range e.models {
-		if wildcardPool != nil && !wildcardPool[m.ID] {
-			continue
-		}
-		if !tried[m.ID] && m.Enabled {
-			if a, ok := e.adapters[m.ProviderID]; ok {
-				lastResort = append(lastResort, m)
-				if lrAdapters == nil {
-					lrAdapters = make(map[string]Sender)
-				}
-				lrAdapters[m.ProviderID] = a
-			}
-		}
-	}
 	e.mu.RUnlock()
 
 	for _, m := range lastResort {
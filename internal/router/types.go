@@ -83,22 +83,18 @@ type Message struct {
 // Non-text parts (image_url, etc.) are silently skipped; their textual
 // representation is not meaningful for text-only backends.
 func (m *Message) UnmarshalJSON(data []byte) error {
-	// Use an alias to avoid infinite recursion.
-	type alias struct {
-		Role       string          `json:"role"`
-		Content    json.RawMessage `json:"content"`
-		ToolCalls  json.RawMessage `json:"tool_calls"`
-		ToolCallID string          `json:"tool_call_id"`
-		Name       string          `json:"name"`
-	}
-	var a alias
+	// plain has Message's fields but not this method, so the other fields
+	// decode straight into m and only Content is captured raw.
+	type plain Message
+	*m = Message{}
+	a := struct {
+		*plain
+		Content json.RawMessage `json:"content"`
+	}{plain: (*plain)(m)}
 	if err := json.Unmarshal(data, &a); err != nil {
 		return err
 	}
-	m.Role = a.Role
-	m.ToolCalls = a.ToolCalls
-	m.ToolCallID = a.ToolCallID
-	m.Name = a.Name
+	m.Role = internRole(m.Role)
 
 	if len(a.Content) == 0 {
 		return nil
@@ -132,6 +128,26 @@ func (m *Message) UnmarshalJSON(data []byte) error {
 	return nil
 }
 
+// internRole returns the package's constant for the standard chat roles so
+// decoded messages share one copy of each instead of each holding its own
+// small heap string, and comparisons against the role literals short-circuit
+// on pointer equality. Other roles are returned unchanged.
+func internRole(role string) string {
+	switch role {
+	case "system":
+		return "system"
+	case "user":
+		return "user"
+	case "assistant":
+		return "assistant"
+	case "tool":
+		return "tool"
+	case "developer":
+		return "developer"
+	}
+	return role
+}
+
 // Policy specifies routing constraints such as mode, budget, latency, and quality.
 type Policy struct {
 	Mode         string
@@ -167,16 +183,19 @@ type Model struct {
 	InputPer1K       float64 `json:"input_per_1k"`
 	OutputPer1K      float64 `json:"output_per_1k"`
 	Enabled          bool    `json:"enabled"`
-	PricingSource    string  `json:"pricing_source,omitempty"`
-	// ToolNameMap maps model-facing tool names to client-facing tool names.
-	// Applied to tool_calls in responses (model→client) and inverted for
-	// tool definitions in requests (client→model).
-	ToolNameMap map[string]string `json:"tool_name_map,omitempty"`
 	// Gemma4Output enables parsing of Gemma 4's non-standard response tokens:
 	// <|channel>thought\n...<channel|> thinking blocks are stripped, and
 	// <|tool_call>call:name{...}<tool_call|> inline tool calls are converted
 	// to the standard OpenAI tool_calls format.
-	Gemma4Output bool `json:"gemma4_output,omitempty"`
+	//
+	// It sits next to Enabled so the two bools share one word: Model is
+	// held and copied by value throughout the engine.
+	Gemma4Output  bool   `json:"gemma4_output,omitempty"`
+	PricingSource string `json:"pricing_source,omitempty"`
+	// ToolNameMap maps model-facing tool names to client-facing tool names.
+	// Applied to tool_calls in responses (model→client) and inverted for
+	// tool definitions in requests (client→model).
+	ToolNameMap map[string]string `json:"tool_name_map,omitempty"`
 }
 
 // OrchestrationDirective configures multi-model orchestration (adversarial, vote, refine).
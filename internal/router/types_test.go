@@ -2,7 +2,9 @@ package router
 
 import (
 	"encoding/json"
+	"reflect"
 	"testing"
+	"unsafe"
 )
 
 func TestMessageUnmarshal_StringContent(t *testing.T) {
@@ -148,3 +150,54 @@ func TestMessageMarshal_RoundTripsToolCallID(t *testing.T) {
 		t.Errorf("tool_call_id: got %q, want %q", reconstructed.ToolCallID, "call_xyz")
 	}
 }
+
+func TestMessageUnmarshal_ResetsReusedMessage(t *testing.T) {
+	m := Message{Role: "tool", Content: "stale", ToolCallID: "call_old", Name: "old"}
+	if err := json.Unmarshal([]byte(`{"role":"user"}`), &m); err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if m.Role != "user" || m.Content != "" || m.ToolCallID != "" || m.Name != "" {
+		t.Errorf("got %+v, want only role set", m)
+	}
+}
+
+func TestModelBoolFieldsPacked(t *testing.T) {
+	var m Model
+	if got, want := unsafe.Offsetof(m.Gemma4Output), unsafe.Offsetof(m.Enabled)+1; got != want {
+		t.Errorf("Gemma4Output offset = %d, want %d (adjacent to Enabled)", got, want)
+	}
+}
+
+// TestRequestTypesAreTightlyPacked guards the layout of the value types
+// copied on every request: each must be no larger than its fields' total
+// size rounded up to its alignment, i.e. field order wastes no space.
+func TestRequestTypesAreTightlyPacked(t *testing.T) {
+	for _, v := range []any{Message{}, Request{}, Policy{}, Decision{}, Model{}} {
+		typ := reflect.TypeOf(v)
+		var sum uintptr
+		for i := 0; i < typ.NumField(); i++ {
+			sum += typ.Field(i).Type.Size()
+		}
+		align := uintptr(typ.Align())
+		if want := (sum + align - 1) / align * align; typ.Size() != want {
+			t.Errorf("%s is %d bytes, want %d; reorder fields to remove padding", typ.Name(), typ.Size(), want)
+		}
+	}
+}
+
+func TestMessageUnmarshal_InternsRole(t *testing.T) {
+	var m Message
+	if err := json.Unmarshal([]byte(`{"role":"assistant","content":"hi"}`), &m); err != nil {
+		t.Fatalf("unmarshal: %v", err)
+	}
+	if unsafe.StringData(m.Role) != unsafe.StringData("assistant") {
+		t.Error("expected decoded role to share the interned constant")
+	}
+
+	if err := json.Unmarshal([]byte(`{"role":"narrator","content":"hi"}`), &m); err != nil {
+		t.Fatalf("unmarshal: %v", err)
+	}
+	if m.Role != "narrator" {
+		t.Errorf("unknown role = %q, want narrator", m.Role)
+	}
+}
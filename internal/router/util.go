@@ -3,33 +3,64 @@ package router
 import (
 	"encoding/json"
 	"math"
+	"strings"
+	"unicode/utf8"
 )
 
-// EstimateTokens estimates the token count for a request (chars/4 heuristic).
+// EstimateTokens estimates the token count for a request.
 // If EstimatedInputTokens is set on the request, that value is returned directly.
 func EstimateTokens(req Request) int {
 	if req.EstimatedInputTokens > 0 {
 		return req.EstimatedInputTokens
 	}
+	// Index rather than range by value: only Content is needed, so there is
+	// no reason to copy each 88-byte Message out of the slice.
+	msgs := req.Messages
 	total := 0
-	for _, msg := range req.Messages {
-		total += len(msg.Content) / 4
+	for i := range msgs {
+		total += estimateTextTokens(msgs[i].Content)
 	}
 	return total
 }
 
+// estimateTextTokens approximates the BPE token count of s without a
+// tokenizer: ASCII text averages about four bytes per token, while each
+// non-ASCII character (CJK, emoji, most non-Latin scripts) is roughly a
+// token of its own. A plain bytes/4 count undercounts the latter by 3-4x,
+// which under-reserves context and routes such prompts to windows they
+// overflow. For ASCII-only text this is exactly len(s)/4.
+func estimateTextTokens(s string) int {
+	ascii, other := 0, 0
+	for i := 0; i < len(s); i++ {
+		switch c := s[i]; {
+		case c < utf8.RuneSelf:
+			ascii++
+		case c&0xC0 != 0x80: // lead byte of a multi-byte character
+			other++
+		}
+	}
+	return ascii/4 + other
+}
+
 // MessagesContent concatenates all user message content into a single string.
 func MessagesContent(msgs []Message) string {
-	var s string
+	n := 0
+	for _, m := range msgs {
+		if m.Role == "user" {
+			n += len(m.Content) + 1
+		}
+	}
+	var b strings.Builder
+	b.Grow(n)
 	for _, m := range msgs {
 		if m.Role == "user" {
-			if s != "" {
-				s += "\n"
+			if b.Len() > 0 {
+				b.WriteByte('\n')
 			}
-			s += m.Content
+			b.WriteString(m.Content)
 		}
 	}
-	return s
+	return b.String()
 }
 
 // ExtractContent tries to pull the text content from a provider response JSON.
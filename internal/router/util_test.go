@@ -0,0 +1,19 @@
+package router
+
+import "testing"
+
+func TestMessagesContent(t *testing.T) {
+	msgs := []Message{
+		{Role: "system", Content: "be terse"},
+		{Role: "user", Content: ""},
+		{Role: "user", Content: "first"},
+		{Role: "assistant", Content: "ok"},
+		{Role: "user", Content: "second"},
+	}
+	if got, want := MessagesContent(msgs), "first\nsecond"; got != want {
+		t.Errorf("MessagesContent = %q, want %q", got, want)
+	}
+	if got := MessagesContent(nil); got != "" {
+		t.Errorf("MessagesContent(nil) = %q, want empty", got)
+	}
+}
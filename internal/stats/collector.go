@@ -1,7 +1,6 @@
 package stats
 
 import (
-	"sort"
 	"sync"
 	"time"
 )
@@ -288,14 +287,60 @@ func computeAggregate(window, modelID, providerID string, snaps []Snapshot) Aggr
 	}
 
 	// P95 latency.
-	sort.Float64s(latencies)
 	if len(latencies) > 0 {
 		idx := int(float64(len(latencies)) * 0.95)
 		if idx >= len(latencies) {
 			idx = len(latencies) - 1
 		}
-		a.P95LatencyMs = latencies[idx]
+		a.P95LatencyMs = selectNth(latencies, idx)
 	}
 
 	return a
 }
+
+// selectNth returns the value that would be at index n if xs were sorted,
+// reordering xs in place. Only one order statistic is needed per aggregate,
+// so a quickselect (expected linear time) replaces a full sort of every
+// request latency in the window.
+func selectNth(xs []float64, n int) float64 {
+	lo, hi := 0, len(xs)-1
+	for lo < hi {
+		// Median-of-three pivot keeps already-sorted input (latencies arrive
+		// roughly in time order) from degrading to quadratic time.
+		mid := lo + (hi-lo)/2
+		if xs[mid] < xs[lo] {
+			xs[mid], xs[lo] = xs[lo], xs[mid]
+		}
+		if xs[hi] < xs[lo] {
+			xs[hi], xs[lo] = xs[lo], xs[hi]
+		}
+		if xs[hi] < xs[mid] {
+			xs[hi], xs[mid] = xs[mid], xs[hi]
+		}
+		pivot := xs[mid]
+
+		i, j := lo, hi
+		for i <= j {
+			for xs[i] < pivot {
+				i++
+			}
+			for xs[j] > pivot {
+				j--
+			}
+			if i <= j {
+				xs[i], xs[j] = xs[j], xs[i]
+				i++
+				j--
+			}
+		}
+		switch {
+		case n <= j:
+			hi = j
+		case n >= i:
+			lo = i
+		default:
+			return xs[n]
+		}
+	}
+	return xs[n]
+}
@@ -1,6 +1,8 @@
 package stats
 
 import (
+	"math/rand"
+	"sort"
 	"testing"
 	"time"
 )
@@ -135,3 +137,25 @@ func TestEmptyCollector(t *testing.T) {
 		t.Errorf("expected empty global, got %d", len(global))
 	}
 }
+
+func TestSelectNthMatchesSort(t *testing.T) {
+	rng := rand.New(rand.NewSource(1))
+	for _, size := range []int{1, 2, 3, 10, 101, 1000} {
+		for trial := 0; trial < 20; trial++ {
+			xs := make([]float64, size)
+			for i := range xs {
+				// Few distinct values exercise duplicate handling.
+				xs[i] = float64(rng.Intn(size/2 + 1))
+			}
+			if trial%4 == 0 {
+				sort.Float64s(xs)
+			}
+			sorted := append([]float64(nil), xs...)
+			sort.Float64s(sorted)
+			n := rng.Intn(size)
+			if got := selectNth(xs, n); got != sorted[n] {
+				t.Fatalf("size %d: selectNth(%d) = %v, want %v", size, n, got, sorted[n])
+			}
+		}
+	}
+}
@@ -33,25 +33,106 @@ type SQLiteStore struct {
 }
 
 // NewSQLite opens or creates a SQLite database at the given DSN.
+// In-memory DSNs (see IsInMemoryDSN) are pinned to a single, never-recycled
+// connection: every SQLite connection to ":memory:" is a separate empty
+// database, so the pool must not open a second one or retire the first.
 func NewSQLite(dsn string) (*SQLiteStore, error) {
-	db, err := sql.Open("sqlite", dsn)
+	if IsInMemoryDSN(dsn) {
+		db, err := sql.Open("sqlite", dsn)
+		if err != nil {
+			return nil, fmt.Errorf("open sqlite: %w", err)
+		}
+		db.SetMaxOpenConns(1)
+		db.SetMaxIdleConns(1)
+		db.SetConnMaxLifetime(0)
+		db.SetConnMaxIdleTime(0)
+		// No journal to tune; only foreign key enforcement applies.
+		if _, err := db.Exec("PRAGMA foreign_keys=ON;"); err != nil {
+			_ = db.Close()
+			return nil, fmt.Errorf("sqlite pragmas: %w", err)
+		}
+		return &SQLiteStore{db: db}, nil
+	}
+	// The pragmas ride on the DSN so the driver applies them to every pooled
+	// connection, not just the first one. Ping opens that first connection
+	// so a bad pragma still fails here rather than on the first query.
+	db, err := sql.Open("sqlite", withPragmas(dsn))
 	if err != nil {
 		return nil, fmt.Errorf("open sqlite: %w", err)
 	}
-	// Enable WAL mode, busy timeout, and foreign key enforcement.
-	if _, err := db.Exec("PRAGMA journal_mode=WAL; PRAGMA busy_timeout=5000; PRAGMA foreign_keys=ON;"); err != nil {
+	if err := db.Ping(); err != nil {
 		_ = db.Close()
 		return nil, fmt.Errorf("sqlite pragmas: %w", err)
 	}
 	// SQLite is single-writer; keeping connections low (2) reduces BUSY
 	// contention and lock timeouts while still allowing one reader alongside
-	// the writer.
+	// the writer. The connections are local file handles that never go
+	// stale, so they are kept for the life of the store: recycling them
+	// would only throw away their page cache and re-run the pragmas.
 	db.SetMaxOpenConns(2)
 	db.SetMaxIdleConns(2)
-	db.SetConnMaxLifetime(time.Hour)
+	db.SetConnMaxLifetime(0)
+	db.SetConnMaxIdleTime(0)
 	return &SQLiteStore{db: db}, nil
 }
 
+// filePragmas are applied to every connection of a file-backed store.
+// busy_timeout is first so the rest wait out a concurrent writer. WAL lets
+// readers run alongside the writer; in WAL mode synchronous=NORMAL only
+// fsyncs at checkpoints, which is still durable against application crashes.
+var filePragmas = []struct{ name, value string }{
+	{"busy_timeout", "5000"},
+	{"journal_mode", "WAL"},
+	{"synchronous", "NORMAL"},
+	{"temp_store", "MEMORY"},
+	{"foreign_keys", "1"},
+}
+
+// withPragmas appends a _pragma query parameter to dsn for each entry of
+// filePragmas the caller has not already set, so an explicit DSN setting
+// (e.g. a longer busy_timeout) wins over the default.
+func withPragmas(dsn string) string {
+	_, query, _ := strings.Cut(dsn, "?")
+	set := make(map[string]bool)
+	for _, param := range strings.Split(query, "&") {
+		if v, ok := strings.CutPrefix(param, "_pragma="); ok {
+			name, _, _ := strings.Cut(v, "(")
+			set[strings.ToLower(strings.TrimSpace(name))] = true
+		}
+	}
+	var b strings.Builder
+	b.WriteString(dsn)
+	sep := "?"
+	if strings.Contains(dsn, "?") {
+		sep = "&"
+	}
+	for _, p := range filePragmas {
+		if set[p.name] {
+			continue
+		}
+		b.WriteString(sep)
+		b.WriteString("_pragma=" + p.name + "(" + p.value + ")")
+		sep = "&"
+	}
+	return b.String()
+}
+
+// IsInMemoryDSN reports whether dsn names an in-memory SQLite database
+// (":memory:", "file::memory:..." or any URI with mode=memory). Such
+// databases have no data directory and vanish when the store is closed.
+func IsInMemoryDSN(dsn string) bool {
+	path, query, _ := strings.Cut(strings.TrimPrefix(dsn, "file:"), "?")
+	if path == ":memory:" {
+		return true
+	}
+	for _, param := range strings.Split(query, "&") {
+		if param == "mode=memory" {
+			return true
+		}
+	}
+	return false
+}
+
 // DB returns the underlying sql.DB handle (used by TSDB).
 func (s *SQLiteStore) DB() *sql.DB {
 	return s.db
@@ -263,6 +344,20 @@ var schemaMigrations = []migration{
 	sqlMigration(13, "add_model_aliases_sticky_by",
 		`ALTER TABLE model_aliases ADD COLUMN sticky_by TEXT NOT NULL DEFAULT ''`,
 	),
+	// GetMonthlySpend runs on every budgeted request. Covering
+	// (api_key_id, timestamp, estimated_cost_usd) lets SQLite answer it
+	// from a range of the index alone instead of visiting every row the
+	// key has ever logged; the api_key_id-only index is a prefix of it.
+	sqlMigration(14, "add_request_logs_api_key_spend_index",
+		`CREATE INDEX IF NOT EXISTS idx_request_logs_api_key_spend ON request_logs(api_key_id, timestamp, estimated_cost_usd)`,
+		`DROP INDEX IF EXISTS idx_request_logs_api_key`,
+	),
+	// Vault values are stored as length-prefixed binary records alongside
+	// the JSON map of base64 strings. data is still written so an older
+	// binary can read the vault after a rollback; see LoadVaultBlob.
+	sqlMigration(15, "add_vault_blob_records",
+		`ALTER TABLE vault_blob ADD COLUMN records BLOB`,
+	),
 }
 
 // Migrate applies all pending schema migrations in version order.
@@ -322,22 +417,26 @@ func (s *SQLiteStore) Close() error {
 
 // Models
 
+// modelCols is the column list for models queries, in scanModelRecord order.
+const modelCols = `id, provider_id, weight, max_context_tokens, input_per_1k, output_per_1k, enabled, pricing_source, tool_name_map, gemma4_output`
+
 func scanModelRecord(scan func(...any) error) (ModelRecord, error) {
 	var m ModelRecord
-	var toolNameMapJSON string
+	// Scanned as bytes so the JSON decoder reads the driver's copy directly
+	// instead of a string that would be copied again for json.Unmarshal.
+	var toolNameMapJSON []byte
 	if err := scan(&m.ID, &m.ProviderID, &m.Weight, &m.MaxContextTokens,
 		&m.InputPer1K, &m.OutputPer1K, &m.Enabled, &m.PricingSource, &toolNameMapJSON, &m.Gemma4Output); err != nil {
 		return m, err
 	}
-	if toolNameMapJSON != "" && toolNameMapJSON != "{}" {
-		_ = json.Unmarshal([]byte(toolNameMapJSON), &m.ToolNameMap)
+	if len(toolNameMapJSON) > 0 && string(toolNameMapJSON) != "{}" {
+		_ = json.Unmarshal(toolNameMapJSON, &m.ToolNameMap)
 	}
 	return m, nil
 }
 
 func (s *SQLiteStore) ListModels(ctx context.Context) ([]ModelRecord, error) {
-	rows, err := s.db.QueryContext(ctx,
-		`SELECT id, provider_id, weight, max_context_tokens, input_per_1k, output_per_1k, enabled, pricing_source, tool_name_map, gemma4_output FROM models`)
+	rows, err := s.db.QueryContext(ctx, `SELECT `+modelCols+` FROM models`)
 	if err != nil {
 		return nil, err
 	}
@@ -355,8 +454,7 @@ func (s *SQLiteStore) ListModels(ctx context.Context) ([]ModelRecord, error) {
 }
 
 func (s *SQLiteStore) GetModel(ctx context.Context, id string) (*ModelRecord, error) {
-	row := s.db.QueryRowContext(ctx,
-		`SELECT id, provider_id, weight, max_context_tokens, input_per_1k, output_per_1k, enabled, pricing_source, tool_name_map, gemma4_output FROM models WHERE id = ?`, id)
+	row := s.db.QueryRowContext(ctx, `SELECT `+modelCols+` FROM models WHERE id = ?`, id)
 	m, err := scanModelRecord(row.Scan)
 	if err == sql.ErrNoRows {
 		return nil, nil
@@ -367,17 +465,7 @@ func (s *SQLiteStore) GetModel(ctx context.Context, id string) (*ModelRecord, er
 	return &m, nil
 }
 
-func (s *SQLiteStore) UpsertModel(ctx context.Context, m ModelRecord) error {
-	if m.PricingSource == "" {
-		m.PricingSource = "manual"
-	}
-	toolNameMapJSON := "{}"
-	if len(m.ToolNameMap) > 0 {
-		b, _ := json.Marshal(m.ToolNameMap)
-		toolNameMapJSON = string(b)
-	}
-	_, err := s.db.ExecContext(ctx,
-		`INSERT INTO models (id, provider_id, weight, max_context_tokens, input_per_1k, output_per_1k, enabled, pricing_source, tool_name_map, gemma4_output)
+const upsertModelSQL = `INSERT INTO models (` + modelCols + `)
 		 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
 		 ON CONFLICT(id) DO UPDATE SET
 		   provider_id=excluded.provider_id,
@@ -388,11 +476,45 @@ func (s *SQLiteStore) UpsertModel(ctx context.Context, m ModelRecord) error {
 		   enabled=excluded.enabled,
 		   pricing_source=excluded.pricing_source,
 		   tool_name_map=excluded.tool_name_map,
-		   gemma4_output=excluded.gemma4_output`,
-		m.ID, m.ProviderID, m.Weight, m.MaxContextTokens, m.InputPer1K, m.OutputPer1K, m.Enabled, m.PricingSource, toolNameMapJSON, m.Gemma4Output)
+		   gemma4_output=excluded.gemma4_output`
+
+func modelArgs(m ModelRecord) []any {
+	if m.PricingSource == "" {
+		m.PricingSource = "manual"
+	}
+	toolNameMapJSON := "{}"
+	if len(m.ToolNameMap) > 0 {
+		b, _ := json.Marshal(m.ToolNameMap)
+		toolNameMapJSON = string(b)
+	}
+	return []any{m.ID, m.ProviderID, m.Weight, m.MaxContextTokens, m.InputPer1K, m.OutputPer1K, m.Enabled, m.PricingSource, toolNameMapJSON, m.Gemma4Output}
+}
+
+func (s *SQLiteStore) UpsertModel(ctx context.Context, m ModelRecord) error {
+	_, err := s.db.ExecContext(ctx, upsertModelSQL, modelArgs(m)...)
 	return err
 }
 
+// UpsertModels writes models in one transaction with a single prepared
+// statement, so bulk registrations (provider autoload, pricing refresh)
+// commit once instead of once per model.
+func (s *SQLiteStore) UpsertModels(ctx context.Context, models []ModelRecord) error {
+	if len(models) == 0 {
+		return nil
+	}
+	tx, err := s.db.BeginTx(ctx, nil)
+	if err != nil {
+		return err
+	}
+	defer func() { _ = tx.Rollback() }()
+	if err := execBatch(ctx, tx, upsertModelSQL, len(models), func(i int) []any {
+		return modelArgs(models[i])
+	}); err != nil {
+		return err
+	}
+	return tx.Commit()
+}
+
 func (s *SQLiteStore) DeleteModel(ctx context.Context, id string) error {
 	_, err := s.db.ExecContext(ctx, `DELETE FROM models WHERE id = ?`, id)
 	return err
@@ -439,42 +561,64 @@ func (s *SQLiteStore) DeleteProvider(ctx context.Context, id string) error {
 
 // Request Logs
 
-func (s *SQLiteStore) LogRequest(ctx context.Context, entry RequestLog) error {
-	_, err := s.db.ExecContext(ctx,
-		`INSERT INTO request_logs (timestamp, model_id, provider_id, mode, estimated_cost_usd, latency_ms, status_code, error_class, request_id, api_key_id, input_tokens, output_tokens, total_tokens, alias_from)
-		 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`,
-		entry.Timestamp, entry.ModelID, entry.ProviderID, entry.Mode,
+const insertRequestLogSQL = `INSERT INTO request_logs (timestamp, model_id, provider_id, mode, estimated_cost_usd, latency_ms, status_code, error_class, request_id, api_key_id, input_tokens, output_tokens, total_tokens, alias_from)
+		 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`
+
+func requestLogArgs(entry RequestLog) []any {
+	return []any{entry.Timestamp, entry.ModelID, entry.ProviderID, entry.Mode,
 		entry.EstimatedCostUSD, entry.LatencyMs, entry.StatusCode, entry.ErrorClass, entry.RequestID, entry.APIKeyID,
-		entry.InputTokens, entry.OutputTokens, entry.TotalTokens, entry.AliasFrom)
+		entry.InputTokens, entry.OutputTokens, entry.TotalTokens, entry.AliasFrom}
+}
+
+func (s *SQLiteStore) LogRequest(ctx context.Context, entry RequestLog) error {
+	_, err := s.db.ExecContext(ctx, insertRequestLogSQL, requestLogArgs(entry)...)
 	return err
 }
 
 // Vault persistence
 
-func (s *SQLiteStore) SaveVaultBlob(ctx context.Context, salt []byte, data map[string]string) error {
-	j, err := json.Marshal(data)
+func (s *SQLiteStore) SaveVaultBlob(ctx context.Context, salt []byte, data map[string][]byte) error {
+	// data keeps the pre-migration-15 encoding so a rolled-back binary
+	// still finds the secrets; it can be dropped once no such binary is
+	// supported.
+	legacy, err := encodeLegacyVaultData(data)
 	if err != nil {
 		return fmt.Errorf("marshal vault data: %w", err)
 	}
 	_, err = s.db.ExecContext(ctx,
-		`INSERT INTO vault_blob (id, salt, data) VALUES (1, ?, ?)
-		 ON CONFLICT(id) DO UPDATE SET salt=excluded.salt, data=excluded.data`,
-		salt, string(j))
+		`INSERT INTO vault_blob (id, salt, data, records) VALUES (1, ?, ?, ?)
+		 ON CONFLICT(id) DO UPDATE SET salt=excluded.salt, data=excluded.data, records=excluded.records`,
+		salt, legacy, encodeVaultRecords(data))
 	return err
 }
 
-func (s *SQLiteStore) LoadVaultBlob(ctx context.Context) ([]byte, map[string]string, error) {
-	var salt []byte
+func (s *SQLiteStore) LoadVaultBlob(ctx context.Context) ([]byte, map[string][]byte, error) {
+	var salt, records []byte
 	var dataStr string
-	err := s.db.QueryRowContext(ctx, `SELECT salt, data FROM vault_blob WHERE id = 1`).Scan(&salt, &dataStr)
+	err := s.db.QueryRowContext(ctx, `SELECT salt, data, records FROM vault_blob WHERE id = 1`).Scan(&salt, &dataStr, &records)
 	if err == sql.ErrNoRows {
 		return nil, nil, nil
 	}
 	if err != nil {
 		return nil, nil, err
 	}
-	var data map[string]string
-	if err := json.Unmarshal([]byte(dataStr), &data); err != nil {
+	if len(records) > 0 {
+		// Scan hands back a private copy of the column, so the decoded
+		// values can alias it instead of being copied out a second time.
+		data, err := decodeVaultRecords(records)
+		if err != nil {
+			return nil, nil, fmt.Errorf("decode vault records: %w", err)
+		}
+		// A binary from before migration 15 updates only data and leaves
+		// records stale. Both are saved together here, so records are
+		// current only while they still match data; otherwise data was
+		// written last and wins.
+		if legacy, err := encodeLegacyVaultData(data); err == nil && legacy == dataStr {
+			return salt, data, nil
+		}
+	}
+	data, err := decodeLegacyVaultData(dataStr)
+	if err != nil {
 		return nil, nil, fmt.Errorf("unmarshal vault data: %w", err)
 	}
 	return salt, data, nil
@@ -598,22 +742,68 @@ func (s *SQLiteStore) ListAuditLogs(ctx context.Context, limit int, offset int)
 
 // Reward Logs
 
-func (s *SQLiteStore) LogReward(ctx context.Context, entry RewardEntry) error {
+const insertRewardLogSQL = `INSERT INTO reward_logs (timestamp, request_id, model_id, provider_id, mode,
+		 estimated_tokens, token_bucket, latency_budget_ms, latency_ms, cost_usd,
+		 success, error_class, reward)
+		 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`
+
+func rewardLogArgs(entry RewardEntry) []any {
 	successInt := 0
 	if entry.Success {
 		successInt = 1
 	}
-	_, err := s.db.ExecContext(ctx,
-		`INSERT INTO reward_logs (timestamp, request_id, model_id, provider_id, mode,
-		 estimated_tokens, token_bucket, latency_budget_ms, latency_ms, cost_usd,
-		 success, error_class, reward)
-		 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`,
-		entry.Timestamp, entry.RequestID, entry.ModelID, entry.ProviderID, entry.Mode,
+	return []any{entry.Timestamp, entry.RequestID, entry.ModelID, entry.ProviderID, entry.Mode,
 		entry.EstimatedTokens, entry.TokenBucket, entry.LatencyBudgetMs, entry.LatencyMs,
-		entry.CostUSD, successInt, entry.ErrorClass, entry.Reward)
+		entry.CostUSD, successInt, entry.ErrorClass, entry.Reward}
+}
+
+func (s *SQLiteStore) LogReward(ctx context.Context, entry RewardEntry) error {
+	_, err := s.db.ExecContext(ctx, insertRewardLogSQL, rewardLogArgs(entry)...)
 	return err
 }
 
+// LogBatch writes request and reward logs in one transaction, so a burst of
+// routed requests pays for a single commit instead of two per request.
+func (s *SQLiteStore) LogBatch(ctx context.Context, requests []RequestLog, rewards []RewardEntry) error {
+	if len(requests) == 0 && len(rewards) == 0 {
+		return nil
+	}
+	tx, err := s.db.BeginTx(ctx, nil)
+	if err != nil {
+		return err
+	}
+	defer func() { _ = tx.Rollback() }()
+	if err := execBatch(ctx, tx, insertRequestLogSQL, len(requests), func(i int) []any {
+		return requestLogArgs(requests[i])
+	}); err != nil {
+		return fmt.Errorf("log requests: %w", err)
+	}
+	if err := execBatch(ctx, tx, insertRewardLogSQL, len(rewards), func(i int) []any {
+		return rewardLogArgs(rewards[i])
+	}); err != nil {
+		return fmt.Errorf("log rewards: %w", err)
+	}
+	return tx.Commit()
+}
+
+// execBatch runs query n times within tx, preparing it once.
+func execBatch(ctx context.Context, tx *sql.Tx, query string, n int, args func(i int) []any) error {
+	if n == 0 {
+		return nil
+	}
+	stmt, err := tx.PrepareContext(ctx, query)
+	if err != nil {
+		return err
+	}
+	defer func() { _ = stmt.Close() }()
+	for i := 0; i < n; i++ {
+		if _, err := stmt.ExecContext(ctx, args(i)...); err != nil {
+			return err
+		}
+	}
+	return nil
+}
+
 // API Keys
 
 func (s *SQLiteStore) CreateAPIKey(ctx context.Context, key APIKeyRecord) error {
@@ -2,6 +2,9 @@ package store
 
 import (
 	"context"
+	"encoding/base64"
+	"path/filepath"
+	"strings"
 	"testing"
 	"time"
 )
@@ -27,6 +30,93 @@ func TestMigrate(t *testing.T) {
 	}
 }
 
+func TestIsInMemoryDSN(t *testing.T) {
+	cases := map[string]bool{
+		":memory:":                             true,
+		"file::memory:":                        true,
+		"file::memory:?cache=shared":           true,
+		"file:memdb1?mode=memory&cache=shared": true,
+		"file:/data/tokenhub.sqlite":           false,
+		"/tmp/tokenhub.db":                     false,
+		"file:/data/x.sqlite?_pragma=foo":      false,
+	}
+	for dsn, want := range cases {
+		if got := IsInMemoryDSN(dsn); got != want {
+			t.Errorf("IsInMemoryDSN(%q) = %v, want %v", dsn, got, want)
+		}
+	}
+}
+
+func TestWithPragmas(t *testing.T) {
+	got := withPragmas("/data/tokenhub.sqlite")
+	want := "/data/tokenhub.sqlite?_pragma=busy_timeout(5000)&_pragma=journal_mode(WAL)" +
+		"&_pragma=synchronous(NORMAL)&_pragma=temp_store(MEMORY)&_pragma=foreign_keys(1)"
+	if got != want {
+		t.Errorf("withPragmas = %q, want %q", got, want)
+	}
+
+	// Pragmas already in the DSN are kept and not repeated.
+	got = withPragmas("file:/data/t.sqlite?_pragma=busy_timeout(10000)&_pragma=journal_mode(WAL)")
+	want = "file:/data/t.sqlite?_pragma=busy_timeout(10000)&_pragma=journal_mode(WAL)" +
+		"&_pragma=synchronous(NORMAL)&_pragma=temp_store(MEMORY)&_pragma=foreign_keys(1)"
+	if got != want {
+		t.Errorf("withPragmas = %q, want %q", got, want)
+	}
+}
+
+func TestFileStorePragmasOnEveryConnection(t *testing.T) {
+	s, err := NewSQLite(filepath.Join(t.TempDir(), "tokenhub.sqlite"))
+	if err != nil {
+		t.Fatalf("failed to create store: %v", err)
+	}
+	t.Cleanup(func() { _ = s.Close() })
+	ctx := context.Background()
+
+	// Hold two connections at once so the pool has to open the second.
+	for i := 0; i < 2; i++ {
+		conn, err := s.DB().Conn(ctx)
+		if err != nil {
+			t.Fatalf("conn %d: %v", i, err)
+		}
+		defer func() { _ = conn.Close() }()
+
+		var mode string
+		var sync, fk int
+		if err := conn.QueryRowContext(ctx, "PRAGMA journal_mode").Scan(&mode); err != nil {
+			t.Fatalf("journal_mode: %v", err)
+		}
+		if err := conn.QueryRowContext(ctx, "PRAGMA synchronous").Scan(&sync); err != nil {
+			t.Fatalf("synchronous: %v", err)
+		}
+		if err := conn.QueryRowContext(ctx, "PRAGMA foreign_keys").Scan(&fk); err != nil {
+			t.Fatalf("foreign_keys: %v", err)
+		}
+		if mode != "wal" || sync != 1 || fk != 1 {
+			t.Errorf("conn %d: journal_mode=%s synchronous=%d foreign_keys=%d, want wal/1/1", i, mode, sync, fk)
+		}
+	}
+}
+
+func TestInMemoryStoreSharedAcrossConcurrentQueries(t *testing.T) {
+	s := newTestStore(t)
+	ctx := context.Background()
+
+	// Concurrent callers must all see the migrated schema, which only holds
+	// if the pool never opens a second (empty) in-memory database.
+	errs := make(chan error, 8)
+	for i := 0; i < 8; i++ {
+		go func() {
+			_, err := s.ListModels(ctx)
+			errs <- err
+		}()
+	}
+	for i := 0; i < 8; i++ {
+		if err := <-errs; err != nil {
+			t.Fatalf("ListModels: %v", err)
+		}
+	}
+}
+
 func TestModelsCRUD(t *testing.T) {
 	s := newTestStore(t)
 	ctx := context.Background()
@@ -182,6 +272,99 @@ func TestRequestLogs(t *testing.T) {
 	}
 }
 
+func TestMonthlySpendUsesCoveringIndex(t *testing.T) {
+	s := newTestStore(t)
+	ctx := context.Background()
+
+	rows, err := s.DB().QueryContext(ctx,
+		`EXPLAIN QUERY PLAN SELECT COALESCE(SUM(estimated_cost_usd), 0) FROM request_logs WHERE api_key_id = ? AND timestamp >= ?`,
+		"key-1", time.Now().UTC().Format(time.RFC3339))
+	if err != nil {
+		t.Fatalf("explain failed: %v", err)
+	}
+	defer func() { _ = rows.Close() }()
+	var plan []string
+	for rows.Next() {
+		var id, parent, notused int
+		var detail string
+		if err := rows.Scan(&id, &parent, &notused, &detail); err != nil {
+			t.Fatalf("scan plan: %v", err)
+		}
+		plan = append(plan, detail)
+	}
+	if got := strings.Join(plan, "; "); !strings.Contains(got, "COVERING INDEX idx_request_logs_api_key_spend") {
+		t.Errorf("expected covering index scan, got plan %q", got)
+	}
+}
+
+func TestUpsertModels(t *testing.T) {
+	s := newTestStore(t)
+	ctx := context.Background()
+
+	if err := s.UpsertProvider(ctx, ProviderRecord{ID: "openai", Type: "openai", Enabled: true}); err != nil {
+		t.Fatalf("upsert provider failed: %v", err)
+	}
+	if err := s.UpsertModel(ctx, ModelRecord{ID: "gpt-4", ProviderID: "openai", Weight: 3, Enabled: true}); err != nil {
+		t.Fatalf("upsert failed: %v", err)
+	}
+
+	models := []ModelRecord{
+		{ID: "gpt-4", ProviderID: "openai", Weight: 8, Enabled: true, PricingSource: "litellm"},
+		{ID: "gpt-4o", ProviderID: "openai", Weight: 7, Enabled: true, ToolNameMap: map[string]string{"a": "b"}},
+	}
+	if err := s.UpsertModels(ctx, models); err != nil {
+		t.Fatalf("upsert models failed: %v", err)
+	}
+	if err := s.UpsertModels(ctx, nil); err != nil {
+		t.Fatalf("empty upsert models failed: %v", err)
+	}
+
+	got, _ := s.GetModel(ctx, "gpt-4")
+	if got == nil || got.Weight != 8 || got.PricingSource != "litellm" {
+		t.Errorf("expected gpt-4 updated to weight 8/litellm, got %+v", got)
+	}
+	got, _ = s.GetModel(ctx, "gpt-4o")
+	if got == nil || got.PricingSource != "manual" || got.ToolNameMap["a"] != "b" {
+		t.Errorf("expected gpt-4o inserted with defaults, got %+v", got)
+	}
+}
+
+func TestLogBatch(t *testing.T) {
+	s := newTestStore(t)
+	ctx := context.Background()
+
+	now := time.Now().UTC()
+	requests := []RequestLog{
+		{Timestamp: now, ModelID: "gpt-4", ProviderID: "openai", StatusCode: 200, RequestID: "req-1"},
+		{Timestamp: now, ModelID: "claude-opus", ProviderID: "anthropic", StatusCode: 502, RequestID: "req-2"},
+	}
+	rewards := []RewardEntry{
+		{Timestamp: now, RequestID: "req-1", ModelID: "gpt-4", Success: true, Reward: 0.9},
+		{Timestamp: now, RequestID: "req-2", ModelID: "claude-opus", Success: false},
+	}
+	if err := s.LogBatch(ctx, requests, rewards); err != nil {
+		t.Fatalf("log batch failed: %v", err)
+	}
+	if err := s.LogBatch(ctx, nil, nil); err != nil {
+		t.Fatalf("empty log batch failed: %v", err)
+	}
+
+	logs, err := s.ListRequestLogs(ctx, 10, 0)
+	if err != nil {
+		t.Fatalf("list logs failed: %v", err)
+	}
+	if len(logs) != 2 {
+		t.Errorf("expected 2 request logs, got %d", len(logs))
+	}
+	got, err := s.ListRewards(ctx, 10, 0)
+	if err != nil {
+		t.Fatalf("list rewards failed: %v", err)
+	}
+	if len(got) != 2 {
+		t.Errorf("expected 2 reward logs, got %d", len(got))
+	}
+}
+
 func TestRequestLogsLimit(t *testing.T) {
 	s := newTestStore(t)
 	ctx := context.Background()
@@ -225,9 +408,9 @@ func TestVaultBlobPersistence(t *testing.T) {
 	ctx := context.Background()
 
 	salt := []byte("test-salt-16byte")
-	data := map[string]string{
-		"openai_key":    "enc-aes-gcm-openai",
-		"anthropic_key": "enc-aes-gcm-anthropic",
+	data := map[string][]byte{
+		"openai_key":    []byte("enc-aes-gcm-openai"),
+		"anthropic_key": []byte("enc-aes-gcm-anthropic"),
 	}
 
 	if err := s.SaveVaultBlob(ctx, salt, data); err != nil {
@@ -244,7 +427,7 @@ func TestVaultBlobPersistence(t *testing.T) {
 	if len(gotData) != 2 {
 		t.Errorf("expected 2 keys, got %d", len(gotData))
 	}
-	if gotData["openai_key"] != "enc-aes-gcm-openai" {
+	if string(gotData["openai_key"]) != "enc-aes-gcm-openai" {
 		t.Errorf("unexpected value: %s", gotData["openai_key"])
 	}
 }
@@ -254,12 +437,12 @@ func TestVaultBlobUpsert(t *testing.T) {
 	ctx := context.Background()
 
 	// Save initial blob.
-	if err := s.SaveVaultBlob(ctx, []byte("salt1"), map[string]string{"k": "v1"}); err != nil {
+	if err := s.SaveVaultBlob(ctx, []byte("salt1"), map[string][]byte{"k": []byte("v1")}); err != nil {
 		t.Fatalf("save 1 failed: %v", err)
 	}
 
 	// Upsert with new data.
-	if err := s.SaveVaultBlob(ctx, []byte("salt2"), map[string]string{"k": "v2"}); err != nil {
+	if err := s.SaveVaultBlob(ctx, []byte("salt2"), map[string][]byte{"k": []byte("v2")}); err != nil {
 		t.Fatalf("save 2 failed: %v", err)
 	}
 
@@ -270,11 +453,109 @@ func TestVaultBlobUpsert(t *testing.T) {
 	if string(gotSalt) != "salt2" {
 		t.Errorf("expected salt2, got %s", gotSalt)
 	}
-	if gotData["k"] != "v2" {
+	if string(gotData["k"]) != "v2" {
 		t.Errorf("expected v2, got %s", gotData["k"])
 	}
 }
 
+func TestVaultBlobReadsLegacyJSON(t *testing.T) {
+	s := newTestStore(t)
+	ctx := context.Background()
+
+	// A row saved before migration 15: base64 values in the data column and
+	// no records.
+	if _, err := s.db.ExecContext(ctx,
+		`INSERT INTO vault_blob (id, salt, data) VALUES (1, ?, ?)`,
+		[]byte("legacy-salt"), `{"k":"`+base64.StdEncoding.EncodeToString([]byte{0, 1, 0xff})+`"}`); err != nil {
+		t.Fatalf("insert legacy row: %v", err)
+	}
+
+	_, data, err := s.LoadVaultBlob(ctx)
+	if err != nil {
+		t.Fatalf("load failed: %v", err)
+	}
+	if got := data["k"]; string(got) != "\x00\x01\xff" {
+		t.Errorf("expected decoded legacy value, got %v", got)
+	}
+
+	// The next save adds binary records alongside data.
+	if err := s.SaveVaultBlob(ctx, []byte("legacy-salt"), data); err != nil {
+		t.Fatalf("save failed: %v", err)
+	}
+	_, data, err = s.LoadVaultBlob(ctx)
+	if err != nil || string(data["k"]) != "\x00\x01\xff" {
+		t.Errorf("after re-save: data=%v err=%v", data, err)
+	}
+}
+
+func TestVaultBlobSurvivesDowngradeAndReupgrade(t *testing.T) {
+	s := newTestStore(t)
+	ctx := context.Background()
+
+	if err := s.SaveVaultBlob(ctx, []byte("salt"), map[string][]byte{"k": []byte("v1")}); err != nil {
+		t.Fatalf("save failed: %v", err)
+	}
+
+	// Downgrade: a binary from before migration 15 reads only data.
+	var dataStr string
+	if err := s.db.QueryRowContext(ctx, `SELECT data FROM vault_blob WHERE id = 1`).Scan(&dataStr); err != nil {
+		t.Fatalf("read data column: %v", err)
+	}
+	old, err := decodeLegacyVaultData(dataStr)
+	if err != nil || string(old["k"]) != "v1" {
+		t.Fatalf("older binary would read %v, %v", old, err)
+	}
+
+	// It then saves a change the way it always did, leaving records stale.
+	legacy := `{"k":"` + base64.StdEncoding.EncodeToString([]byte("v2")) +
+		`","k2":"` + base64.StdEncoding.EncodeToString([]byte("added")) + `"}`
+	if _, err := s.db.ExecContext(ctx,
+		`INSERT INTO vault_blob (id, salt, data) VALUES (1, ?, ?)
+		 ON CONFLICT(id) DO UPDATE SET salt=excluded.salt, data=excluded.data`,
+		[]byte("salt"), legacy); err != nil {
+		t.Fatalf("legacy save: %v", err)
+	}
+
+	// Re-upgrade: the newer data wins over the stale records.
+	_, data, err := s.LoadVaultBlob(ctx)
+	if err != nil {
+		t.Fatalf("load failed: %v", err)
+	}
+	if len(data) != 2 || string(data["k"]) != "v2" || string(data["k2"]) != "added" {
+		t.Errorf("expected the older binary's write, got %q", data)
+	}
+}
+
+func TestVaultRecordsRoundTrip(t *testing.T) {
+	in := map[string][]byte{"a": []byte("x"), "empty": {}, "bin": {0, 0xff, 10}}
+	enc := encodeVaultRecords(in)
+	out, err := decodeVaultRecords(enc)
+	if err != nil {
+		t.Fatalf("decode: %v", err)
+	}
+	if len(out) != len(in) {
+		t.Fatalf("expected %d keys, got %d", len(in), len(out))
+	}
+	for k, v := range in {
+		if string(out[k]) != string(v) {
+			t.Errorf("%s: got %v, want %v", k, out[k], v)
+		}
+	}
+	if empty, err := decodeVaultRecords(encodeVaultRecords(nil)); err != nil || len(empty) != 0 {
+		t.Errorf("empty vault: got %v, %v", empty, err)
+	}
+	if _, err := decodeVaultRecords(enc[:len(enc)-1]); err == nil {
+		t.Error("expected error for truncated records")
+	}
+
+	// Decoded values alias the encoded buffer but are capped, so growing
+	// one leaves its neighbour intact.
+	out["a"] = append(out["a"], 'y', 'y', 'y')
+	if string(out["bin"]) != string(in["bin"]) {
+		t.Errorf("append to one value clobbered another: bin = %v", out["bin"])
+	}
+}
+
 func TestAuditLog(t *testing.T) {
 	s := newTestStore(t)
 	ctx := context.Background()
@@ -28,6 +28,7 @@ type Store interface {
 	ListModels(ctx context.Context) ([]ModelRecord, error)
 	GetModel(ctx context.Context, id string) (*ModelRecord, error)
 	UpsertModel(ctx context.Context, m ModelRecord) error
+	UpsertModels(ctx context.Context, models []ModelRecord) error
 	DeleteModel(ctx context.Context, id string) error
 
 	// Providers
@@ -40,9 +41,9 @@ type Store interface {
 	ListRequestLogs(ctx context.Context, limit int, offset int) ([]RequestLog, error)
 	GetMonthlySpend(ctx context.Context, apiKeyID string) (float64, error)
 
-	// Vault persistence
-	SaveVaultBlob(ctx context.Context, salt []byte, data map[string]string) error
-	LoadVaultBlob(ctx context.Context) (salt []byte, data map[string]string, err error)
+	// Vault persistence. data maps each vault key to its encrypted value.
+	SaveVaultBlob(ctx context.Context, salt []byte, data map[string][]byte) error
+	LoadVaultBlob(ctx context.Context) (salt []byte, data map[string][]byte, err error)
 
 	// Routing config persistence
 	SaveRoutingConfig(ctx context.Context, cfg RoutingConfig) error
@@ -57,6 +58,9 @@ type Store interface {
 	ListRewards(ctx context.Context, limit int, offset int) ([]RewardEntry, error)
 	GetRewardSummary(ctx context.Context) ([]RewardSummary, error)
 
+	// LogBatch writes request and reward logs in a single transaction.
+	LogBatch(ctx context.Context, requests []RequestLog, rewards []RewardEntry) error
+
 	// API key management
 	CreateAPIKey(ctx context.Context, key APIKeyRecord) error
 	GetAPIKey(ctx context.Context, id string) (*APIKeyRecord, error)
@@ -109,9 +113,9 @@ type ModelRecord struct {
 	InputPer1K       float64           `json:"input_per_1k"`
 	OutputPer1K      float64           `json:"output_per_1k"`
 	Enabled          bool              `json:"enabled"`
+	Gemma4Output     bool              `json:"gemma4_output,omitempty"`
 	PricingSource    string            `json:"pricing_source"` // "manual" | "litellm" | "provider"
 	ToolNameMap      map[string]string `json:"tool_name_map,omitempty"`
-	Gemma4Output     bool              `json:"gemma4_output,omitempty"`
 }
 
 // ProviderRecord is the persisted form of a provider configuration.
@@ -0,0 +1,112 @@
+package store
+
+import (
+	"encoding/base64"
+	"encoding/binary"
+	"encoding/json"
+	"errors"
+	"fmt"
+	"sort"
+)
+
+// vaultRecordsVersion is the first byte of an encoded vault_blob.records
+// value. The byte also keeps an empty vault distinguishable from a row that
+// predates the records column.
+const vaultRecordsVersion = 1
+
+// encodeVaultRecords serializes vault values as a version byte followed by
+// one record per key, in key order:
+//
+//	uvarint(len(key)) key uvarint(len(value)) value
+//
+// Values are stored as raw bytes; the JSON encoding it replaces held them
+// as base64, a third larger and an extra pass over every value.
+func encodeVaultRecords(data map[string][]byte) []byte {
+	keys := make([]string, 0, len(data))
+	n := 1
+	for k, v := range data {
+		keys = append(keys, k)
+		n += 2*binary.MaxVarintLen64 + len(k) + len(v)
+	}
+	sort.Strings(keys)
+
+	buf := make([]byte, 1, n)
+	buf[0] = vaultRecordsVersion
+	for _, k := range keys {
+		v := data[k]
+		buf = binary.AppendUvarint(buf, uint64(len(k)))
+		buf = append(buf, k...)
+		buf = binary.AppendUvarint(buf, uint64(len(v)))
+		buf = append(buf, v...)
+	}
+	return buf
+}
+
+var errTruncatedVaultRecords = errors.New("truncated vault record")
+
+// decodeVaultRecords parses the output of encodeVaultRecords. Values are
+// sub-slices of b rather than copies, capped so appending to one cannot
+// overwrite the next; the caller must own b and not modify it afterwards.
+func decodeVaultRecords(b []byte) (map[string][]byte, error) {
+	if len(b) == 0 || b[0] != vaultRecordsVersion {
+		return nil, fmt.Errorf("unsupported vault records version")
+	}
+	b = b[1:]
+
+	next := func() ([]byte, error) {
+		n, w := binary.Uvarint(b)
+		if w <= 0 || n > uint64(len(b)-w) {
+			return nil, errTruncatedVaultRecords
+		}
+		field := b[w : w+int(n) : w+int(n)]
+		b = b[w+int(n):]
+		return field, nil
+	}
+
+	data := make(map[string][]byte)
+	for len(b) > 0 {
+		k, err := next()
+		if err != nil {
+			return nil, err
+		}
+		v, err := next()
+		if err != nil {
+			return nil, err
+		}
+		data[string(k)] = v
+	}
+	return data, nil
+}
+
+// encodeLegacyVaultData produces the vault_blob.data column as binaries
+// from before migration 15 read and write it: a JSON object mapping each
+// key to its base64 value, with keys sorted.
+func encodeLegacyVaultData(data map[string][]byte) (string, error) {
+	encoded := make(map[string]string, len(data))
+	for k, v := range data {
+		encoded[k] = base64.StdEncoding.EncodeToString(v)
+	}
+	j, err := json.Marshal(encoded)
+	if err != nil {
+		return "", err
+	}
+	return string(j), nil
+}
+
+// decodeLegacyVaultData reads the vault_blob.data column written before
+// migration 15: a JSON object mapping each key to its base64 value.
+func decodeLegacyVaultData(s string) (map[string][]byte, error) {
+	var encoded map[string]string
+	if err := json.Unmarshal([]byte(s), &encoded); err != nil {
+		return nil, err
+	}
+	data := make(map[string][]byte, len(encoded))
+	for k, v := range encoded {
+		raw, err := base64.StdEncoding.DecodeString(v)
+		if err != nil {
+			return nil, fmt.Errorf("decode key %s: %w", k, err)
+		}
+		data[k] = raw
+	}
+	return data, nil
+}
@@ -230,14 +230,11 @@ func (a *Activities) StreamLogResult(ctx context.Context, input StreamLogInput)
 	}
 
 	if a.Metrics != nil {
-		status := "ok"
-		if !input.Success {
-			status = "error"
-		}
-		a.Metrics.RequestsTotal.WithLabelValues(input.Mode, input.ModelID, input.ProviderID, status).Inc()
+		rm := a.Metrics.Route(input.Mode, input.ModelID, input.ProviderID, input.Success)
+		rm.Requests.Inc()
 		if input.Success {
-			a.Metrics.RequestLatency.WithLabelValues(input.Mode, input.ModelID, input.ProviderID).Observe(float64(input.LatencyMs))
-			a.Metrics.CostUSD.WithLabelValues(input.ModelID, input.ProviderID).Add(input.CostUSD)
+			rm.Latency.Observe(float64(input.LatencyMs))
+			rm.CostUSD.Add(input.CostUSD)
 		}
 	}
 
@@ -327,19 +324,16 @@ func (a *Activities) LogResult(ctx context.Context, input LogInput) error {
 	}
 
 	if a.Metrics != nil {
-		status := "ok"
-		if !input.Success {
-			status = "error"
-		}
-		a.Metrics.RequestsTotal.WithLabelValues(input.Mode, input.ModelID, input.ProviderID, status).Inc()
+		rm := a.Metrics.Route(input.Mode, input.ModelID, input.ProviderID, input.Success)
+		rm.Requests.Inc()
 		if input.Success {
-			a.Metrics.RequestLatency.WithLabelValues(input.Mode, input.ModelID, input.ProviderID).Observe(float64(input.LatencyMs))
-			a.Metrics.CostUSD.WithLabelValues(input.ModelID, input.ProviderID).Add(input.CostUSD)
+			rm.Latency.Observe(float64(input.LatencyMs))
+			rm.CostUSD.Add(input.CostUSD)
 			if input.InputTokens > 0 {
-				a.Metrics.TokensTotal.WithLabelValues(input.ModelID, input.ProviderID, "input").Add(float64(input.InputTokens))
+				rm.InputTokens.Add(float64(input.InputTokens))
 			}
 			if input.OutputTokens > 0 {
-				a.Metrics.TokensTotal.WithLabelValues(input.ModelID, input.ProviderID, "output").Add(float64(input.OutputTokens))
+				rm.OutputTokens.Add(float64(input.OutputTokens))
 			}
 		}
 	}
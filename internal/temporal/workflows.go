@@ -3,6 +3,7 @@ package temporal
 import (
 	"encoding/json"
 	"fmt"
+	"strings"
 	"time"
 
 	"go.temporal.io/sdk/temporal"
@@ -166,11 +167,14 @@ func adversarialWorkflow(ctx workflow.Context, input OrchestrationInput, start t
 		iterations = 1
 	}
 
+	// The user's text is embedded in every phase's prompt; flatten it once.
+	original := router.MessagesContent(input.Request.Messages)
+
 	// Phase 1: Generate plan.
 	planReq := router.Request{
 		Messages: []router.Message{
-			{Role: "system", Content: "You are a planning assistant. Generate a detailed plan to address the user's request."},
-			{Role: "user", Content: router.MessagesContent(input.Request.Messages)},
+			{Role: "system", Content: router.PlannerSystemPrompt},
+			{Role: "user", Content: original},
 		},
 	}
 	planInput := ChatInput{
@@ -197,8 +201,8 @@ func adversarialWorkflow(ctx workflow.Context, input OrchestrationInput, start t
 		// Phase 2: Critique.
 		critiqueReq := router.Request{
 			Messages: []router.Message{
-				{Role: "system", Content: "You are a critical reviewer. Analyze the plan below and provide constructive criticism."},
-				{Role: "user", Content: fmt.Sprintf("Original request: %s\n\nProposed plan:\n%s\n\nProvide your critique:", router.MessagesContent(input.Request.Messages), plan)},
+				{Role: "system", Content: router.CriticSystemPrompt},
+				{Role: "user", Content: router.CritiquePrompt(original, plan)},
 			},
 		}
 		critiqueInput := ChatInput{
@@ -221,8 +225,8 @@ func adversarialWorkflow(ctx workflow.Context, input OrchestrationInput, start t
 		// Phase 3: Refine.
 		refineReq := router.Request{
 			Messages: []router.Message{
-				{Role: "system", Content: "You are a planning assistant. Refine your plan based on the critique provided."},
-				{Role: "user", Content: fmt.Sprintf("Original request: %s\n\nYour plan:\n%s\n\nCritique:\n%s\n\nProvide a refined plan:", router.MessagesContent(input.Request.Messages), plan, critique)},
+				{Role: "system", Content: router.RefinePlanSystemPrompt},
+				{Role: "user", Content: router.RefinePlanPrompt(original, plan, critique)},
 			},
 		}
 		refineInput := ChatInput{
@@ -331,15 +335,15 @@ func voteWorkflow(ctx workflow.Context, input OrchestrationInput, start time.Tim
 	}
 
 	// Judge phase.
-	var responseSummary string
+	var responseSummary strings.Builder
 	for i, r := range results {
-		responseSummary += fmt.Sprintf("\n--- Response %d (model: %s) ---\n%s\n", i+1, r.modelID, r.content)
+		router.WriteJudgeCandidate(&responseSummary, i+1, r.modelID, r.content)
 	}
 
 	judgeReq := router.Request{
 		Messages: []router.Message{
-			{Role: "system", Content: "You are a judge. Given multiple AI responses to the same prompt, select the best one. Reply with ONLY the number (1-based) of the best response."},
-			{Role: "user", Content: fmt.Sprintf("Original prompt: %s\n\nResponses:%s\n\nWhich response number is best?", router.MessagesContent(input.Request.Messages), responseSummary)},
+			{Role: "system", Content: router.JudgeSystemPrompt},
+			{Role: "user", Content: router.JudgePrompt(router.MessagesContent(input.Request.Messages), responseSummary.String())},
 		},
 	}
 	if input.Directive.ReviewModelID != "" {
@@ -431,6 +435,7 @@ func refineWorkflow(ctx workflow.Context, input OrchestrationInput, start time.T
 	}
 
 	currentContent := router.ExtractContent(initialOutput.Response)
+	original := router.MessagesContent(input.Request.Messages)
 	totalCost := initialOutput.Decision.EstimatedCostUSD
 	lastDecision := initialOutput.Decision
 
@@ -438,8 +443,8 @@ func refineWorkflow(ctx workflow.Context, input OrchestrationInput, start time.T
 	for i := 0; i < iterations; i++ {
 		refineReq := router.Request{
 			Messages: []router.Message{
-				{Role: "system", Content: "Review and improve the following response. Fix any errors, add missing details, and improve clarity."},
-				{Role: "user", Content: fmt.Sprintf("Original request: %s\n\nCurrent response:\n%s\n\nProvide an improved version:", router.MessagesContent(input.Request.Messages), currentContent)},
+				{Role: "system", Content: router.ImproveSystemPrompt},
+				{Role: "user", Content: router.ImprovePrompt(original, currentContent)},
 			},
 		}
 
@@ -0,0 +1,133 @@
+package vault
+
+import (
+	"crypto/hmac"
+	"crypto/rand"
+	"crypto/sha256"
+	"encoding/binary"
+	"sync"
+
+	"golang.org/x/crypto/argon2"
+)
+
+// keyCacheSize bounds the number of derived keys held in memory at once.
+const keyCacheSize = 32
+
+// keyCacheID identifies a derivation by (password, salt, Argon2id params).
+// It is an HMAC under a per-process secret so a leaked ID cannot be used to
+// test password guesses faster than Argon2id allows.
+type keyCacheID [sha256.Size]byte
+
+// keyCache memoizes Argon2id output so re-deriving the same key (verifying
+// the old password in RotatePassword, unlocking a second Vault restored
+// from the same salt) skips a 64 MB, multi-pass KDF run. Entries are
+// dropped and zeroed when the owning vault locks, so a locked vault leaves
+// no key material behind.
+var keyCache = struct {
+	sync.Mutex
+	secret  []byte
+	entries map[keyCacheID][]byte
+	order   []keyCacheID // least recently used first
+}{
+	entries: make(map[keyCacheID][]byte),
+}
+
+func init() {
+	keyCache.secret = make([]byte, 32)
+	if _, err := rand.Read(keyCache.secret); err != nil {
+		panic("vault: failed to seed key cache: " + err.Error())
+	}
+}
+
+func keyCacheIDFor(password, salt []byte) keyCacheID {
+	var params [20]byte
+	binary.BigEndian.PutUint32(params[0:], argon2Time)
+	binary.BigEndian.PutUint32(params[4:], argon2Memory)
+	binary.BigEndian.PutUint32(params[8:], argon2Threads)
+	binary.BigEndian.PutUint32(params[12:], argon2KeyLen)
+	binary.BigEndian.PutUint32(params[16:], uint32(len(salt)))
+
+	mac := hmac.New(sha256.New, keyCache.secret)
+	mac.Write(params[:])
+	mac.Write(salt)
+	mac.Write(password)
+
+	var id keyCacheID
+	copy(id[:], mac.Sum(nil))
+	return id
+}
+
+// deriveKey returns the Argon2id key for password and salt along with its
+// cache ID. The returned slice is a private copy the caller may zero.
+func deriveKey(password, salt []byte) ([]byte, keyCacheID) {
+	id := keyCacheIDFor(password, salt)
+
+	keyCache.Lock()
+	if cached, ok := keyCache.entries[id]; ok {
+		key := append([]byte(nil), cached...)
+		touchKeyLocked(id)
+		keyCache.Unlock()
+		return key, id
+	}
+	keyCache.Unlock()
+
+	key := argon2.IDKey(password, salt, argon2Time, argon2Memory, argon2Threads, argon2KeyLen)
+
+	keyCache.Lock()
+	defer keyCache.Unlock()
+	if _, ok := keyCache.entries[id]; !ok {
+		if len(keyCache.order) >= keyCacheSize {
+			forgetKeyLocked(keyCache.order[0])
+		}
+		keyCache.entries[id] = append([]byte(nil), key...)
+		keyCache.order = append(keyCache.order, id)
+	}
+	return key, id
+}
+
+// touchKeyLocked moves id to the most recently used end of the eviction
+// order, so a key in active use is not evicted by a burst of other
+// derivations.
+func touchKeyLocked(id keyCacheID) {
+	for i, o := range keyCache.order {
+		if o == id {
+			copy(keyCache.order[i:], keyCache.order[i+1:])
+			keyCache.order[len(keyCache.order)-1] = id
+			return
+		}
+	}
+}
+
+// forgetKey zeroes and removes a cached key. Unknown IDs are ignored.
+func forgetKey(id keyCacheID) {
+	keyCache.Lock()
+	defer keyCache.Unlock()
+	forgetKeyLocked(id)
+}
+
+func forgetKeyLocked(id keyCacheID) {
+	key, ok := keyCache.entries[id]
+	if !ok {
+		return
+	}
+	for i := range key {
+		key[i] = 0
+	}
+	delete(keyCache.entries, id)
+	for i, o := range keyCache.order {
+		if o == id {
+			keyCache.order = append(keyCache.order[:i], keyCache.order[i+1:]...)
+			break
+		}
+	}
+}
+
+// clearKeyCache drops every cached key. Tests use it to exercise the
+// uncached derivation path.
+func clearKeyCache() {
+	keyCache.Lock()
+	defer keyCache.Unlock()
+	for len(keyCache.order) > 0 {
+		forgetKeyLocked(keyCache.order[0])
+	}
+}
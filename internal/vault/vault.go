@@ -5,7 +5,6 @@ import (
 	"crypto/cipher"
 	"crypto/rand"
 	"crypto/subtle"
-	"encoding/base64"
 	"errors"
 	"fmt"
 	"io"
@@ -13,8 +12,6 @@ import (
 	"strings"
 	"sync"
 	"time"
-
-	"golang.org/x/crypto/argon2"
 )
 
 const defaultAutoLockAfter = 30 * time.Minute
@@ -61,6 +58,15 @@ type Vault struct {
 	// derived key (in-memory only; cleared on lock)
 	key []byte
 
+	// aead is AES-256-GCM keyed with key, built once per unlock so Set and
+	// Get skip the AES key expansion. It is stateless and safe for
+	// concurrent Seal/Open under mu.RLock; nil while locked.
+	aead cipher.AEAD
+
+	// keyID identifies key in the shared derivation cache so Lock can
+	// evict it along with the vault's own copy.
+	keyID keyCacheID
+
 	// encrypted KV store
 	values map[string][]byte
 
@@ -109,7 +115,16 @@ func (v *Vault) Unlock(master []byte) error {
 		}
 	}
 
-	v.key = argon2.IDKey(master, v.salt, argon2Time, argon2Memory, argon2Threads, argon2KeyLen)
+	key, id := deriveKey(master, v.salt)
+	aead, err := newAEAD(key)
+	if err != nil {
+		return err
+	}
+	if v.key != nil && id != v.keyID {
+		forgetKey(v.keyID)
+	}
+	v.key, v.keyID = key, id
+	v.aead = aead
 	v.locked = false
 	v.lastActivity = time.Now()
 
@@ -139,6 +154,9 @@ func (v *Vault) lockLocked() {
 		v.key[i] = 0
 	}
 	v.key = nil
+	v.aead = nil
+	forgetKey(v.keyID)
+	v.keyID = keyCacheID{}
 	v.locked = true
 }
 
@@ -183,6 +201,39 @@ func (v *Vault) Set(key, value string) error {
 	return nil
 }
 
+// SetMany encrypts and stores several values at once, as when loading
+// provider credentials at startup. It takes the lock once and draws every
+// nonce from a single read of the system RNG. Either all values are
+// stored or, on error, none are.
+func (v *Vault) SetMany(values map[string]string) error {
+	if len(values) == 0 {
+		return nil
+	}
+	v.Touch()
+	v.mu.Lock()
+	defer v.mu.Unlock()
+	if v.enabled && v.locked {
+		return errors.New("vault locked")
+	}
+	gcm := v.aead
+	if gcm == nil {
+		return errors.New("no key")
+	}
+	ns := gcm.NonceSize()
+	nonces := make([]byte, ns*len(values))
+	if _, err := io.ReadFull(rand.Reader, nonces); err != nil {
+		return err
+	}
+	for key, value := range values {
+		nonce := nonces[:ns:ns]
+		nonces = nonces[ns:]
+		out := make([]byte, ns, ns+len(value)+gcm.Overhead())
+		copy(out, nonce)
+		v.values[key] = gcm.Seal(out, nonce, []byte(value), nil)
+	}
+	return nil
+}
+
 // Get decrypts and retrieves a value.
 func (v *Vault) Get(key string) (string, error) {
 	v.Touch()
@@ -200,11 +251,18 @@ func (v *Vault) Get(key string) (string, error) {
 	return string(plaintext), nil
 }
 
-// Delete removes a value from the vault.
-func (v *Vault) Delete(key string) {
+// Delete removes a value from the vault and reports whether it was present.
+// No decryption is involved, so callers can use it as the existence check.
+// Like the other secret operations it counts as activity for auto-lock.
+func (v *Vault) Delete(key string) bool {
 	v.mu.Lock()
 	defer v.mu.Unlock()
+	v.lastActivity = time.Now()
+	if _, ok := v.values[key]; !ok {
+		return false
+	}
 	delete(v.values, key)
+	return true
 }
 
 // IsEnabled reports whether vault encryption is enabled for this instance.
@@ -237,27 +295,34 @@ func (v *Vault) Keys(prefix string) ([]string, error) {
 	return keys, nil
 }
 
-// Export exports the encrypted vault data (for persistence).
-func (v *Vault) Export() map[string]string {
+// Export returns a copy of the encrypted vault data (for persistence). Values
+// are the raw nonce||ciphertext||tag bytes; the store decides how to encode
+// them.
+func (v *Vault) Export() map[string][]byte {
 	v.mu.RLock()
 	defer v.mu.RUnlock()
-	exported := make(map[string]string, len(v.values))
+	exported := make(map[string][]byte, len(v.values))
 	for k, val := range v.values {
-		exported[k] = base64.StdEncoding.EncodeToString(val)
+		exported[k] = append([]byte(nil), val...)
 	}
 	return exported
 }
 
-// Import imports encrypted vault data.
-func (v *Vault) Import(data map[string]string) error {
+// sealedOverhead is the GCM nonce plus tag carried by every stored value.
+const sealedOverhead = 12 + 16
+
+// Import imports encrypted vault data as produced by Export. Nothing is
+// imported if any value is too short to be a sealed value.
+func (v *Vault) Import(data map[string][]byte) error {
+	for k, val := range data {
+		if len(val) < sealedOverhead {
+			return fmt.Errorf("invalid encrypted value for key %s", k)
+		}
+	}
 	v.mu.Lock()
 	defer v.mu.Unlock()
-	for k, encValue := range data {
-		decoded, err := base64.StdEncoding.DecodeString(encValue)
-		if err != nil {
-			return fmt.Errorf("failed to decode key %s: %w", k, err)
-		}
-		v.values[k] = decoded
+	for k, val := range data {
+		v.values[k] = append([]byte(nil), val...)
 	}
 	return nil
 }
@@ -268,18 +333,13 @@ func (v *Vault) Encrypt(plaintext []byte) ([]byte, error) {
 	if v.enabled && v.locked {
 		return nil, errors.New("vault locked")
 	}
-	if len(v.key) != 32 {
+	gcm := v.aead
+	if gcm == nil {
 		return nil, errors.New("no key")
 	}
-	block, err := aes.NewCipher(v.key)
-	if err != nil {
-		return nil, err
-	}
-	gcm, err := cipher.NewGCM(block)
-	if err != nil {
-		return nil, err
-	}
-	nonce := make([]byte, gcm.NonceSize())
+	// Size the buffer for nonce, ciphertext and tag up front so Seal
+	// appends in place instead of growing the nonce slice.
+	nonce := make([]byte, gcm.NonceSize(), gcm.NonceSize()+len(plaintext)+gcm.Overhead())
 	if _, err := io.ReadFull(rand.Reader, nonce); err != nil {
 		return nil, err
 	}
@@ -293,18 +353,14 @@ func (v *Vault) Decrypt(ciphertext []byte) ([]byte, error) {
 	if v.enabled && v.locked {
 		return nil, errors.New("vault locked")
 	}
-	if len(v.key) != 32 {
+	gcm := v.aead
+	if gcm == nil {
 		return nil, errors.New("no key")
 	}
-	block, err := aes.NewCipher(v.key)
-	if err != nil {
-		return nil, err
-	}
-	gcm, err := cipher.NewGCM(block)
-	if err != nil {
-		return nil, err
-	}
-	if len(ciphertext) < gcm.NonceSize() {
+	// GCM authenticates before returning any plaintext, with a constant-time
+	// tag check, so a tampered value fails as a whole. Anything shorter than
+	// nonce plus tag cannot be authentic and is rejected without opening.
+	if len(ciphertext) < gcm.NonceSize()+gcm.Overhead() {
 		return nil, errors.New("ciphertext too short")
 	}
 	nonce := ciphertext[:gcm.NonceSize()]
@@ -316,6 +372,15 @@ func (v *Vault) Decrypt(ciphertext []byte) ([]byte, error) {
 	return plain, nil
 }
 
+// newAEAD returns AES-256-GCM keyed with key.
+func newAEAD(key []byte) (cipher.AEAD, error) {
+	block, err := aes.NewCipher(key)
+	if err != nil {
+		return nil, err
+	}
+	return cipher.NewGCM(block)
+}
+
 // RotatePassword re-encrypts all stored values with a new password.
 // The vault must be unlocked and enabled. The new password must be at least 8 bytes.
 // This operation is atomic: all values are decrypted, a new salt and key are
@@ -336,22 +401,18 @@ func (v *Vault) RotatePassword(oldPassword, newPassword []byte) error {
 	}
 
 	// Verify the old password matches the current key.
-	derivedKey := argon2.IDKey(oldPassword, v.salt, argon2Time, argon2Memory, argon2Threads, argon2KeyLen)
+	// The current key came through deriveKey, so a correct old password is
+	// a cache hit; a wrong one is evicted again immediately.
+	derivedKey, derivedID := deriveKey(oldPassword, v.salt)
 	if subtle.ConstantTimeCompare(derivedKey, v.key) != 1 {
+		forgetKey(derivedID)
 		return errors.New("old password does not match")
 	}
 
 	// Step 1: Decrypt all values with the current key.
+	gcm := v.aead
 	plaintext := make(map[string][]byte, len(v.values))
 	for k, ciphertext := range v.values {
-		block, err := aes.NewCipher(v.key)
-		if err != nil {
-			return fmt.Errorf("failed to create cipher for key %s: %w", k, err)
-		}
-		gcm, err := cipher.NewGCM(block)
-		if err != nil {
-			return fmt.Errorf("failed to create GCM for key %s: %w", k, err)
-		}
 		if len(ciphertext) < gcm.NonceSize() {
 			return fmt.Errorf("ciphertext too short for key %s", k)
 		}
@@ -371,30 +432,35 @@ func (v *Vault) RotatePassword(oldPassword, newPassword []byte) error {
 	}
 
 	// Step 3: Derive a new key from the new password.
-	newKey := argon2.IDKey(newPassword, newSalt, argon2Time, argon2Memory, argon2Threads, argon2KeyLen)
+	newKey, newKeyID := deriveKey(newPassword, newSalt)
+	rotated := false
+	defer func() {
+		if !rotated {
+			forgetKey(newKeyID)
+		}
+	}()
 
 	// Step 4: Re-encrypt all values with the new key.
+	newGCM, err := newAEAD(newKey)
+	if err != nil {
+		return fmt.Errorf("failed to create cipher for re-encryption: %w", err)
+	}
 	newValues := make(map[string][]byte, len(plaintext))
 	for k, plain := range plaintext {
-		block, err := aes.NewCipher(newKey)
-		if err != nil {
-			return fmt.Errorf("failed to create cipher for re-encryption of key %s: %w", k, err)
-		}
-		gcm, err := cipher.NewGCM(block)
-		if err != nil {
-			return fmt.Errorf("failed to create GCM for re-encryption of key %s: %w", k, err)
-		}
-		nonce := make([]byte, gcm.NonceSize())
+		nonce := make([]byte, newGCM.NonceSize())
 		if _, err := io.ReadFull(rand.Reader, nonce); err != nil {
 			return fmt.Errorf("failed to generate nonce for key %s: %w", k, err)
 		}
-		newValues[k] = gcm.Seal(nonce, nonce, plain, nil)
+		newValues[k] = newGCM.Seal(nonce, nonce, plain, nil)
 	}
 
 	// Step 5: Atomically update the vault state.
+	forgetKey(v.keyID)
 	v.salt = newSalt
-	v.key = newKey
+	v.key, v.keyID = newKey, newKeyID
+	v.aead = newGCM
 	v.values = newValues
+	rotated = true
 	v.lastActivity = time.Now()
 
 	return nil
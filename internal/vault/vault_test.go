@@ -1,10 +1,16 @@
 package vault
 
 import (
+	"fmt"
+	"sync"
 	"testing"
 	"time"
 )
 
+// Tests that only touch their own Vault run in parallel, since each spends
+// most of its time in Argon2id. Tests that inspect the shared keyCache or
+// depend on auto-lock timing stay serial.
+
 func unlocked(t *testing.T) *Vault {
 	t.Helper()
 	v, err := New(true)
@@ -18,6 +24,7 @@ func unlocked(t *testing.T) *Vault {
 }
 
 func TestVault_SetAndGet(t *testing.T) {
+	t.Parallel()
 	v := unlocked(t)
 
 	if err := v.Set("test_key", "secret_value"); err != nil {
@@ -34,6 +41,7 @@ func TestVault_SetAndGet(t *testing.T) {
 }
 
 func TestVault_GetNonExistent(t *testing.T) {
+	t.Parallel()
 	v := unlocked(t)
 
 	_, err := v.Get("nonexistent")
@@ -43,13 +51,30 @@ func TestVault_GetNonExistent(t *testing.T) {
 }
 
 func TestVault_Delete(t *testing.T) {
+	t.Parallel()
 	v := unlocked(t)
 
 	if err := v.Set("test_key", "secret_value"); err != nil {
 		t.Fatalf("Set: %v", err)
 	}
 
-	v.Delete("test_key")
+	if !v.Delete("test_key") {
+		t.Error("expected Delete to report the key as present")
+	}
+	if v.Delete("test_key") {
+		t.Error("expected second Delete to report the key as absent")
+	}
+
+	v.mu.Lock()
+	v.lastActivity = time.Time{}
+	v.mu.Unlock()
+	v.Delete("missing")
+	v.mu.RLock()
+	touched := !v.lastActivity.IsZero()
+	v.mu.RUnlock()
+	if !touched {
+		t.Error("expected Delete to reset the auto-lock idle timer")
+	}
 
 	_, err := v.Get("test_key")
 	if err == nil {
@@ -58,6 +83,7 @@ func TestVault_Delete(t *testing.T) {
 }
 
 func TestVault_ExportImport(t *testing.T) {
+	t.Parallel()
 	password := []byte("a]strong-password-for-testing!!")
 	v1, err := New(true)
 	if err != nil {
@@ -102,6 +128,7 @@ func TestVault_ExportImport(t *testing.T) {
 }
 
 func TestVault_LockedOperationsFail(t *testing.T) {
+	t.Parallel()
 	v, err := New(true)
 	if err != nil {
 		t.Fatalf("New: %v", err)
@@ -125,6 +152,7 @@ func TestVault_LockedOperationsFail(t *testing.T) {
 }
 
 func TestVault_UnlockPasswordTooShort(t *testing.T) {
+	t.Parallel()
 	v, err := New(true)
 	if err != nil {
 		t.Fatalf("New: %v", err)
@@ -137,6 +165,7 @@ func TestVault_UnlockPasswordTooShort(t *testing.T) {
 }
 
 func TestVault_Argon2idDerivesDifferentKeys(t *testing.T) {
+	t.Parallel()
 	// Two vaults with same password but different salts should produce different keys.
 	v1 := unlocked(t)
 	v2 := unlocked(t)
@@ -162,6 +191,7 @@ func TestVault_Argon2idDerivesDifferentKeys(t *testing.T) {
 }
 
 func TestVault_SaltPersistence(t *testing.T) {
+	t.Parallel()
 	v, err := New(true)
 	if err != nil {
 		t.Fatalf("New: %v", err)
@@ -201,6 +231,7 @@ func TestVault_SaltPersistence(t *testing.T) {
 }
 
 func TestVault_LockClearsKey(t *testing.T) {
+	t.Parallel()
 	v := unlocked(t)
 
 	if err := v.Set("k", "v"); err != nil {
@@ -241,6 +272,7 @@ func TestAutoLock(t *testing.T) {
 }
 
 func TestRotatePassword(t *testing.T) {
+	t.Parallel()
 	v := unlocked(t)
 
 	// Store some values.
@@ -304,6 +336,7 @@ func TestRotatePassword(t *testing.T) {
 }
 
 func TestRotatePasswordWrongOldPassword(t *testing.T) {
+	t.Parallel()
 	v := unlocked(t)
 
 	// Store a value so rotation has work to do.
@@ -333,6 +366,7 @@ func TestRotatePasswordWrongOldPassword(t *testing.T) {
 }
 
 func TestRotatePasswordTooShort(t *testing.T) {
+	t.Parallel()
 	v := unlocked(t)
 
 	oldPassword := []byte("a]strong-password-for-testing!!")
@@ -345,6 +379,7 @@ func TestRotatePasswordTooShort(t *testing.T) {
 }
 
 func TestRotatePasswordWhileLocked(t *testing.T) {
+	t.Parallel()
 	v, err := New(true)
 	if err != nil {
 		t.Fatalf("New: %v", err)
@@ -358,6 +393,7 @@ func TestRotatePasswordWhileLocked(t *testing.T) {
 }
 
 func TestAutoLockDisabled(t *testing.T) {
+	t.Parallel()
 	// WithAutoLockDuration(0) should disable auto-locking entirely.
 	v, err := New(true, WithAutoLockDuration(0))
 	if err != nil {
@@ -403,3 +439,214 @@ func TestAutoLockTouch(t *testing.T) {
 		t.Error("expected vault to be auto-locked after Touch() stopped")
 	}
 }
+
+func TestDeriveKeyCache(t *testing.T) {
+	clearKeyCache()
+	t.Cleanup(clearKeyCache)
+
+	password := []byte("a]strong-password-for-testing!!")
+	v1 := unlocked(t)
+
+	// A second vault restored from the same salt reuses the cached key.
+	v2, _ := New(true)
+	v2.SetSalt(v1.Salt())
+	if err := v2.Unlock(password); err != nil {
+		t.Fatalf("Unlock v2: %v", err)
+	}
+	if v1.keyID != v2.keyID {
+		t.Fatal("expected both vaults to share a key cache entry")
+	}
+	if string(v1.key) != string(v2.key) {
+		t.Fatal("expected identical derived keys")
+	}
+	if len(keyCache.entries) != 1 {
+		t.Errorf("expected 1 cached key, got %d", len(keyCache.entries))
+	}
+
+	// The vault holds its own copy, so zeroing it on lock must not corrupt
+	// the key still in use by v2.
+	v2Key := append([]byte(nil), v2.key...)
+	v1.Lock()
+	if string(v2.key) != string(v2Key) {
+		t.Error("locking v1 modified v2's key")
+	}
+	if len(keyCache.entries) != 0 {
+		t.Errorf("expected Lock to evict the cached key, got %d entries", len(keyCache.entries))
+	}
+}
+
+func TestDeriveKeyCacheWrongOldPasswordNotRetained(t *testing.T) {
+	clearKeyCache()
+	t.Cleanup(clearKeyCache)
+
+	v := unlocked(t)
+	if err := v.RotatePassword([]byte("not-the-password"), []byte("new-password-long-enough")); err == nil {
+		t.Fatal("expected error for wrong old password")
+	}
+	if len(keyCache.entries) != 1 {
+		t.Errorf("expected only the vault's own key cached, got %d entries", len(keyCache.entries))
+	}
+}
+
+func TestAEADFollowsKey(t *testing.T) {
+	t.Parallel()
+	v := unlocked(t)
+	if v.aead == nil {
+		t.Fatal("expected AEAD after unlock")
+	}
+	if err := v.Set("k", "before-rotate"); err != nil {
+		t.Fatalf("Set: %v", err)
+	}
+
+	before := v.aead
+	if err := v.RotatePassword([]byte("a]strong-password-for-testing!!"), []byte("another-strong-password!!")); err != nil {
+		t.Fatalf("RotatePassword: %v", err)
+	}
+	if v.aead == before {
+		t.Error("expected RotatePassword to replace the AEAD")
+	}
+	if got, err := v.Get("k"); err != nil || got != "before-rotate" {
+		t.Fatalf("Get after rotate = %q, %v", got, err)
+	}
+
+	v.Lock()
+	if v.aead != nil {
+		t.Error("expected Lock to drop the AEAD")
+	}
+}
+
+func TestDecryptRejectsTamperedCiphertext(t *testing.T) {
+	t.Parallel()
+	v := unlocked(t)
+	sealed, err := v.Encrypt([]byte("sk-secret"))
+	if err != nil {
+		t.Fatalf("Encrypt: %v", err)
+	}
+	if len(sealed) != sealedOverhead+len("sk-secret") {
+		t.Fatalf("sealed length = %d, want %d", len(sealed), sealedOverhead+len("sk-secret"))
+	}
+
+	// Flipping any byte of nonce, ciphertext or tag must fail authentication.
+	for i := range sealed {
+		tampered := append([]byte(nil), sealed...)
+		tampered[i] ^= 0x01
+		if plain, err := v.Decrypt(tampered); err == nil || plain != nil {
+			t.Fatalf("byte %d: expected authentication failure, got %q, %v", i, plain, err)
+		}
+	}
+
+	if _, err := v.Decrypt(sealed[:sealedOverhead-1]); err == nil {
+		t.Error("expected error for value shorter than nonce plus tag")
+	}
+	if plain, err := v.Decrypt(sealed); err != nil || string(plain) != "sk-secret" {
+		t.Fatalf("Decrypt = %q, %v", plain, err)
+	}
+}
+
+func TestDeriveKeyCacheEvictsLeastRecentlyUsed(t *testing.T) {
+	clearKeyCache()
+	t.Cleanup(clearKeyCache)
+
+	password, salt := []byte("a]strong-password-for-testing!!"), []byte("0123456789abcdef")
+	hot := keyCacheIDFor(password, salt)
+
+	// Seed a full cache with hot as the oldest entry, without paying for
+	// keyCacheSize Argon2id runs.
+	keyCache.Lock()
+	keyCache.entries[hot] = make([]byte, argon2KeyLen)
+	keyCache.order = append(keyCache.order, hot)
+	for i := 1; i < keyCacheSize; i++ {
+		var id keyCacheID
+		id[0] = byte(i)
+		keyCache.entries[id] = make([]byte, argon2KeyLen)
+		keyCache.order = append(keyCache.order, id)
+	}
+	keyCache.Unlock()
+
+	deriveKey(password, salt)                      // hit: hot becomes most recent
+	deriveKey([]byte("some-other-password"), salt) // miss: evicts the oldest
+
+	keyCache.Lock()
+	defer keyCache.Unlock()
+	if _, ok := keyCache.entries[hot]; !ok {
+		t.Error("recently used key was evicted")
+	}
+	if len(keyCache.entries) != keyCacheSize {
+		t.Errorf("expected %d cached keys, got %d", keyCacheSize, len(keyCache.entries))
+	}
+}
+
+func TestSetMany(t *testing.T) {
+	t.Parallel()
+	v := unlocked(t)
+
+	want := map[string]string{"a": "alpha", "b": "", "c": "gamma-gamma-gamma"}
+	if err := v.SetMany(want); err != nil {
+		t.Fatalf("SetMany: %v", err)
+	}
+	for k, w := range want {
+		if got, err := v.Get(k); err != nil || got != w {
+			t.Errorf("Get(%q) = %q, %v; want %q", k, got, err, w)
+		}
+	}
+	// Each value must be sealed under its own nonce.
+	seen := make(map[string]string, len(want))
+	for k := range want {
+		nonce := string(v.values[k][:12])
+		if other, ok := seen[nonce]; ok {
+			t.Errorf("SetMany reused a nonce for %q and %q", k, other)
+		}
+		seen[nonce] = k
+	}
+
+	v.Lock()
+	if err := v.SetMany(map[string]string{"d": "delta"}); err == nil {
+		t.Error("expected error when vault is locked")
+	}
+	if _, ok := v.values["d"]; ok {
+		t.Error("a failed SetMany must not store any value")
+	}
+}
+
+func TestSetManyConcurrentWithReaders(t *testing.T) {
+	t.Parallel()
+	v := unlocked(t)
+	if err := v.Set("shared", "initial"); err != nil {
+		t.Fatalf("Set: %v", err)
+	}
+
+	var wg sync.WaitGroup
+	for i := 0; i < 4; i++ {
+		wg.Add(2)
+		go func(i int) {
+			defer wg.Done()
+			for j := 0; j < 50; j++ {
+				batch := map[string]string{
+					fmt.Sprintf("w%d-a", i): "alpha",
+					fmt.Sprintf("w%d-b", i): "beta",
+					"shared":                "updated",
+				}
+				if err := v.SetMany(batch); err != nil {
+					t.Errorf("SetMany: %v", err)
+					return
+				}
+			}
+		}(i)
+		go func() {
+			defer wg.Done()
+			for j := 0; j < 50; j++ {
+				if got, err := v.Get("shared"); err != nil || (got != "initial" && got != "updated") {
+					t.Errorf("Get(shared) = %q, %v", got, err)
+					return
+				}
+			}
+		}()
+	}
+	wg.Wait()
+
+	for i := 0; i < 4; i++ {
+		if got, err := v.Get(fmt.Sprintf("w%d-b", i)); err != nil || got != "beta" {
+			t.Errorf("Get(w%d-b) = %q, %v", i, got, err)
+		}
+	}
+}
@@ -20,45 +20,90 @@ trap cleanup EXIT
 echo "=== TokenHub Integration Tests ==="
 echo "Image: $IMAGE"
 
-# Start container with a temp SQLite DB (writable by nonroot user).
+# Start container with a temp SQLite DB (writable by nonroot user). /tmp is
+# a tmpfs so the database never touches disk and starts empty every run.
 docker run -d --name "$CONTAINER" \
     -p "$PORT:8080" \
+    --tmpfs /tmp \
     -e TOKENHUB_LISTEN_ADDR=:8080 \
     -e TOKENHUB_DB_DSN="file:/tmp/tokenhub-test.sqlite" \
     "$IMAGE"
 
+# wait_ready polls URL with exponential backoff (20ms doubling, capped at
+# 500ms) until it answers or TIMEOUT_MS elapses, so the checks start as soon
+# as the server is accepting instead of on a fixed one-second tick.
+wait_ready() {
+    local url="$1" timeout_ms="$2" delay_ms=20 waited_ms=0
+    while [ "$waited_ms" -lt "$timeout_ms" ]; do
+        if curl -sf --max-time 1 "$url" >/dev/null 2>&1; then
+            return 0
+        fi
+        echo -n "."
+        sleep "$(printf '%d.%03d' $((delay_ms / 1000)) $((delay_ms % 1000)))"
+        waited_ms=$((waited_ms + delay_ms))
+        delay_ms=$((delay_ms * 2))
+        if [ "$delay_ms" -gt 500 ]; then
+            delay_ms=500
+        fi
+    done
+    return 1
+}
+
 # Wait for server to accept connections (use /metrics — always 200).
 echo -n "Waiting for server"
-for i in $(seq 1 30); do
-    if curl -sf "http://localhost:$PORT/metrics" >/dev/null 2>&1; then
-        echo " ready"
-        break
-    fi
-    if [ "$i" -eq 30 ]; then
-        echo " TIMEOUT"
-        docker logs "$CONTAINER"
-        exit 1
-    fi
-    echo -n "."
-    sleep 1
-done
+if wait_ready "http://localhost:$PORT/metrics" 30000; then
+    echo " ready"
+else
+    echo " TIMEOUT"
+    docker logs "$CONTAINER"
+    exit 1
+fi
 
 PASS=0
 FAIL=0
 
+# Checks are queued and then issued through a single curl process so the
+# requests share its keep-alive connection pool instead of paying a fresh
+# TCP handshake per endpoint. The checks are independent, so curl runs up
+# to four of them at once; %{urlnum} maps each status back to its check.
+CHECK_NAMES=()
+CHECK_EXPECTED=()
+CURL_ARGS=()
+
 check() {
     local name="$1" method="$2" url="$3" expected_status="$4"
-    local status
-    status=$(curl -s -o /dev/null -w "%{http_code}" -X "$method" "http://localhost:$PORT$url" 2>/dev/null || echo "000")
-    if [ "$status" = "$expected_status" ]; then
-        echo "  PASS  $name (HTTP $status)"
-        PASS=$((PASS + 1))
-    else
-        echo "  FAIL  $name (expected $expected_status, got $status)"
-        FAIL=$((FAIL + 1))
+    if [ "${#CHECK_NAMES[@]}" -gt 0 ]; then
+        CURL_ARGS+=(--next)
     fi
+    CHECK_NAMES+=("$name")
+    CHECK_EXPECTED+=("$expected_status")
+    CURL_ARGS+=(-s -o /dev/null -w "%{urlnum} %{http_code}\n" -X "$method" "http://localhost:$PORT$url")
 }
 
+run_checks() {
+    local statuses=() i status
+    while read -r i status; do
+        [ -n "$i" ] && statuses[i]="$status"
+    done < <(curl --parallel --parallel-max 4 "${CURL_ARGS[@]}" 2>/dev/null || true)
+    for i in "${!CHECK_NAMES[@]}"; do
+        status="${statuses[$i]:-000}"
+        if [ "$status" = "${CHECK_EXPECTED[$i]}" ]; then
+            echo "  PASS  ${CHECK_NAMES[$i]} (HTTP $status)"
+            PASS=$((PASS + 1))
+        else
+            echo "  FAIL  ${CHECK_NAMES[$i]} (expected ${CHECK_EXPECTED[$i]}, got $status)"
+            FAIL=$((FAIL + 1))
+        fi
+    done
+}
+
+# ──── SSE endpoint (uses timeout — SSE connections stay open) ────
+# Started in the background so its fixed 2s timeout overlaps the other
+# checks instead of being added after them.
+SSE_OUT=$(mktemp)
+curl -s -o /dev/null -w "%{http_code}" --max-time 2 "http://localhost:$PORT/admin/v1/events" >"$SSE_OUT" 2>/dev/null &
+SSE_PID=$!
+
 # ──── Health ────
 # 503 is expected: no provider API keys configured in test.
 check "GET /healthz (no providers → 503)" GET  /healthz      503
@@ -78,8 +123,12 @@ check "POST /v1/chat without key → 401"  POST /v1/chat      401
 # ──── Admin API without token ────
 check "GET /admin/v1/models no token"     GET  /admin/v1/models  200
 
-# ──── SSE endpoint (uses timeout — SSE connections stay open) ────
-SSE_STATUS=$(curl -s -o /dev/null -w "%{http_code}" --max-time 2 "http://localhost:$PORT/admin/v1/events" 2>/dev/null; true)
+run_checks
+
+# curl exits non-zero when --max-time cuts the stream; only the status matters.
+wait "$SSE_PID" || true
+SSE_STATUS=$(cat "$SSE_OUT")
+rm -f "$SSE_OUT"
 if [ "$SSE_STATUS" = "200" ]; then
     echo "  PASS  GET /admin/v1/events reachable (HTTP $SSE_STATUS)"
     PASS=$((PASS + 1))
@@ -88,6 +137,13 @@ else
     FAIL=$((FAIL + 1))
 fi
 
+# ──── Metrics sample ────
+# Streamed (-N) and cut off after ten samples: head closing the pipe stops
+# curl, so the script never holds the whole exposition however many series
+# the server exports. curl/grep exit non-zero on the broken pipe.
+echo "  Sample metrics:"
+curl -sN "http://localhost:$PORT/metrics" 2>/dev/null | grep -v '^#' | head -n 10 | sed 's/^/     /' || true
+
 echo ""
 echo "=== Results: $PASS passed, $FAIL failed ==="
 